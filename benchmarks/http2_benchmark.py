@@ -0,0 +1,217 @@
+# benchmarks/http2_benchmark.py
+"""
+Compare the default HTTP/1.1 transport with the HTTP/2 transport.
+
+Starts two local stand-in graph servers in child processes with the same simulated
+service latency, an HTTP/1.1 one (aiohttp) and an HTTP/2 one (h2, prior knowledge
+over plain text),
+then fires a mix of get_digital_twin, update_digital_twin and publish_telemetry
+calls at each with N concurrent requests. Reports the number of sockets the
+server accepted, wall-clock time and client-side latency percentiles.
+
+Requires the http2 extra: pip install konnektr-graph[http2]
+
+Usage:
+    python benchmarks/http2_benchmark.py --requests 2000 --concurrency 500
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+from aiohttp import web
+
+from konnektr_graph.aio import KonnektrGraphClient
+from konnektr_graph.auth import StaticTokenCredential
+from konnektr_graph.transport import AsyncHttpxTransport
+
+TWIN = {"$dtId": "twin", "$metadata": {"$model": "dtmi:example:Room;1"}, "temp": 21}
+
+
+def _route(method: str, path: str) -> Tuple[int, bytes]:
+    if method == "GET" and path.startswith("/digitaltwins/"):
+        twin = dict(TWIN, **{"$dtId": path.rsplit("/", 1)[-1]})
+        return 200, json.dumps(twin).encode()
+    return 204, b""
+
+
+class H2Server(asyncio.Protocol):
+    """Minimal HTTP/2 stand-in server that answers after a fixed latency."""
+
+    def __init__(self, latency: float, connections: Any):
+        self.latency = latency
+        self.connections = connections
+        self.streams: Dict[int, Tuple[str, str]] = {}
+
+    def connection_made(self, transport):
+        with self.connections.get_lock():
+            self.connections.value += 1
+        self.transport = transport
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        self.conn.initiate_connection()
+        self.conn.update_settings(
+            {h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 10000}
+        )
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                headers = dict(event.headers)
+                self.streams[event.stream_id] = (
+                    headers[b":method"].decode(),
+                    headers[b":path"].decode(),
+                )
+            elif isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                method, path = self.streams.pop(event.stream_id)
+                asyncio.get_running_loop().call_later(
+                    self.latency, self._respond, event.stream_id, method, path
+                )
+        self.transport.write(self.conn.data_to_send())
+
+    def _respond(self, stream_id: int, method: str, path: str):
+        status, body = _route(method, path)
+        headers = [(":status", str(status)), ("content-length", str(len(body)))]
+        if body:
+            headers.append(("content-type", "application/json"))
+        self.conn.send_headers(stream_id, headers, end_stream=not body)
+        if body:
+            self.conn.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def _h1_app(latency: float, connections: Any) -> web.Application:
+    peers: Set[Any] = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        peer = request.transport.get_extra_info("peername")  # type: ignore
+        if peer not in peers:
+            peers.add(peer)
+            with connections.get_lock():
+                connections.value += 1
+        await asyncio.sleep(latency)
+        await request.read()
+        status, body = _route(request.method, request.path)
+        return web.Response(
+            status=status, body=body or None, content_type="application/json"
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+def _serve(protocol: str, latency: float, connections: Any, ports: Any):
+    """Run a stand-in server in a child process so it does not share the client's CPU."""
+
+    async def serve():
+        if protocol == "h2":
+            server = await asyncio.get_running_loop().create_server(
+                lambda: H2Server(latency, connections), "127.0.0.1", 0
+            )
+        else:
+            runner = web.AppRunner(_h1_app(latency, connections))
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            server = site._server  # type: ignore
+        ports.put(server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+class StandInServer:
+    """A stand-in graph server running in a child process."""
+
+    def __init__(self, protocol: str, latency: float):
+        self.connections = multiprocessing.Value("i", 0)
+        ports: Any = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_serve,
+            args=(protocol, latency, self.connections, ports),
+            daemon=True,
+        )
+        self.process.start()
+        self.url = f"http://127.0.0.1:{ports.get(timeout=10)}"
+
+    def stop(self):
+        self.process.terminate()
+        self.process.join()
+
+
+async def run_load(
+    client: KonnektrGraphClient, total: int, concurrency: int
+) -> Tuple[float, List[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            kind = i % 3
+            if kind == 0:
+                await client.get_digital_twin(f"twin-{i}")
+            elif kind == 1:
+                await client.update_digital_twin(
+                    f"twin-{i}", [{"op": "replace", "path": "/temp", "value": i}]
+                )
+            else:
+                await client.publish_telemetry(f"twin-{i}", {"temp": i})
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - started, latencies
+
+
+def report(label: str, sockets: int, elapsed: float, latencies: List[float]):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{label:<10} sockets={sockets:<5} wall={elapsed:7.3f}s "
+        f"rps={len(latencies) / elapsed:9.1f} p50={p50:7.2f}ms p99={p99:7.2f}ms"
+    )
+
+
+async def main(total: int, concurrency: int, latency: float):
+    credential = StaticTokenCredential("benchmark")
+
+    server = StandInServer("h1", latency)
+    async with KonnektrGraphClient(server.url, credential, limit=concurrency) as client:
+        elapsed, latencies = await run_load(client, total, concurrency)
+    server.stop()
+    report("HTTP/1.1", server.connections.value, elapsed, latencies)
+
+    server = StandInServer("h2", latency)
+    transport = AsyncHttpxTransport(http1=False, max_connections=4)
+    async with KonnektrGraphClient(server.url, credential, transport=transport) as client:
+        elapsed, latencies = await run_load(client, total, concurrency)
+    await transport.close()
+    server.stop()
+    report("HTTP/2", server.connections.value, elapsed, latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="simulated service latency (s)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency))
@@ -0,0 +1,137 @@
+# benchmarks/json_codec_benchmark.py
+"""
+Compare the CPU cost of the available JSON codecs on large query pages.
+
+Runs query_twins over canned pages of large twins served by an in-memory
+transport, so only client-side work (decoding the page and handing out the
+items) is measured, and upserts the same twins to measure body encoding.
+Reports CPU time per page (decoding alone and through the client) and per
+upserted twin for every installed codec. On large pages a good part of the
+client time is the garbage collector reacting to the many new objects, which
+no codec avoids, so the end-to-end gain is smaller than the raw decode gain.
+
+Install the fast codecs with: pip install orjson msgspec
+
+Usage:
+    python benchmarks/json_codec_benchmark.py --pages 20 --page-size 1000
+"""
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from konnektr_graph import KonnektrGraphClient
+from konnektr_graph.auth import StaticTokenCredential
+from konnektr_graph.transport import (
+    HttpHeaders,
+    HttpRequest,
+    HttpResponse,
+    JsonCodec,
+    get_json_codec,
+)
+from konnektr_graph.types import BasicDigitalTwin
+
+
+def make_twin(i: int, properties: int) -> Dict[str, Any]:
+    twin: Dict[str, Any] = {
+        "$dtId": f"room-{i}",
+        "$etag": f'W/"{i:08x}-0000-0000-0000-000000000000"',
+        "$metadata": {
+            "$model": "dtmi:example:Room;1",
+            "$lastUpdateTime": "2024-05-01T12:00:00.0000000Z",
+        },
+    }
+    for p in range(properties):
+        twin[f"property{p}"] = {
+            "value": i * 0.5 + p,
+            "unit": "degreeCelsius",
+            "tags": ["sensor", "building-a", f"floor-{i % 12}"],
+        }
+        twin["$metadata"][f"property{p}"] = {
+            "lastUpdateTime": "2024-05-01T12:00:00.0000000Z"
+        }
+    return twin
+
+
+class PageTransport:
+    """In-memory transport that serves the same encoded page ``pages`` times."""
+
+    def __init__(self, page: bytes, pages: int):
+        self.page = page
+        self.pages = pages
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        if request.method != "POST" or not request.url.endswith("/query"):
+            return HttpResponse(request, 200, HttpHeaders(), b"{}")
+        served = int(request.headers.get("x-ms-continuation") or 0) + 1
+        headers = HttpHeaders({"Content-Type": "application/json"})
+        if served < self.pages:
+            headers["x-ms-continuation"] = str(served)
+        return HttpResponse(request, 200, headers, self.page)
+
+    def close(self) -> None:
+        pass
+
+
+def measure(codec: JsonCodec, page: bytes, twins: List[Dict[str, Any]], pages: int):
+    transport = PageTransport(page, pages)
+    client = KonnektrGraphClient(
+        "https://bench.local",
+        StaticTokenCredential("benchmark"),
+        transport=transport,
+        json_codec=codec,
+    )
+
+    started = time.process_time()
+    for _ in range(pages):
+        codec.loads(page)
+    decode_cpu = time.process_time() - started
+
+    started = time.process_time()
+    count = sum(1 for _ in client.query_twins("SELECT * FROM digitaltwins"))
+    query_cpu = time.process_time() - started
+    assert count == pages * len(twins)
+
+    models = [BasicDigitalTwin.from_dict(t) for t in twins]
+    started = time.process_time()
+    for twin in models:
+        client.upsert_digital_twin(twin.dtId, twin)
+    upsert_cpu = time.process_time() - started
+    return decode_cpu, query_cpu, upsert_cpu
+
+
+def main(pages: int, page_size: int, properties: int):
+    twins = [make_twin(i, properties) for i in range(page_size)]
+    page = json.dumps({"value": twins}).encode("utf-8")
+    print(
+        f"{pages} pages x {page_size} twins, {len(page) / 1e6:.1f} MB per page, "
+        f"{page_size} upserts"
+    )
+
+    baseline = None
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        decode_cpu, query_cpu, upsert_cpu = measure(codec, page, twins, pages)
+        if baseline is None:
+            baseline = query_cpu
+        print(
+            f"{name:<8} decode={decode_cpu / pages * 1000:7.2f}ms/page "
+            f"query={query_cpu / pages * 1000:7.2f}ms/page "
+            f"upsert={upsert_cpu / page_size * 1e6:7.1f}us/twin "
+            f"speedup={baseline / query_cpu:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument(
+        "--properties", type=int, default=10, help="properties per twin"
+    )
+    args = parser.parse_args()
+    main(args.pages, args.page_size, args.properties)
@@ -2,7 +2,24 @@
 """
 Konnektr Graph SDK (Azure-free).
 """
-from .client import KonnektrGraphClient, PagedIterator
+from .client import KonnektrGraphClient, PagedIterator, ParallelQueryIterator
+from .bulk import (
+    AsyncBulkResults,
+    BulkItemResult,
+    BulkResults,
+    BulkStats,
+    BulkWriteResult,
+    RelationshipPatch,
+    SubtreeDeleteResult,
+    TwinPatch,
+)
+from .imports import (
+    BlobStore,
+    ImportFileSummary,
+    ImportFileWriter,
+    LocalBlobStore,
+    write_import_file,
+)
 from .exceptions import (
     KonnektrGraphError,
     HttpResponseError,
@@ -10,11 +27,17 @@ from .exceptions import (
     ResourceExistsError,
     AuthenticationError,
     ValidationError,
+    ServiceRequestError,
+    CircuitOpenError,
 )
 from .models import (
     ImportJob,
     DeleteJob,
     DigitalTwinsModelData,
+    DigitalTwinsLookup,
+    Continuation,
+    Page,
+    TERMINAL_JOB_STATUSES,
 )
 from .types import (
     # Structured Models (Dataclasses)
@@ -59,6 +82,22 @@ __all__ = [
     # Client
     "KonnektrGraphClient",
     "PagedIterator",
+    "ParallelQueryIterator",
+    # Bulk operations
+    "BulkItemResult",
+    "BulkResults",
+    "AsyncBulkResults",
+    "BulkStats",
+    "TwinPatch",
+    "RelationshipPatch",
+    "SubtreeDeleteResult",
+    "BulkWriteResult",
+    # Import jobs
+    "BlobStore",
+    "LocalBlobStore",
+    "ImportFileWriter",
+    "ImportFileSummary",
+    "write_import_file",
     # Exceptions
     "KonnektrGraphError",
     "HttpResponseError",
@@ -66,10 +105,16 @@ __all__ = [
     "ResourceExistsError",
     "AuthenticationError",
     "ValidationError",
+    "ServiceRequestError",
+    "CircuitOpenError",
     # Models
     "ImportJob",
     "DeleteJob",
     "DigitalTwinsModelData",
+    "DigitalTwinsLookup",
+    "Continuation",
+    "Page",
+    "TERMINAL_JOB_STATUSES",
     # Structured Models (Dataclasses)
     "BasicDigitalTwin",
     "BasicRelationship",
@@ -2,6 +2,10 @@
 """
 Async Konnektr Graph SDK.
 """
-from .client import KonnektrGraphClient, AsyncPagedIterator
+from .client import (
+    KonnektrGraphClient,
+    AsyncPagedIterator,
+    AsyncParallelQueryIterator,
+)
 
-__all__ = ["KonnektrGraphClient", "AsyncPagedIterator"]
+__all__ = ["KonnektrGraphClient", "AsyncPagedIterator", "AsyncParallelQueryIterator"]
@@ -2,15 +2,29 @@
 """
 Konnektr Graph SDK (Azure-free) - Asynchronous Client
 """
-import json
+import asyncio
+import inspect
+import time
+import uuid
+import warnings
+import weakref
+from dataclasses import replace
 from typing import (
     Any,
+    AsyncGenerator,
+    AsyncIterable,
     AsyncIterator,
+    Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -19,16 +33,29 @@ from typing import (
 import aiohttp
 
 from ..auth.protocol import AsyncTokenProvider, TokenProvider
-from ..exceptions import (
-    HttpResponseError,
-    ResourceNotFoundError,
-    ResourceExistsError,
-    AuthenticationError,
+from ..bulk import (
+    AsyncBulkResults,
+    BulkItemResult,
+    BulkStats,
+    BulkWriteResult,
+    RelationshipPatch,
+    SubtreeDeleteResult,
+    TwinPatch,
+    incoming_relationship,
+    iter_async,
+    leaf_first_waves,
+    matched_twin,
 )
+from ..exceptions import ResourceExistsError, ResourceNotFoundError, ServiceRequestError
+from ..imports import BlobStore, import_file_chunks
 from ..models import (
+    Continuation,
     DeleteJob,
+    DigitalTwinsLookup,
     DigitalTwinsModelData,
     ImportJob,
+    Page,
+    TERMINAL_JOB_STATUSES,
 )
 from ..types import (
     BasicDigitalTwin,
@@ -46,10 +73,202 @@ from ..types import (
     RelationshipName,
     TelemetryPayload,
 )
+from ..transport import (
+    AiohttpTransport,
+    AsyncHttpxTransport,
+    AsyncTransport,
+    HttpRequest,
+    HttpResponse,
+    JsonCodec,
+    PageStreamParser,
+    build_request,
+    get_json_codec,
+    raise_for_response,
+)
+from ..policies import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreakerPolicy,
+    CompressionPolicy,
+    HedgingPolicy,
+    RateLimiter,
+    RetryPolicy,
+)
+from ..scan import (
+    ParallelScanStats,
+    id_lookup_queries,
+    model_partitions,
+    partition_query,
+    query_alias,
+)
 
 T = TypeVar("T")
 
 
+class _PageRequest:
+    """Sends the requests of a paged operation, following its continuation."""
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        items_key: str,
+    ):
+        self.client = client
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.json_data = json_data
+        self.params = params
+        self.items_key = items_key
+
+    def _arguments(
+        self,
+        next_link: Optional[str],
+        continuation_token: Optional[str],
+        initial: bool,
+    ) -> Tuple[str, Dict[str, str], Optional[Dict[str, Any]]]:
+        headers = self.headers.copy()
+        params = self.params if initial else None
+
+        request_url = self.url
+        if not initial:
+            if next_link:
+                request_url = next_link
+                if not request_url.startswith("http"):
+                    request_url = f"{self.client.endpoint}/{request_url.lstrip('/')}"
+            elif continuation_token:
+                headers["x-ms-continuation"] = continuation_token
+        return request_url, headers, params
+
+    async def send_stream(
+        self,
+        next_link: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        *,
+        initial: bool,
+    ) -> HttpResponse:
+        """Send a page request whose response body is streamed."""
+        url, headers, params = self._arguments(next_link, continuation_token, initial)
+        return await self.client._send(
+            self.method,
+            url,
+            headers=headers,
+            json=self.json_data,
+            params=params,
+            idempotent=True,
+            stream=True,
+        )
+
+    async def fetch(
+        self,
+        next_link: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        *,
+        initial: bool,
+    ) -> Page[Any]:
+        """Fetch a whole page with its raw items."""
+        url, headers, params = self._arguments(next_link, continuation_token, initial)
+        data, resp_headers = await self.client._request_raw(
+            self.method,
+            url,
+            headers=headers,
+            json=self.json_data,
+            params=params,
+            idempotent=True,
+        )
+        return _make_page(data, resp_headers, self.items_key)
+
+
+def _page_links(
+    data: Mapping[str, Any], header_token: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    # The continuation token may be in the headers or, for some APIs, the body
+    token = header_token or data.get("continuationToken")
+    return data.get("nextLink"), token if token else None
+
+
+def _make_page(
+    data: Mapping[str, Any], headers: Mapping[str, str], items_key: str
+) -> Page[Any]:
+    next_link, continuation_token = _page_links(
+        data, headers.get("x-ms-continuation")
+    )
+    return Page(
+        items=data.get(items_key, []),
+        continuation_token=continuation_token,
+        next_link=next_link,
+        headers=headers,
+        metadata={k: v for k, v in data.items() if k != items_key},
+    )
+
+
+class _PagePrefetcher:
+    """
+    Fetches whole pages ahead of the consumer in a background task.
+
+    Starts at the first page, or at ``start`` when resuming. At most ``depth``
+    pages are fetched but not yet taken by ``get``, counting the one being
+    fetched. Holds no reference to the iterator it serves.
+    """
+
+    def __init__(
+        self,
+        request: _PageRequest,
+        depth: int,
+        start: Optional[Continuation] = None,
+    ):
+        self._slots = asyncio.Semaphore(depth)
+        self._pages: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.ensure_future(self._run(request, start))
+
+    async def _run(
+        self, request: _PageRequest, start: Optional[Continuation]
+    ) -> None:
+        next_link = start.next_link if start else None
+        token = start.continuation_token if start else None
+        initial = start is None
+        try:
+            while initial or next_link or token:
+                await self._slots.acquire()
+                page = await request.fetch(next_link, token, initial=initial)
+                initial = False
+                next_link, token = page.next_link, page.continuation_token
+                self._pages.put_nowait(page)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            self._pages.put_nowait(e)
+            return
+        self._pages.put_nowait(None)
+
+    async def get(self) -> Optional[Page[Any]]:
+        """Take the next page, with raw items, or None after the last page."""
+        page = await self._pages.get()
+        if isinstance(page, BaseException):
+            raise page
+        if page is not None:
+            self._slots.release()
+        return page
+
+    async def stop(self) -> None:
+        """Cancel the background task, including a request in flight."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def cancel(self) -> None:
+        """Cancel the background task from any thread, e.g. a finalizer."""
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+
 class AsyncPagedIterator(AsyncIterator[T], Generic[T]):
     """
     Async iterator for handling paged responses.
@@ -66,6 +285,10 @@ class AsyncPagedIterator(AsyncIterator[T], Generic[T]):
         params: Optional[Dict[str, Any]] = None,
         model_cls: Optional[Type[T]] = None,
         items_key: str = "value",
+        stream: bool = False,
+        prefetch: int = 0,
+        continuation: Optional[Continuation] = None,
+        on_checkpoint: Optional[Callable[[Continuation], Any]] = None,
     ):
         """
         Initialize the async paged iterator.
@@ -79,122 +302,690 @@ class AsyncPagedIterator(AsyncIterator[T], Generic[T]):
             params: Optional query parameters for the request.
             model_cls: Optional class to instantiate for each item in the results.
             items_key: The key in the JSON response that contains the items list. Defaults to "value".
+            stream: Whether to parse each page incrementally as it is received,
+                yielding items before the whole page has arrived and without
+                holding the decoded page in memory. Ignored when prefetching.
+                Defaults to False.
+            prefetch: Number of pages to fetch ahead in a background task while
+                the current page is being consumed. 0 fetches each page only
+                when it is needed. Defaults to 0.
+            continuation: Optional checkpoint from ``continuation`` of an
+                earlier iterator over the same operation. The scan resumes at
+                that page boundary instead of the first page.
+            on_checkpoint: Optional callback, which may be a coroutine function,
+                called with the new ``continuation`` each time a page has been
+                fully consumed.
         """
         self._client = client
-        self._url = initial_url
-        self._method = method
-        self._headers = headers or {}
-        self._json_data = json_data
-        self._params = params
-        self._model_cls = model_cls
-        self._items_key = items_key
-        self._current_page_items = []
-        self._current_page_index = 0
-        self._continuation_token = None
-        self._next_link = None
+        self._request = _PageRequest(
+            client, initial_url, method, headers or {}, json_data, params, items_key
+        )
+        self._stream = stream
+        self._prefetch = prefetch
+        self._prefetcher: Optional[_PagePrefetcher] = None
+        self._convert = _item_converter(model_cls)
+        self._page_items: Iterator[T] = iter(())
+        self._page_stream: Optional[AsyncGenerator[T, None]] = None
+        self._page_parser: Optional[PageStreamParser] = None
+        self._continuation_token: Optional[str] = None
+        self._next_link: Optional[str] = None
         self._first_page_fetched = False
+        self._done = False
+        self._start = continuation
+        self._checkpoint = continuation
+        self._on_checkpoint = on_checkpoint
+        self._page_open = False
+        if continuation is not None:
+            self._next_link = continuation.next_link
+            self._continuation_token = continuation.continuation_token
+            self._first_page_fetched = True
+            self._done = continuation.done
 
     def __aiter__(self) -> "AsyncPagedIterator[T]":
         return self
 
     async def __anext__(self) -> T:
-        if not self._first_page_fetched:
-            await self._fetch_page(is_initial=True)
-            self._first_page_fetched = True
-
-        if self._current_page_index < len(self._current_page_items):
-            item = self._current_page_items[self._current_page_index]
-            self._current_page_index += 1
-            return item
-        else:
-            if not self._next_link and not self._continuation_token:
+        while True:
+            for item in self._page_items:
+                return item
+            if self._page_stream is not None:
+                try:
+                    return await self._page_stream.__anext__()
+                except StopAsyncIteration:
+                    self._page_stream = None
+            if self._page_parser is not None:
+                # A streamed page has links in its body once fully read
+                self._next_link, self._continuation_token = _page_links(
+                    self._page_parser.metadata, self._continuation_token
+                )
+                self._page_parser = None
+            if self._page_open:
+                self._page_open = False
+                await self._reached_checkpoint(
+                    Continuation(self._continuation_token, self._next_link)
+                )
+            if self._done:
                 raise StopAsyncIteration
-            await self._fetch_page()
-            if not self._current_page_items:
+            if self._prefetch > 0:
+                # The prefetcher follows the continuation itself
+                await self._next_prefetched_page()
+                continue
+            if self._first_page_fetched and not (
+                self._next_link or self._continuation_token
+            ):
                 raise StopAsyncIteration
-            self._current_page_index = 1
-            return self._current_page_items[0]
+            await self._fetch_page(is_initial=not self._first_page_fetched)
+            self._first_page_fetched = True
 
-    async def _fetch_page(self, is_initial: bool = False):
-        headers = self._headers.copy()
-        params = self._params if is_initial else None
+    @property
+    def continuation(self) -> Optional[Continuation]:
+        """
+        Checkpoint to resume the scan from: the start of the first page that
+        has not been fully consumed. Serialize it with ``to_dict`` and pass it
+        back as ``continuation`` to resume after a restart. None until the
+        first page has been consumed, unless the iterator was resumed.
+        """
+        return self._checkpoint
 
-        request_url = self._url
-        if not is_initial:
-            if self._next_link:
-                request_url = self._next_link
-                if not request_url.startswith("http"):
-                    request_url = f"{self._client.endpoint}/{request_url.lstrip('/')}"
-            elif self._continuation_token:
-                headers["x-ms-continuation"] = self._continuation_token
-
-        # Use a low-level _request_raw to get the full response object for headers
-        # Wait, I need headers. Let's modify _request to return (data, headers) or similar?
-        # Or just handle it in _request.
-        data, resp_headers = await self._client._request_raw(
-            self._method,
-            request_url,
-            headers=headers,
-            json=self._json_data,
-            params=params,
+    async def aclose(self) -> None:
+        """
+        Stop iterating, cancel any prefetching and release the connection of a
+        partially read streamed page.
+        """
+        if self._page_stream is not None:
+            await self._page_stream.aclose()
+            self._page_stream = None
+        if self._prefetcher is not None:
+            await self._prefetcher.stop()
+            self._prefetcher = None
+        self._page_items = iter(())
+        self._page_parser = None
+        self._done = True
+
+    async def by_page(self) -> AsyncGenerator[Page[T], None]:
+        """
+        Iterate over the result page by page, starting from the first page, or
+        from ``continuation`` when resuming.
+
+        Each page carries its items together with the continuation token,
+        nextLink, response headers and the other keys of the page body, so a
+        scan can be checkpointed or pages handed to a batch consumer. The
+        checkpoint moves past a page once the consumer asks for the next one.
+        Pages are always read whole; ``prefetch`` applies, ``stream`` does not.
+
+        Yields:
+            Page: The next page of results.
+        """
+        prefetcher = (
+            _PagePrefetcher(self._request, self._prefetch, self._start)
+            if self._prefetch > 0
+            else None
         )
+        try:
+            position = self._start
+            while position is None or not position.done:
+                if prefetcher is not None:
+                    page = await prefetcher.get()
+                    if page is None:
+                        return
+                else:
+                    page = await self._request.fetch(
+                        position.next_link if position else None,
+                        position.continuation_token if position else None,
+                        initial=position is None,
+                    )
+                yield replace(page, items=[self._convert(item) for item in page.items])
+                position = page.continuation
+                await self._reached_checkpoint(position)
+        finally:
+            if prefetcher is not None:
+                await prefetcher.stop()
+
+    async def _reached_checkpoint(self, continuation: Continuation) -> None:
+        self._checkpoint = continuation
+        if self._on_checkpoint is not None:
+            result = self._on_checkpoint(continuation)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _next_prefetched_page(self) -> None:
+        if self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(
+                self._request, self._prefetch, self._start
+            )
+            # Cancel the task if the iterator is dropped before it is exhausted
+            weakref.finalize(self, self._prefetcher.cancel)
+        try:
+            page = await self._prefetcher.get()
+        except BaseException:
+            await self.aclose()
+            raise
+        if page is None:
+            self._prefetcher = None
+            self._done = True
+            return
+        self._next_link = page.next_link
+        self._continuation_token = page.continuation_token
+        self._page_items = map(self._convert, page.items)
+        self._page_open = True
 
+    async def _fetch_page(self, is_initial: bool = False):
+        if not self._stream:
+            page = await self._request.fetch(
+                self._next_link, self._continuation_token, initial=is_initial
+            )
+            self._next_link = page.next_link
+            self._continuation_token = page.continuation_token
+            self._page_items = map(self._convert, page.items)
+            self._page_open = True
+            return
+
+        response = await self._request.send_stream(
+            self._next_link, self._continuation_token, initial=is_initial
+        )
         # Check for continuation token in headers
-        token = resp_headers.get("x-ms-continuation")
+        token = response.headers.get("x-ms-continuation")
         self._continuation_token = token if token else None
+        self._next_link = None
+        self._page_parser = PageStreamParser(
+            self._request.items_key, self._client.json_codec
+        )
+        self._page_stream = _stream_page(response, self._page_parser, self._convert)
+        self._page_open = True
 
-        # Check for nextLink in body
-        self._next_link = data.get("nextLink")
 
-        # If continuationToken is in body
-        if not self._continuation_token:
-            token = data.get("continuationToken")
-            self._continuation_token = token if token else None
+def _item_converter(model_cls: Optional[Type[T]]) -> Callable[[Any], T]:
+    if model_cls and hasattr(model_cls, "from_dict"):
+        return model_cls.from_dict  # type: ignore
+    return lambda raw_item: raw_item
 
-        raw_items = data.get(self._items_key, [])
-        if self._model_cls and hasattr(self._model_cls, "from_dict"):
-            self._current_page_items = [self._model_cls.from_dict(i) for i in raw_items]  # type: ignore
+
+async def _stream_page(
+    response: HttpResponse, parser: PageStreamParser, convert: Callable[[Any], T]
+) -> AsyncGenerator[T, None]:
+    # Kept free of references to the iterator, so that dropping an unfinished
+    # iterator finalizes this generator and releases the connection
+    try:
+        if response.stream is None:
+            for raw_item in parser.feed(response.content):
+                yield convert(raw_item)
         else:
-            self._current_page_items = raw_items  # type: ignore
+            async for chunk in response.stream:  # type: ignore[union-attr]
+                for raw_item in parser.feed(chunk):
+                    yield convert(raw_item)
+            response.stream = None
+        tail = parser.close()
+    finally:
+        # Releases the connection if the page was abandoned
+        await response.aclose()
+    for raw_item in tail:
+        yield convert(raw_item)
+
+
+class _PartitionScanner:
+    """
+    Scans the partitions of a query in background tasks and merges their pages.
+
+    Each task takes the next unscanned partition and follows its continuation
+    chain. At most ``buffer`` pages are fetched but not yet taken by ``get``,
+    across all partitions. Holds no reference to the iterator it serves.
+    """
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        queries: List[str],
+        concurrency: int,
+        buffer: int,
+        stats: ParallelScanStats,
+        kwargs: Dict[str, Any],
+    ):
+        self._client = client
+        self._queries = queries
+        self._stats = stats
+        self._kwargs = kwargs
+        self._next = 0
+        self._slots = asyncio.Semaphore(buffer)
+        self._pages: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._tasks = [
+            asyncio.ensure_future(self._run())
+            for _ in range(min(concurrency, len(queries)))
+        ]
+        self._finished = 0
+
+    def _take(self) -> Optional[int]:
+        if self._next >= len(self._queries):
+            return None
+        self._next += 1
+        return self._next - 1
+
+    async def _run(self) -> None:
+        try:
+            index = self._take()
+            while index is not None:
+                self._stats._start(index)
+                try:
+                    await self._scan(index)
+                except BaseException:
+                    self._stats._finish(index, failed=True)
+                    raise
+                self._stats._finish(index)
+                index = self._take()
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            self._pages.put_nowait(e)
+            return
+        self._pages.put_nowait(None)
+
+    async def _scan(self, index: int) -> None:
+        pages = self._client.query_twins(
+            self._queries[index], **self._kwargs
+        ).by_page()
+        try:
+            while True:
+                await self._slots.acquire()
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    self._slots.release()
+                    return
+                self._stats._page(index, len(page.items))
+                self._pages.put_nowait(page.items)
+        finally:
+            await pages.aclose()
+
+    async def get(self) -> Optional[List[Any]]:
+        """Take the items of the next page, or None after the last page."""
+        while True:
+            entry = await self._pages.get()
+            if isinstance(entry, BaseException):
+                raise entry
+            if entry is not None:
+                self._slots.release()
+                return entry
+            self._finished += 1
+            if self._finished == len(self._tasks):
+                return None
+
+    async def stop(self) -> None:
+        """Cancel the background tasks, including requests in flight."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self) -> None:
+        """Cancel the background tasks from any thread, e.g. a finalizer."""
+        if not self._loop.is_closed():
+            for task in self._tasks:
+                self._loop.call_soon_threadsafe(task.cancel)
+
+
+class AsyncParallelQueryIterator(AsyncIterator[Dict[str, Any]]):
+    """
+    Async iterator over the merged results of a query scanned in disjoint
+    partitions.
+
+    Results arrive in no particular order. Per-partition progress and
+    throughput are available from ``stats``.
+    """
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        query_expression: QueryExpression,
+        partitions: Optional[Sequence[str]] = None,
+        max_concurrency: int = 4,
+        buffer_pages: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the async parallel query iterator.
+
+        Args:
+            client: The KonnektrGraphClient instance.
+            query_expression: The query expression.
+            partitions: Partition predicates, see ``konnektr_graph.scan``. None
+                partitions by exact model, using the models from ``list_models``,
+                plus one partition for the twins of unlisted models.
+            max_concurrency: Maximum number of partitions scanned at once.
+                Defaults to 4.
+            buffer_pages: Maximum number of pages fetched ahead of the
+                consumer. Defaults to twice ``max_concurrency``.
+            **kwargs: Options passed to ``query_twins`` for each partition.
+
+        Raises:
+            ValueError: If the query cannot be partitioned.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._client = client
+        self._query = query_expression
+        self._queries: Optional[List[str]] = None
+        self._max_concurrency = max_concurrency
+        self._buffer_pages = buffer_pages or 2 * max_concurrency
+        self._kwargs = kwargs
+        self._scanner: Optional[_PartitionScanner] = None
+        self._page_items: Iterator[Dict[str, Any]] = iter(())
+        self._done = False
+        self.stats = ParallelScanStats()
+        if partitions is not None:
+            self._set_partitions(partitions)
+
+    def _set_partitions(self, partitions: Sequence[str]) -> None:
+        self._queries = [partition_query(self._query, p) for p in partitions]
+        self.stats._set_partitions(partitions)
+
+    def __aiter__(self) -> "AsyncParallelQueryIterator":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        while True:
+            for item in self._page_items:
+                return item
+            if self._done:
+                raise StopAsyncIteration
+            try:
+                if self._scanner is None:
+                    await self._start()
+                items = (
+                    await self._scanner.get() if self._scanner is not None else None
+                )
+            except BaseException:
+                await self.aclose()
+                raise
+            if items is None:
+                self._scanner = None
+                self._done = True
+                raise StopAsyncIteration
+            self._page_items = iter(items)
+
+    async def _start(self) -> None:
+        if self._queries is None:
+            model_ids = [model.id async for model in self._client.list_models()]
+            self._set_partitions(model_partitions(model_ids, query_alias(self._query)))
+        if not self._queries:
+            return
+        self._scanner = _PartitionScanner(
+            self._client,
+            self._queries,
+            self._max_concurrency,
+            self._buffer_pages,
+            self.stats,
+            self._kwargs,
+        )
+        # Cancel the tasks if the iterator is dropped before it is exhausted
+        weakref.finalize(self, self._scanner.cancel)
+
+    async def aclose(self) -> None:
+        """Stop iterating and cancel the scans of the remaining partitions."""
+        if self._scanner is not None:
+            await self._scanner.stop()
+            self._scanner = None
+        self._page_items = iter(())
+        self._done = True
+
+
+IngestItem = Union[BasicDigitalTwin, BasicRelationship, TwinPatch, RelationshipPatch]
 
-        self._current_page_index = 0
+
+def _ingest_key(item: Any) -> str:
+    if isinstance(item, BasicDigitalTwin):
+        return item.dtId
+    if isinstance(item, BasicRelationship):
+        return f"{item.sourceId}/{item.relationshipId}"
+    if isinstance(item, TwinPatch):
+        return item.digital_twin_id
+    if isinstance(item, RelationshipPatch):
+        return f"{item.digital_twin_id}/{item.relationship_id}"
+    return repr(item)
 
 
 class KonnektrGraphClient:
     def __init__(
-        self, endpoint: str, credential: Union[AsyncTokenProvider, TokenProvider]
+        self,
+        endpoint: str,
+        credential: Union[AsyncTokenProvider, TokenProvider],
+        *,
+        transport: Optional[AsyncTransport] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        compression: Optional[CompressionPolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
         """
         Initialize the Konnektr Graph Client.
 
+        By default the client sends requests through an AiohttpTransport whose
+        session is created lazily on first use with a ``TCPConnector`` built from
+        the connector options below.
+
         Args:
             endpoint: API endpoint (e.g. https://graph.konnektr.io)
             credential: AsyncTokenProvider or TokenProvider credential for authentication.
+            transport: Optional transport to send requests through. When given, the
+                connector options below are ignored and the transport is not closed
+                by the client.
+            connector: Optional shared connector for the default transport. When
+                given, the connector options below are ignored and the connector is
+                not closed by the client.
+            limit: Maximum number of simultaneous connections. 0 means no limit. Defaults to 100.
+            limit_per_host: Maximum number of simultaneous connections to the same
+                host. 0 means no limit. Defaults to 0.
+            keepalive_timeout: Seconds an idle connection is kept open for reuse. Defaults to 15.
+            ttl_dns_cache: Seconds resolved DNS entries are cached. None caches
+                forever. Defaults to 10.
+            http2: Whether to use an AsyncHttpxTransport that multiplexes requests
+                over HTTP/2 instead of the default transport. Requires the ``http2``
+                extra. ``limit`` and ``keepalive_timeout`` apply to its connection pool.
+                Defaults to False.
+            retry_policy: Policy for retrying throttled and failed requests. Defaults
+                to a RetryPolicy that retries idempotent requests up to 3 times.
+            rate_limiter: Optional RateLimiter consulted before every attempt. Share
+                one instance between clients to enforce an aggregate rate.
+            concurrency_limiter: Optional AdaptiveConcurrencyLimiter that bounds the
+                number of requests in flight and adapts the bound to throttling
+                and latency.
+            hedging_policy: Optional HedgingPolicy. When set, a GET read that is
+                slower than the policy's latency percentile is sent a second time
+                and the first response wins.
+            circuit_breaker: Optional CircuitBreakerPolicy. When the circuit for an
+                endpoint and operation class is open, calls fail fast with
+                CircuitOpenError instead of being sent.
+            compression: Policy for compressed responses and request bodies.
+                Defaults to a CompressionPolicy that accepts gzip and deflate
+                (and brotli when installed) but does not compress requests.
+            json_codec: Codec for request and response bodies. Defaults to the
+                fastest installed one (orjson, msgspec, then the standard library).
         """
         if not endpoint.startswith("http"):
             endpoint = "https://" + endpoint
         self.endpoint = endpoint.rstrip("/")
         self.credential = credential
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._owns_transport = transport is None
+        if transport is None and http2:
+            transport = AsyncHttpxTransport(
+                max_connections=limit or None,
+                keepalive_expiry=keepalive_timeout,
+            )
+        elif transport is None:
+            transport = AiohttpTransport(
+                connector=connector,
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=ttl_dns_cache,
+            )
+        self._transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedging_policy = hedging_policy
+        self.circuit_breaker = circuit_breaker
+        self.compression = compression or CompressionPolicy()
+        self.json_codec = json_codec or get_json_codec()
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
-            await self._session.close()
+        await self.close()
 
     async def close(self):
-        """Close the client session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Close the client transport."""
+        if self._owns_transport:
+            await self._transport.close()
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    async def _get_auth_headers(self) -> Dict[str, str]:
+        # Handle async or sync credential
+        auth_headers = self.credential.get_headers()
+        if hasattr(auth_headers, "__await__"):  # Check if awaitable
+            auth_headers = await auth_headers  # type: ignore
+        return auth_headers  # type: ignore
+
+    async def _send(
+        self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
+    ) -> HttpResponse:
+        request = build_request(
+            method,
+            url,
+            headers=headers,
+            auth_headers=await self._get_auth_headers(),
+            json_codec=self.json_codec,
+            **kwargs,
+        )
+        self.compression.prepare_request(request)
+        policy = self.retry_policy
+        policy.record_request()
+        attempt = 0
+        hedging = self.hedging_policy
+        hedged = hedging is not None and hedging.applies_to(request)
+        while True:
+            try:
+                if hedged:
+                    response = await self._send_hedged(request)
+                else:
+                    response = await self._send_once(request)
+            except ServiceRequestError as error:
+                delay = policy.next_delay(request, attempt, error=error)
+                if delay is None:
+                    raise
+            else:
+                self.compression.decode_response(response)
+                response.json_codec = self.json_codec
+                if response.ok:
+                    return response
+                await response.aread()
+                delay = policy.next_delay(request, attempt, response=response)
+                if delay is None:
+                    raise_for_response(response)
+            await asyncio.sleep(delay)  # type: ignore
+            attempt += 1
+
+    async def _send_once(self, request: HttpRequest) -> HttpResponse:
+        """Send a single attempt through the per-attempt policies and the transport."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(request.operation_class)
+        limiter = self.concurrency_limiter
+        circuit = None
+        if self.circuit_breaker is not None:
+            circuit = self.circuit_breaker.get_circuit(request)
+        if limiter is None and circuit is None:
+            return await self._transport.send(request)
+
+        started = await limiter.acquire() if limiter is not None else time.monotonic()
+        status_code: Optional[int] = None
+        cancelled = False
+        probe: Optional[int] = None
+        acquired = False
+        try:
+            if circuit is not None:
+                # Acquired last, right before sending, so that no wait holds a
+                # probe slot; a rejection releases the concurrency slot below
+                probe = circuit.acquire()
+                acquired = True
+            response = await self._transport.send(request)
+            status_code = response.status_code
+            return response
+        except ServiceRequestError:
+            raise
+        except BaseException:
+            cancelled = True
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release(started, status_code, cancelled=cancelled)
+            if circuit is not None and acquired:
+                circuit.record(
+                    time.monotonic() - started,
+                    status_code,
+                    cancelled=cancelled,
+                    probe=probe,
+                )
+
+    async def _send_hedged(self, request: HttpRequest) -> HttpResponse:
+        """Send a read, and a second copy of it if the first is slower than usual."""
+        policy: HedgingPolicy = self.hedging_policy  # type: ignore
+        policy.record_request()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._send_once(request))
+        delay = policy.get_delay()
+        if delay is not None:
+            await asyncio.wait({primary}, timeout=delay)
+        if delay is None or primary.done() or not policy.try_hedge():
+            response = await primary
+            policy.record_latency(time.monotonic() - started)
+            return response
+
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(self._send_once(request))
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        failed: Optional[HttpResponse] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        first_error = first_error or task.exception()
+                        continue
+                    response = task.result()
+                    if not response.ok:
+                        # A throttled or failed attempt only counts if both fail
+                        if failed is None:
+                            failed = response
+                        else:
+                            await response.aclose()
+                        continue
+                    if task is hedge:
+                        policy.stats._record("hedge_wins")
+                        policy.record_latency(time.monotonic() - hedge_started)
+                    else:
+                        policy.stats._record("primary_wins")
+                        policy.record_latency(time.monotonic() - started)
+                    if failed is not None:
+                        await failed.aclose()
+                    return response
+            if failed is not None:
+                return failed
+            raise first_error  # type: ignore
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def _request(
         self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
@@ -204,53 +995,16 @@ class KonnektrGraphClient:
 
     async def _request_raw(
         self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
-    ) -> tuple[Any, Mapping[str, str]]:
-        session = await self._get_session()
-
-        if headers is None:
-            headers = {}
+    ) -> Tuple[Any, Mapping[str, str]]:
+        response = await self._send(method, url, headers=headers, **kwargs)
 
-        # Handle async or sync credential
-        if hasattr(self.credential, "get_headers"):
-            auth_headers = self.credential.get_headers()
-            if hasattr(auth_headers, "__await__"):  # Check if awaitable
-                auth_headers = await auth_headers  # type: ignore
-            headers.update(auth_headers)  # type: ignore
-
-        # Ensure content type is set
-        if "json" in kwargs and "Content-Type" not in headers:
-            headers["Content-Type"] = "application/json"
-
-        async with session.request(method, url, headers=headers, **kwargs) as response:
-            if not response.ok:
-                await self._handle_error(response)
-
-            # For 204 No Content, return empty dict
-            if response.status == 204:
-                return {}, response.headers
-            try:
-                data = await response.json()
-                return data, response.headers
-            except Exception:
-                return {}, response.headers
-
-    async def _handle_error(self, response: aiohttp.ClientResponse):
+        # For 204 No Content, return empty dict
+        if response.status_code == 204:
+            return {}, response.headers
         try:
-            error_data = await response.json()
-            message = json.dumps(error_data)
-        except Exception:
-            text = await response.text()
-            message = text
-
-        status_code = response.status
-        if status_code == 404:
-            raise ResourceNotFoundError(message, status_code)
-        elif status_code == 409:
-            raise ResourceExistsError(message, status_code)
-        elif status_code in (401, 403):
-            raise AuthenticationError(message, status_code)
-        else:
-            raise HttpResponseError(f"Error {status_code}: {message}", status_code)
+            return response.json(), response.headers
+        except ValueError:
+            return {}, response.headers
 
     # --- Digital Twins ---
 
@@ -271,6 +1025,48 @@ class KonnektrGraphClient:
         data = await self._request("GET", url)
         return BasicDigitalTwin.from_dict(data)
 
+    async def get_digital_twins(
+        self,
+        digital_twin_ids: Iterable[DigitalTwinId],
+        max_concurrency: int = 4,
+        max_ids_per_query: int = 100,
+        max_query_length: int = 8000,
+        **kwargs: Any,
+    ) -> DigitalTwinsLookup:
+        """
+        Get many digital twins by ID with a few queries instead of one request
+        per twin.
+
+        The IDs are split into ``$dtId IN [...]`` queries that stay under the
+        query length limit, and the queries are run concurrently.
+
+        Args:
+            digital_twin_ids: The IDs of the digital twins.
+            max_concurrency: Maximum number of queries run at once.
+            max_ids_per_query: Maximum number of IDs per query.
+            max_query_length: Maximum length of a query in characters.
+            **kwargs: Additional options for each ``query_twins`` call.
+
+        Returns:
+            The twins found, keyed by ID, and the IDs that were not found.
+        """
+        ids = list(dict.fromkeys(digital_twin_ids))
+        queries = id_lookup_queries(ids, max_ids_per_query, max_query_length)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return [twin async for twin in self.query_twins(query, **kwargs)]
+
+        found: Dict[DigitalTwinId, BasicDigitalTwin] = {}
+        for results in await asyncio.gather(*(run(q) for q in queries)):
+            for data in results:
+                found[data["$dtId"]] = BasicDigitalTwin.from_dict(data)
+        return DigitalTwinsLookup(
+            twins={i: found[i] for i in ids if i in found},
+            missing=[i for i in ids if i not in found],
+        )
+
     async def upsert_digital_twin(
         self,
         digital_twin_id: DigitalTwinId,
@@ -324,6 +1120,287 @@ class KonnektrGraphClient:
         url = f"{self.endpoint}/digitaltwins/{digital_twin_id}"
         await self._request("DELETE", url, **kwargs)
 
+    async def delete_subtree(
+        self,
+        root_id: DigitalTwinId,
+        relationship_names: Optional[Iterable[RelationshipName]] = None,
+        max_concurrency: int = 16,
+        dry_run: bool = False,
+        **kwargs: Any,
+    ) -> SubtreeDeleteResult:
+        """
+        Delete a twin and every twin below it, such as a building with its
+        floors, rooms and devices.
+
+        The subtree is discovered level by level, listing the relationships of
+        all twins of a level concurrently. Then every relationship from or to a
+        twin of the subtree is deleted in parallel, including relationships
+        from twins outside it. Finally the twins are deleted in leaf-first
+        waves. Twins and relationships that are already gone count as deleted,
+        so an interrupted delete can be run again.
+
+        Args:
+            root_id: The ID of the root twin of the subtree.
+            relationship_names: Names of the relationships to descend, such as
+                ``["contains"]``. None descends all outgoing relationships.
+            max_concurrency: Maximum number of requests in flight.
+            dry_run: Only discover the subtree and return the plan.
+            **kwargs: Additional request options for each delete, such as
+                ``timeout``. Only ``headers`` also apply to the listings.
+
+        Returns:
+            The deletion waves, the relationships and the outcome. Deletion
+            stops after the first phase or wave with a failure.
+        """
+        names = set(relationship_names) if relationship_names is not None else None
+        children: Dict[DigitalTwinId, Set[DigitalTwinId]] = {}
+        edges: Dict[Tuple[DigitalTwinId, RelationshipId], BasicRelationship] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        base_headers = kwargs.pop("headers", None) or {}
+
+        async def discover(twin_id: DigitalTwinId):
+            async with semaphore:
+                outgoing = [
+                    r
+                    async for r in self.list_relationships(
+                        twin_id, headers=dict(base_headers)
+                    )
+                ]
+            async with semaphore:
+                incoming = [
+                    r
+                    async for r in self.list_incoming_relationships(
+                        twin_id, headers=dict(base_headers)
+                    )
+                ]
+            return twin_id, outgoing, incoming
+
+        frontier = [root_id]
+        children[root_id] = set()
+        while frontier:
+            level, frontier = frontier, []
+            for twin_id, outgoing, incoming in await asyncio.gather(
+                *(discover(twin_id) for twin_id in level)
+            ):
+                for relationship in outgoing:
+                    edges[(twin_id, relationship.relationshipId)] = relationship
+                    if names is None or relationship.relationshipName in names:
+                        target = relationship.targetId
+                        children[twin_id].add(target)
+                        if target not in children:
+                            children[target] = set()
+                            frontier.append(target)
+                for relationship in incoming:
+                    relationship = incoming_relationship(relationship, twin_id)
+                    edges[(relationship.sourceId, relationship.relationshipId)] = (
+                        relationship
+                    )
+
+        result = SubtreeDeleteResult(
+            waves=leaf_first_waves(children),
+            relationships=list(edges.values()),
+            dry_run=dry_run,
+        )
+        if dry_run:
+            return result
+
+        async def delete_relationship(relationship: BasicRelationship) -> None:
+            try:
+                await self.delete_relationship(
+                    relationship.sourceId,
+                    relationship.relationshipId,
+                    headers=dict(base_headers),
+                    **kwargs,
+                )
+            except ResourceNotFoundError:
+                pass
+
+        async def delete_twin(twin_id: DigitalTwinId) -> None:
+            try:
+                await self.delete_digital_twin(
+                    twin_id, headers=dict(base_headers), **kwargs
+                )
+            except ResourceNotFoundError:
+                pass
+
+        async for outcome in iter_async(
+            delete_relationship,
+            result.relationships,
+            key=_ingest_key,
+            max_concurrency=max_concurrency,
+            max_in_flight=2 * max_concurrency,
+            stats=BulkStats(),
+        ):
+            if outcome.ok:
+                result.deleted_relationships += 1
+            else:
+                result.failures.append(outcome)
+        for wave in result.waves:
+            if result.failures:
+                break
+            async for outcome in iter_async(
+                delete_twin,
+                wave,
+                key=lambda twin_id: twin_id,
+                max_concurrency=max_concurrency,
+                max_in_flight=2 * max_concurrency,
+                stats=BulkStats(),
+            ):
+                if outcome.ok:
+                    result.deleted_twins += 1
+                else:
+                    result.failures.append(outcome)
+        return result
+
+    def update_twins_where(
+        self,
+        query_expression: QueryExpression,
+        json_patch: List[JsonPatchOperation],
+        max_concurrency: int = 16,
+        max_in_flight: Optional[int] = None,
+        match_etag: bool = False,
+        **kwargs: Any,
+    ) -> AsyncBulkResults:
+        """
+        Apply a JSON patch to every twin matching a query.
+
+        The query results are streamed into concurrent updates, so memory use
+        does not grow with the number of matches. A failing update is reported
+        in its result and does not stop the others.
+
+        Args:
+            query_expression: A query selecting twins, such as
+                ``SELECT * FROM DIGITALTWINS T WHERE T.status = 'stale'``.
+            json_patch: The JSON patch to apply to each twin.
+            max_concurrency: Maximum number of updates in flight.
+            max_in_flight: Maximum number of matched twins not yet returned as
+                results. Defaults to twice ``max_concurrency``.
+            match_etag: Send each twin's ``$etag`` from the query as
+                ``If-Match``, so a twin changed since it was matched is not
+                updated and fails with status 412.
+            **kwargs: Additional request options for each update, such as
+                ``timeout``. Only ``headers`` also apply to the query.
+
+        Returns:
+            An iterator over the per-twin results, keyed by twin ID, with
+            ``read`` (twins matched so far), success and latency counters in
+            ``stats``. The updates only make progress while it is
+            iterated.
+
+        Raises:
+            ValueError: While iterating, if a query result is not a twin.
+        """
+        base_headers = kwargs.pop("headers", None) or {}
+
+        async def update(twin: Dict[str, Any]) -> None:
+            headers = dict(base_headers)
+            if match_etag:
+                headers["If-Match"] = twin["$etag"]
+            await self.update_digital_twin(
+                twin["$dtId"], json_patch, headers=headers, **kwargs
+            )
+
+        rows = self.query_twins(query_expression, headers=dict(base_headers))
+        stats = BulkStats()
+        results = iter_async(
+            update,
+            (matched_twin(row, match_etag) async for row in rows),
+            key=lambda twin: twin["$dtId"],
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight or 2 * max_concurrency,
+            stats=stats,
+        )
+        return AsyncBulkResults(results, stats)
+
+    def delete_twins_where(
+        self,
+        query_expression: QueryExpression,
+        max_concurrency: int = 16,
+        max_in_flight: Optional[int] = None,
+        match_etag: bool = False,
+        delete_relationships: bool = False,
+        **kwargs: Any,
+    ) -> AsyncBulkResults:
+        """
+        Delete every twin matching a query.
+
+        The query results are streamed into concurrent deletes, so memory use
+        does not grow with the number of matches. Twins that are already gone
+        count as deleted. A twin that still has relationships cannot be
+        deleted, unless ``delete_relationships`` is set.
+
+        Args:
+            query_expression: A query selecting twins, such as
+                ``SELECT * FROM DIGITALTWINS T WHERE T.decommissioned = true``.
+            max_concurrency: Maximum number of deletes in flight.
+            max_in_flight: Maximum number of matched twins not yet returned as
+                results. Defaults to twice ``max_concurrency``.
+            match_etag: Send each twin's ``$etag`` from the query as
+                ``If-Match``, so a twin changed since it was matched is not
+                deleted and fails with status 412.
+            delete_relationships: First delete the relationships from and to
+                each twin.
+            **kwargs: Additional request options for each delete, such as
+                ``timeout``. Only ``headers`` also apply to the query.
+
+        Returns:
+            An iterator over the per-twin results, keyed by twin ID, with
+            ``read`` (twins matched so far), success and latency counters in
+            ``stats``. The deletes only make progress while it is
+            iterated.
+
+        Raises:
+            ValueError: While iterating, if a query result is not a twin.
+        """
+        base_headers = kwargs.pop("headers", None) or {}
+
+        async def delete(twin: Dict[str, Any]) -> None:
+            twin_id = twin["$dtId"]
+            if delete_relationships:
+                relationships = [
+                    relationship
+                    async for relationship in self.list_relationships(
+                        twin_id, headers=dict(base_headers)
+                    )
+                ]
+                relationships.extend(
+                    [
+                        incoming_relationship(relationship, twin_id)
+                        async for relationship in self.list_incoming_relationships(
+                            twin_id, headers=dict(base_headers)
+                        )
+                    ]
+                )
+                for relationship in relationships:
+                    try:
+                        await self.delete_relationship(
+                            relationship.sourceId,
+                            relationship.relationshipId,
+                            headers=dict(base_headers),
+                            **kwargs,
+                        )
+                    except ResourceNotFoundError:
+                        pass
+            headers = dict(base_headers)
+            if match_etag:
+                headers["If-Match"] = twin["$etag"]
+            try:
+                await self.delete_digital_twin(twin_id, headers=headers, **kwargs)
+            except ResourceNotFoundError:
+                pass
+
+        rows = self.query_twins(query_expression, headers=dict(base_headers))
+        stats = BulkStats()
+        results = iter_async(
+            delete,
+            (matched_twin(row, match_etag) async for row in rows),
+            key=lambda twin: twin["$dtId"],
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight or 2 * max_concurrency,
+            stats=stats,
+        )
+        return AsyncBulkResults(results, stats)
+
     # --- Components ---
 
     async def get_component(
@@ -460,6 +1537,7 @@ class KonnektrGraphClient:
         self,
         digital_twin_id: DigitalTwinId,
         relationship_name: Optional[RelationshipName] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> AsyncPagedIterator[BasicRelationship]:
         """
@@ -468,6 +1546,8 @@ class KonnektrGraphClient:
         Args:
             digital_twin_id: The ID of the digital twin.
             relationship_name: Optional name of the relationship to filter by.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -479,7 +1559,12 @@ class KonnektrGraphClient:
             params["relationshipName"] = relationship_name
 
         return AsyncPagedIterator(
-            self, url, params=params, model_cls=BasicRelationship, **kwargs
+            self,
+            url,
+            params=params,
+            model_cls=BasicRelationship,
+            continuation=continuation,
+            **kwargs,
         )
 
     def list_incoming_relationships(
@@ -498,12 +1583,167 @@ class KonnektrGraphClient:
         url = f"{self.endpoint}/digitaltwins/{digital_twin_id}/incomingrelationships"
         return AsyncPagedIterator(self, url, model_cls=BasicRelationship, **kwargs)
 
+    # --- Bulk ---
+
+    def ingest(
+        self,
+        items: Union[AsyncIterable[IngestItem], Iterable[IngestItem]],
+        max_concurrency: int = 16,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncBulkResults:
+        """
+        Stream twins, relationships and patches into the graph concurrently.
+
+        Each item is sent as soon as a slot is free: a ``BasicDigitalTwin`` is
+        upserted, a ``BasicRelationship`` is upserted on its source twin, and
+        a ``TwinPatch`` or ``RelationshipPatch`` is applied. The input is read
+        in a background task that waits while ``max_in_flight`` items are
+        unfinished or their results unconsumed, so a producer reading from a
+        queue or a file slows down to the pace of the service.
+
+        Args:
+            items: The items to ingest, an async or a plain iterable.
+            max_concurrency: Maximum number of requests in flight.
+            max_in_flight: Maximum number of items read from the input but not
+                yet returned as results. Defaults to twice ``max_concurrency``.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            An async iterator over the per-item results, in completion order,
+            with success and latency counters in ``stats``. The ingest only
+            makes progress while it is iterated.
+        """
+
+        async def send(item: IngestItem) -> Any:
+            if isinstance(item, BasicDigitalTwin):
+                return await self.upsert_digital_twin(item.dtId, item, **kwargs)
+            if isinstance(item, BasicRelationship):
+                return await self.upsert_relationship(
+                    item.sourceId, item.relationshipId, item, **kwargs
+                )
+            if isinstance(item, TwinPatch):
+                return await self.update_digital_twin(
+                    item.digital_twin_id, item.json_patch, **kwargs
+                )
+            if isinstance(item, RelationshipPatch):
+                return await self.update_relationship(
+                    item.digital_twin_id,
+                    item.relationship_id,
+                    item.json_patch,
+                    **kwargs,
+                )
+            raise TypeError(f"Cannot ingest {type(item).__name__}")
+
+        stats = BulkStats()
+        results = iter_async(
+            send,
+            items,
+            key=_ingest_key,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight or 2 * max_concurrency,
+            stats=stats,
+        )
+        return AsyncBulkResults(results, stats)
+
+    def bulk_upsert_relationships(
+        self,
+        relationships: Union[AsyncIterable[BasicRelationship], Iterable[BasicRelationship]],
+        max_concurrency: int = 16,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncBulkResults:
+        """
+        Create or update many relationships concurrently.
+
+        Relationships are grouped by ``sourceId``: those of one source twin are
+        sent one at a time in input order, while different sources proceed in
+        parallel. Throughput therefore comes from having many distinct sources
+        within the ``max_in_flight`` window; interleave large single-source
+        inputs with other sources where possible.
+
+        Args:
+            relationships: The relationships to create or update, an async or
+                a plain iterable.
+            max_concurrency: Maximum number of requests in flight.
+            max_in_flight: Maximum number of relationships read from the input
+                but not yet returned as results. Defaults to four times
+                ``max_concurrency``.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            An async iterator over the per-relationship results, in completion
+            order, with success and latency counters in ``stats``. The
+            upserts only make progress while it is iterated.
+        """
+        stats = BulkStats()
+        results = iter_async(
+            lambda relationship: self.upsert_relationship(
+                relationship.sourceId,
+                relationship.relationshipId,
+                relationship,
+                **kwargs,
+            ),
+            relationships,
+            key=_ingest_key,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight or 4 * max_concurrency,
+            stats=stats,
+            group=lambda relationship: relationship.sourceId,
+        )
+        return AsyncBulkResults(results, stats)
+
+    def bulk_delete_relationships(
+        self,
+        relationships: Union[AsyncIterable[BasicRelationship], Iterable[BasicRelationship]],
+        max_concurrency: int = 16,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncBulkResults:
+        """
+        Delete many relationships concurrently.
+
+        Relationships are grouped by ``sourceId``: those of one source twin are
+        sent one at a time in input order, while different sources proceed in
+        parallel. Throughput therefore comes from having many distinct sources
+        within the ``max_in_flight`` window; interleave large single-source
+        inputs with other sources where possible.
+
+        Args:
+            relationships: The relationships to delete; only ``sourceId`` and
+                ``relationshipId`` are used. An async or a plain iterable.
+            max_concurrency: Maximum number of requests in flight.
+            max_in_flight: Maximum number of relationships read from the input
+                but not yet returned as results. Defaults to four times
+                ``max_concurrency``.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            An async iterator over the per-relationship results, in completion
+            order, with success and latency counters in ``stats``. The
+            deletes only make progress while it is iterated.
+        """
+        stats = BulkStats()
+        results = iter_async(
+            lambda relationship: self.delete_relationship(
+                relationship.sourceId, relationship.relationshipId, **kwargs
+            ),
+            relationships,
+            key=_ingest_key,
+            max_concurrency=max_concurrency,
+            max_in_flight=max_in_flight or 4 * max_concurrency,
+            stats=stats,
+            group=lambda relationship: relationship.sourceId,
+        )
+        return AsyncBulkResults(results, stats)
+
     # --- Query ---
 
     def query_twins(
         self,
         query_expression: QueryExpression,
         max_items_per_page: Optional[int] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> AsyncPagedIterator[Dict[str, Any]]:
         """
@@ -512,6 +1752,8 @@ class KonnektrGraphClient:
         Args:
             query_expression: The query expression.
             max_items_per_page: Optional maximum items per page.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -525,7 +1767,55 @@ class KonnektrGraphClient:
         body = {"query": query_expression}
 
         return AsyncPagedIterator(
-            self, url, method="POST", json_data=body, headers=headers, **kwargs
+            self,
+            url,
+            method="POST",
+            json_data=body,
+            headers=headers,
+            continuation=continuation,
+            **kwargs,
+        )
+
+    def query_twins_parallel(
+        self,
+        query_expression: QueryExpression,
+        partitions: Optional[Sequence[str]] = None,
+        max_concurrency: int = 4,
+        **kwargs: Any,
+    ) -> AsyncParallelQueryIterator:
+        """
+        Query digital twins by scanning disjoint partitions of the query
+        concurrently in background tasks.
+
+        Each partition adds a predicate to the query's WHERE clause and follows
+        its own continuation chain, so a full-graph export can use several
+        connections at once. Build partitions with ``model_partitions``,
+        ``id_range_partitions`` or ``id_prefix_partitions`` from
+        ``konnektr_graph.scan``.
+
+        Args:
+            query_expression: The query expression. TOP and COUNT queries
+                cannot be partitioned.
+            partitions: Partition predicates. None partitions by exact model,
+                using the models from ``list_models``, plus one partition for
+                the twins of unlisted models such as deleted ones.
+            max_concurrency: Maximum number of partitions scanned at once.
+            **kwargs: Additional options for the iterator (``buffer_pages``)
+                and for each partition's ``query_twins`` call.
+
+        Returns:
+            An async iterator over the merged query results, in no particular
+            order, with per-partition throughput in ``stats``.
+
+        Raises:
+            ValueError: If the query cannot be partitioned.
+        """
+        return AsyncParallelQueryIterator(
+            self,
+            query_expression,
+            partitions=partitions,
+            max_concurrency=max_concurrency,
+            **kwargs,
         )
 
     # --- Models ---
@@ -559,6 +1849,7 @@ class KonnektrGraphClient:
         dependencies_for: Optional[Union[str, List[str]]] = None,
         include_model_definition: bool = False,
         results_per_page: Optional[int] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> AsyncPagedIterator[DigitalTwinsModelData]:
         """
@@ -568,6 +1859,8 @@ class KonnektrGraphClient:
             dependencies_for: Optional model ID or list of model IDs to get dependencies for.
             include_model_definition: Whether to include the model definition.
             results_per_page: Optional maximum items per page.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -589,6 +1882,7 @@ class KonnektrGraphClient:
             params=params,
             headers=headers,
             model_cls=DigitalTwinsModelData,
+            continuation=continuation,
             **kwargs,
         )
 
@@ -656,6 +1950,7 @@ class KonnektrGraphClient:
         """
         url = f"{self.endpoint}/models/search"
         body = {"searchText": search_text, "limit": limit}
+        kwargs.setdefault("idempotent", True)
         return await self._request("POST", url, json=body, **kwargs)
 
     async def search_twins(
@@ -679,6 +1974,7 @@ class KonnektrGraphClient:
         """
         url = f"{self.endpoint}/digitaltwins/search"
         body = {"searchText": search_text, "limit": limit}
+        kwargs.setdefault("idempotent", True)
         if model_id:
             body["modelId"] = model_id
         return await self._request("POST", url, json=body, **kwargs)
@@ -705,6 +2001,8 @@ class KonnektrGraphClient:
         headers = kwargs.pop("headers", {})
         if message_id:
             headers["Message-Id"] = message_id
+        # Retrying is only safe when the service can deduplicate by Message-Id
+        kwargs.setdefault("idempotent", bool(message_id))
 
         await self._request("POST", url, json=telemetry, headers=headers, **kwargs)
 
@@ -730,6 +2028,8 @@ class KonnektrGraphClient:
         headers = kwargs.pop("headers", {})
         if message_id:
             headers["Message-Id"] = message_id
+        # Retrying is only safe when the service can deduplicate by Message-Id
+        kwargs.setdefault("idempotent", bool(message_id))
 
         await self._request("POST", url, json=telemetry, headers=headers, **kwargs)
 
@@ -807,6 +2107,124 @@ class KonnektrGraphClient:
         data = await self._request("POST", url, **kwargs)
         return ImportJob.from_dict(data)
 
+    async def bulk_write(
+        self,
+        twins: Sequence[BasicDigitalTwin] = (),
+        relationships: Sequence[BasicRelationship] = (),
+        models: Sequence[DtdlInterface] = (),
+        blob_store: Optional[BlobStore] = None,
+        import_threshold: int = 10000,
+        job_id: Optional[JobId] = None,
+        max_concurrency: int = 16,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BulkWriteResult:
+        """
+        Write a batch of models, twins and relationships, picking the faster
+        path for its size.
+
+        Batches smaller than ``import_threshold`` items are written with
+        concurrent requests: first the models, then the twins, then the
+        relationships. Larger batches are written as an import file to
+        ``blob_store`` as gzip-compressed NDJSON and loaded with an import job,
+        which this method waits for. Without a ``blob_store`` every batch is
+        written with requests, and a ``UserWarning`` is issued for batches of
+        ``import_threshold`` items or more.
+        ``blob_store.upload`` may be a coroutine function.
+
+        Args:
+            twins: The digital twins to create or replace.
+            relationships: The relationships to create or replace.
+            models: The models to create, in dependency order. Models that
+                already exist are skipped in REST mode.
+            blob_store: Storage the import file is uploaded to. Required for
+                import mode.
+            import_threshold: Number of items from which an import job is used.
+            job_id: ID of the import job. Defaults to a random ID.
+            max_concurrency: Maximum number of requests in flight in REST mode.
+            poll_interval: Seconds before the first poll of the import job.
+                Later polls back off, as in ``wait_for_jobs``.
+            timeout: Maximum seconds to wait for the import job.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            The mode used and its outcome: the failed requests, or the finished
+            import job.
+
+        Raises:
+            TimeoutError: If the import job does not finish within ``timeout``.
+        """
+        result = BulkWriteResult(
+            mode="rest",
+            models=len(models),
+            twins=len(twins),
+            relationships=len(relationships),
+        )
+        size = result.models + result.twins + result.relationships
+        if blob_store is None and size >= import_threshold:
+            warnings.warn(
+                f"bulk_write of {size} items is sent as requests because no "
+                "blob_store was given for an import job",
+                stacklevel=2,
+            )
+        if blob_store is not None and size >= import_threshold:
+            result.mode = "import"
+            job_id = job_id or f"bulk-write-{uuid.uuid4().hex}"
+            input_uri = blob_store.upload(
+                f"{job_id}.ndjson.gz",
+                import_file_chunks(
+                    models, twins, relationships, json_codec=self.json_codec
+                ),
+            )
+            if inspect.isawaitable(input_uri):
+                input_uri = await input_uri
+            created = await self.create_import_job(
+                job_id,
+                {
+                    "inputBlobUri": input_uri,
+                    "outputBlobUri": blob_store.uri(f"{job_id}.output.ndjson"),
+                },
+                **kwargs,
+            )
+            async for finished in self.wait_for_jobs(
+                [created], timeout, initial_interval=poll_interval, **kwargs
+            ):
+                if isinstance(finished, ImportJob):
+                    result.job = finished
+            return result
+
+        if models:
+            try:
+                await self._create_models_skipping_existing(models, **kwargs)
+            except Exception as e:
+                result.failures.append(BulkItemResult("models", list(models), error=e))
+                return result
+        async for outcome in self.ingest(
+            twins, max_concurrency=max_concurrency, **kwargs
+        ):
+            if not outcome.ok:
+                result.failures.append(outcome)
+        async for outcome in self.bulk_upsert_relationships(
+            relationships, max_concurrency=max_concurrency, **kwargs
+        ):
+            if not outcome.ok:
+                result.failures.append(outcome)
+        return result
+
+    async def _create_models_skipping_existing(
+        self, models: Sequence[DtdlInterface], **kwargs: Any
+    ) -> None:
+        try:
+            await self.create_models(list(models), **kwargs)
+        except ResourceExistsError:
+            # Some models exist: create the others one at a time
+            for model in models:
+                try:
+                    await self.create_models([model], **kwargs)
+                except ResourceExistsError:
+                    pass
+
     # --- Delete Jobs ---
 
     def list_delete_jobs(self, **kwargs: Any) -> AsyncPagedIterator[DeleteJob]:
@@ -854,3 +2272,92 @@ class KonnektrGraphClient:
         url = f"{self.endpoint}/jobs/deletion/{job_id}"
         data = await self._request("PUT", url, json=delete_job or {}, **kwargs)
         return DeleteJob.from_dict(data)
+
+    # --- Jobs ---
+
+    async def wait_for_jobs(
+        self,
+        jobs: Iterable[Union[ImportJob, DeleteJob]],
+        timeout: Optional[float] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[ImportJob, DeleteJob]]:
+        """
+        Wait for import and delete jobs to finish, polling them concurrently.
+
+        Each job is polled after ``initial_interval`` seconds, and the interval
+        grows by ``backoff`` after every poll up to ``max_interval``, so short
+        jobs are seen finishing quickly and long ones cost few requests. Jobs
+        that are due at the same time are polled concurrently, from a single
+        task, and each is yielded as soon as its own poll returns.
+
+        Args:
+            jobs: The jobs, as returned by ``create_import_job`` or
+                ``create_delete_job``.
+            timeout: Maximum seconds to wait for all jobs.
+            initial_interval: Seconds before the first poll of each job.
+            max_interval: Maximum seconds between polls of a job.
+            backoff: Factor the interval grows by after each poll.
+            max_concurrency: Maximum number of polls in flight.
+            **kwargs: Additional request options for each poll.
+
+        Yields:
+            Each job once it reaches a terminal status (completed, failed or
+            cancelled), in the order they finish.
+
+        Raises:
+            TimeoutError: If jobs are unfinished after ``timeout`` seconds.
+        """
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        # Unfinished jobs by position, with their next poll time and interval
+        pending: Dict[int, Tuple[Union[ImportJob, DeleteJob], float, float]] = {}
+        for index, job in enumerate(jobs):
+            if job.status in TERMINAL_JOB_STATUSES:
+                yield job
+            else:
+                pending[index] = (job, now + initial_interval, initial_interval)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def poll(index: int) -> Tuple[int, Union[ImportJob, DeleteJob]]:
+            job = pending[index][0]
+            async with semaphore:
+                if isinstance(job, ImportJob):
+                    return index, await self.get_import_job(job.id, **kwargs)
+                return index, await self.get_delete_job(job.id, **kwargs)
+
+        while pending:
+            due = min(poll_at for _, poll_at, _ in pending.values())
+            if deadline is not None:
+                due = min(due, deadline)
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            now = time.monotonic()
+            indexes = [i for i, (_, at, _) in pending.items() if at <= now]
+            if deadline is not None and now >= deadline:
+                indexes = list(pending)
+            tasks = [asyncio.ensure_future(poll(i)) for i in indexes]
+            try:
+                # Each job is handled as soon as its own poll returns
+                for next_polled in asyncio.as_completed(tasks):
+                    index, job = await next_polled
+                    if job.status in TERMINAL_JOB_STATUSES:
+                        del pending[index]
+                        yield job
+                    else:
+                        interval = min(pending[index][2] * backoff, max_interval)
+                        poll_at = time.monotonic() + interval
+                        pending[index] = (job, poll_at, interval)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            now = time.monotonic()
+            if pending and deadline is not None and now >= deadline:
+                unfinished = ", ".join(job.id for job, _, _ in pending.values())
+                raise TimeoutError(
+                    f"Jobs did not finish within {timeout} seconds: {unfinished}"
+                )
@@ -0,0 +1,583 @@
+# konnektr_graph/bulk.py
+"""
+Per-item results and statistics of bulk operations.
+
+Bulk operations run one request per item with bounded concurrency and report
+the outcome of every item as it completes, so that one failing item does not
+abort the others and results can be processed while the operation runs.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from .models import ImportJob
+from .types import (
+    BasicRelationship,
+    DigitalTwinId,
+    JsonPatchOperation,
+    RelationshipId,
+)
+
+
+@dataclass
+class BulkItemResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        key: The ID of the item, such as the twin ID.
+        item: The input item.
+        value: The result of the operation on success.
+        error: The exception raised for the item on failure.
+        latency: Time taken by the item's request(s) in seconds.
+    """
+
+    key: str
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for the item."""
+        return self.error is None
+
+
+@dataclass
+class TwinPatch:
+    """
+    A JSON Patch to apply to a digital twin in a bulk operation.
+
+    Attributes:
+        digital_twin_id: The ID of the digital twin.
+        json_patch: The JSON Patch operations.
+    """
+
+    digital_twin_id: DigitalTwinId
+    json_patch: List[JsonPatchOperation]
+
+
+@dataclass
+class RelationshipPatch:
+    """
+    A JSON Patch to apply to a relationship in a bulk operation.
+
+    Attributes:
+        digital_twin_id: The ID of the source digital twin.
+        relationship_id: The ID of the relationship.
+        json_patch: The JSON Patch operations.
+    """
+
+    digital_twin_id: DigitalTwinId
+    relationship_id: RelationshipId
+    json_patch: List[JsonPatchOperation]
+
+
+@dataclass
+class SubtreeDeleteResult:
+    """
+    Plan and outcome of deleting a subtree of the graph.
+
+    Attributes:
+        waves: The twins of the subtree in deletion order, leaf-first: each
+            wave is deleted after the waves before it.
+        relationships: The relationships deleted before the twins: every
+            relationship from or to a twin of the subtree.
+        dry_run: Whether nothing was deleted.
+        deleted_relationships: Number of relationships deleted.
+        deleted_twins: Number of twins deleted.
+        failures: Results of the deletes that failed. Deletion stops after the
+            first phase or wave with a failure.
+    """
+
+    waves: List[List[DigitalTwinId]]
+    relationships: List[BasicRelationship]
+    dry_run: bool = False
+    deleted_relationships: int = 0
+    deleted_twins: int = 0
+    failures: List[BulkItemResult] = field(default_factory=list)
+
+    @property
+    def twins(self) -> List[DigitalTwinId]:
+        """All twins of the subtree, leaf-first."""
+        return [twin_id for wave in self.waves for twin_id in wave]
+
+    @property
+    def completed(self) -> bool:
+        """Whether the whole subtree was deleted."""
+        return not self.dry_run and not self.failures and self.deleted_twins == len(
+            self.twins
+        )
+
+
+@dataclass
+class BulkWriteResult:
+    """
+    Outcome of writing a batch of models, twins and relationships.
+
+    Attributes:
+        mode: ``"rest"`` if the batch was written with concurrent requests,
+            ``"import"`` if with an import job.
+        models: Number of models in the batch.
+        twins: Number of twins in the batch.
+        relationships: Number of relationships in the batch.
+        failures: Results of the requests that failed, in REST mode.
+        job: The finished import job, in import mode.
+    """
+
+    mode: str
+    models: int = 0
+    twins: int = 0
+    relationships: int = 0
+    failures: List[BulkItemResult] = field(default_factory=list)
+    job: Optional[ImportJob] = None
+
+    @property
+    def completed(self) -> bool:
+        """Whether the whole batch was written."""
+        if self.mode == "import":
+            return self.job is not None and self.job.status == "completed"
+        return not self.failures
+
+
+def incoming_relationship(
+    relationship: BasicRelationship, target_id: DigitalTwinId
+) -> BasicRelationship:
+    """Normalize an item of ``list_incoming_relationships``, which has no $ keys."""
+    properties = relationship.properties
+    return BasicRelationship(
+        relationshipId=relationship.relationshipId
+        or properties.get("relationshipId", ""),
+        sourceId=relationship.sourceId or properties.get("sourceId", ""),
+        targetId=target_id,
+        relationshipName=relationship.relationshipName
+        or properties.get("relationshipName", ""),
+    )
+
+
+def leaf_first_waves(children: Dict[str, Set[str]]) -> List[List[str]]:
+    """
+    Order the twins of a subtree into waves, each twin after its descendants.
+
+    Args:
+        children: The children of every twin of the subtree.
+
+    Returns:
+        The waves, leaves first. Twins on a cycle share the last wave of
+        their cycle.
+    """
+    remaining = set(children)
+    waves: List[List[str]] = []
+    while remaining:
+        wave = [t for t in remaining if not (children[t] & remaining)]
+        if not wave:
+            # A cycle: no twin is free of remaining children
+            wave = list(remaining)
+        waves.append(sorted(wave))
+        remaining.difference_update(wave)
+    return waves
+
+
+def matched_twin(row: Dict[str, Any], require_etag: bool = False) -> Dict[str, Any]:
+    """
+    Get the twin of a query result row.
+
+    Args:
+        row: A row of ``SELECT *`` or of a query selecting a single twin alias,
+            such as ``SELECT T FROM DIGITALTWINS T``.
+        require_etag: Whether the twin must have its ``$etag``.
+
+    Returns:
+        The twin, with at least its ``$dtId``.
+
+    Raises:
+        ValueError: If the row is not a twin, or has no ``$etag`` although it
+            is required.
+    """
+    twin = row
+    if "$dtId" not in twin and len(row) == 1:
+        twin = next(iter(row.values()))
+    if not isinstance(twin, dict) or "$dtId" not in twin:
+        raise ValueError("Query results must be twins, e.g. SELECT * or SELECT T")
+    if require_etag and "$etag" not in twin:
+        raise ValueError(f"Query result {twin['$dtId']} has no $etag to match")
+    return twin
+
+
+class BulkStats:
+    """
+    Thread-safe counters of a bulk operation.
+
+    :param window: Number of recent latencies the percentiles are computed over
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._started: Optional[float] = None
+        self._last: Optional[float] = None
+        self.read = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.errors_by_type: Dict[str, int] = {}
+
+    def _begin(self) -> None:
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+
+    def _read(self) -> None:
+        with self._lock:
+            self.read += 1
+
+    def _record(self, result: BulkItemResult) -> None:
+        with self._lock:
+            self._last = time.monotonic()
+            if result.error is None:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+                name = type(result.error).__name__
+                self.errors_by_type[name] = self.errors_by_type.get(name, 0) + 1
+            self.latency_total += result.latency
+            self.latency_max = max(self.latency_max, result.latency)
+            self._latencies.append(result.latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the counters.
+
+        Returns:
+            A dictionary with the number of items ``read`` from the input,
+            the number that ``succeeded`` and ``failed``, ``errors_by_type``
+            (exception class name to count), ``items_per_second``, and the
+            average, p50, p95 and maximum per-item latency in seconds
+            (percentiles over recent items).
+        """
+        with self._lock:
+            completed = self.succeeded + self.failed
+            ordered = sorted(self._latencies)
+            elapsed = (
+                (self._last or time.monotonic()) - self._started
+                if self._started is not None
+                else 0.0
+            )
+
+            def percentile(p: float) -> float:
+                if not ordered:
+                    return 0.0
+                return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+            return {
+                "read": self.read,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "errors_by_type": dict(self.errors_by_type),
+                "items_per_second": completed / elapsed if elapsed > 0 else 0.0,
+                "latency_avg": self.latency_total / completed if completed else 0.0,
+                "latency_p50": percentile(50),
+                "latency_p95": percentile(95),
+                "latency_max": self.latency_max,
+            }
+
+
+class BulkResults(Iterator[BulkItemResult]):
+    """
+    Iterator over the per-item results of a bulk operation, in completion order.
+
+    Items are read from the input and sent as results are consumed, so the
+    operation only makes progress while the results are iterated. Closing the
+    iterator stops reading the input and waits for requests in flight.
+    """
+
+    def __init__(self, results: Iterator[BulkItemResult], stats: BulkStats):
+        self._results = results
+        self.stats = stats
+
+    def __iter__(self) -> "BulkResults":
+        return self
+
+    def __next__(self) -> BulkItemResult:
+        return next(self._results)
+
+    def close(self) -> None:
+        """Stop the operation, waiting for requests in flight."""
+        close = getattr(self._results, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "BulkResults":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class AsyncBulkResults(AsyncIterator[BulkItemResult]):
+    """
+    Async iterator over the per-item results of a bulk operation, in
+    completion order.
+
+    Items are read from the input and sent as results are consumed, so the
+    operation only makes progress while the results are iterated. Closing the
+    iterator stops reading the input and cancels requests in flight.
+    """
+
+    def __init__(self, results: AsyncIterator[BulkItemResult], stats: BulkStats):
+        self._results = results
+        self.stats = stats
+
+    def __aiter__(self) -> "AsyncBulkResults":
+        return self
+
+    async def __anext__(self) -> BulkItemResult:
+        return await self._results.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop the operation, cancelling requests in flight."""
+        aclose = getattr(self._results, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncBulkResults":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+_END = object()
+
+
+def iter_threaded(
+    operation: Callable[[Any], Any],
+    items: Iterable[Any],
+    key: Callable[[Any], str],
+    max_workers: int,
+    max_in_flight: int,
+    stats: BulkStats,
+    group: Optional[Callable[[Any], Hashable]] = None,
+) -> Iterator[BulkItemResult]:
+    """
+    Apply ``operation`` to each item on a pool of threads.
+
+    The input is read lazily and at most ``max_in_flight`` items are read but
+    not yet yielded. Exceptions raised by ``operation`` are reported in the
+    item's result; exceptions raised by the input propagate.
+
+    Args:
+        operation: Called with each item; its return value is the result value.
+        items: The input items.
+        key: Returns the ID of an item.
+        max_workers: Number of threads.
+        max_in_flight: Maximum number of items read but not yet yielded.
+        stats: Counters to record the results in.
+        group: Optional function returning the group of an item. Items of one
+            group are applied one at a time, in input order.
+
+    Yields:
+        BulkItemResult: The result of each item, in completion order.
+    """
+    if max_workers < 1 or max_in_flight < 1:
+        raise ValueError("max_workers and max_in_flight must be at least 1")
+
+    def call(item: Any) -> BulkItemResult:
+        started = time.perf_counter()
+        try:
+            value = operation(item)
+        except Exception as e:
+            return BulkItemResult(
+                key(item), item, error=e, latency=time.perf_counter() - started
+            )
+        return BulkItemResult(
+            key(item), item, value=value, latency=time.perf_counter() - started
+        )
+
+    source = iter(items)
+    pending: Set["Future[BulkItemResult]"] = set()
+    # Groups with an item in flight, and the items waiting behind it
+    lanes: Dict[Hashable, Deque[Any]] = {}
+    future_groups: Dict["Future[BulkItemResult]", Hashable] = {}
+    waiting = 0
+    executor = ThreadPoolExecutor(max_workers, "konnektr-graph-bulk")
+    stats._begin()
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + waiting < max_in_flight:
+                item = next(source, _END)
+                if item is _END:
+                    exhausted = True
+                    continue
+                stats._read()
+                if group is None:
+                    pending.add(executor.submit(call, item))
+                else:
+                    name = group(item)
+                    if name in lanes:
+                        lanes[name].append(item)
+                        waiting += 1
+                    else:
+                        lanes[name] = deque()
+                        future = executor.submit(call, item)
+                        future_groups[future] = name
+                        pending.add(future)
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if group is not None:
+                    name = future_groups.pop(future)
+                    if lanes[name]:
+                        waiting -= 1
+                        successor = executor.submit(call, lanes[name].popleft())
+                        future_groups[successor] = name
+                        pending.add(successor)
+                    else:
+                        del lanes[name]
+                result = future.result()
+                stats._record(result)
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def _aiter(items: Union[AsyncIterable[Any], Iterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:  # type: ignore[union-attr]
+            yield item
+    else:
+        for item in items:  # type: ignore[union-attr]
+            yield item
+
+
+async def iter_async(
+    operation: Callable[[Any], Awaitable[Any]],
+    items: Union[AsyncIterable[Any], Iterable[Any]],
+    key: Callable[[Any], str],
+    max_concurrency: int,
+    max_in_flight: int,
+    stats: BulkStats,
+    group: Optional[Callable[[Any], Hashable]] = None,
+) -> AsyncIterator[BulkItemResult]:
+    """
+    Apply the coroutine function ``operation`` to each item concurrently.
+
+    A background task reads the input and waits for one of ``max_in_flight``
+    slots before starting each item, so a producer is slowed down to the pace
+    at which the service and the consumer of the results keep up. At most
+    ``max_concurrency`` operations run at once. Exceptions raised by
+    ``operation`` are reported in the item's result; exceptions raised by the
+    input propagate.
+
+    Args:
+        operation: Awaited with each item; its return value is the result value.
+        items: The input items, an async or a plain iterable.
+        key: Returns the ID of an item.
+        max_concurrency: Maximum number of operations running at once.
+        max_in_flight: Maximum number of items read but not yet yielded.
+        stats: Counters to record the results in.
+        group: Optional function returning the group of an item. Items of one
+            group are applied one at a time, in input order.
+
+    Yields:
+        BulkItemResult: The result of each item, in completion order.
+    """
+    if max_concurrency < 1 or max_in_flight < 1:
+        raise ValueError("max_concurrency and max_in_flight must be at least 1")
+    slots = asyncio.Semaphore(max_in_flight)
+    running = asyncio.Semaphore(max_concurrency)
+    results: "asyncio.Queue[Any]" = asyncio.Queue()
+    tasks: Set["asyncio.Future[None]"] = set()
+    # Groups with an item in flight, and the items waiting behind it
+    lanes: Dict[Hashable, Deque[Any]] = {}
+
+    def start(item: Any, name: Hashable) -> None:
+        task = asyncio.ensure_future(call(item, name))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def call(item: Any, name: Hashable) -> None:
+        async with running:
+            started = time.perf_counter()
+            try:
+                value = await operation(item)
+            except Exception as e:
+                result = BulkItemResult(
+                    key(item), item, error=e, latency=time.perf_counter() - started
+                )
+            else:
+                result = BulkItemResult(
+                    key(item), item, value=value, latency=time.perf_counter() - started
+                )
+        if group is not None:
+            if lanes[name]:
+                start(lanes[name].popleft(), name)
+            else:
+                del lanes[name]
+        results.put_nowait(result)
+
+    async def feed() -> None:
+        try:
+            async for item in _aiter(items):
+                await slots.acquire()
+                stats._read()
+                name = group(item) if group is not None else None
+                if group is None:
+                    start(item, None)
+                elif name in lanes:
+                    lanes[name].append(item)
+                else:
+                    lanes[name] = deque()
+                    start(item, name)
+            # Every result is queued before the end marker
+            while tasks:
+                await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            results.put_nowait(e)
+            return
+        results.put_nowait(_END)
+
+    stats._begin()
+    feeder = asyncio.ensure_future(feed())
+    try:
+        while True:
+            entry = await results.get()
+            if entry is _END:
+                return
+            if isinstance(entry, BaseException):
+                raise entry
+            slots.release()
+            stats._record(entry)
+            yield entry
+    finally:
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
+        await asyncio.gather(feeder, *tasks, return_exceptions=True)
@@ -2,14 +2,28 @@
 """
 Konnektr Graph SDK (Azure-free) - Synchronous Client
 """
-import json
+import queue
+import threading
+import time
+import uuid
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from typing import (
     Any,
+    Callable,
     Dict,
+    Generator,
     Generic,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -18,16 +32,27 @@ from typing import (
 import requests
 
 from .auth.protocol import TokenProvider
-from .exceptions import (
-    HttpResponseError,
-    ResourceNotFoundError,
-    ResourceExistsError,
-    AuthenticationError,
+from .bulk import (
+    BulkItemResult,
+    BulkResults,
+    BulkStats,
+    BulkWriteResult,
+    SubtreeDeleteResult,
+    incoming_relationship,
+    iter_threaded,
+    leaf_first_waves,
+    matched_twin,
 )
+from .exceptions import ResourceExistsError, ResourceNotFoundError, ServiceRequestError
+from .imports import BlobStore, import_file_chunks
 from .models import (
+    Continuation,
     DeleteJob,
+    DigitalTwinsLookup,
     DigitalTwinsModelData,
     ImportJob,
+    Page,
+    TERMINAL_JOB_STATUSES,
 )
 from .types import (
     BasicDigitalTwin,
@@ -45,10 +70,180 @@ from .types import (
     RelationshipName,
     TelemetryPayload,
 )
+from .transport import (
+    HttpRequest,
+    HttpResponse,
+    HttpxTransport,
+    JsonCodec,
+    PageStreamParser,
+    RequestsTransport,
+    Transport,
+    build_request,
+    get_json_codec,
+    raise_for_response,
+)
+from .policies import (
+    CircuitBreakerPolicy,
+    CompressionPolicy,
+    RateLimiter,
+    RetryPolicy,
+)
+from .scan import (
+    ParallelScanStats,
+    id_lookup_queries,
+    model_partitions,
+    partition_query,
+    query_alias,
+)
 
 T = TypeVar("T")
 
 
+class _PageRequest:
+    """Sends the requests of a paged operation, following its continuation."""
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        items_key: str,
+    ):
+        self.client = client
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.json_data = json_data
+        self.params = params
+        self.items_key = items_key
+
+    def send(
+        self,
+        next_link: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        *,
+        initial: bool,
+        stream: bool = False,
+    ) -> HttpResponse:
+        headers = self.headers.copy()
+        params = self.params if initial else None
+
+        request_url = self.url
+        if not initial:
+            if next_link:
+                request_url = next_link
+                if not request_url.startswith("http"):
+                    request_url = f"{self.client.endpoint}/{request_url.lstrip('/')}"
+            elif continuation_token:
+                headers["x-ms-continuation"] = continuation_token
+
+        return self.client._request(
+            self.method,
+            request_url,
+            headers=headers,
+            json=self.json_data,
+            params=params,
+            idempotent=True,
+            stream=stream,
+        )
+
+    def fetch(
+        self,
+        next_link: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        *,
+        initial: bool,
+    ) -> Page[Any]:
+        """Fetch a whole page with its raw items."""
+        response = self.send(next_link, continuation_token, initial=initial)
+        return _make_page(response.json(), response.headers, self.items_key)
+
+
+def _page_links(
+    data: Mapping[str, Any], header_token: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    # The continuation token may be in the headers or, for some APIs, the body
+    token = header_token or data.get("continuationToken")
+    return data.get("nextLink"), token if token else None
+
+
+def _make_page(
+    data: Mapping[str, Any], headers: Mapping[str, str], items_key: str
+) -> Page[Any]:
+    next_link, continuation_token = _page_links(
+        data, headers.get("x-ms-continuation")
+    )
+    return Page(
+        items=data.get(items_key, []),
+        continuation_token=continuation_token,
+        next_link=next_link,
+        headers=headers,
+        metadata={k: v for k, v in data.items() if k != items_key},
+    )
+
+
+class _PagePrefetcher:
+    """
+    Fetches whole pages ahead of the consumer on a worker thread.
+
+    Starts at the first page, or at ``start`` when resuming. At most ``depth``
+    pages are fetched but not yet taken by ``get``, counting the one being
+    fetched. Holds no reference to the iterator it serves.
+    """
+
+    def __init__(
+        self,
+        request: _PageRequest,
+        depth: int,
+        start: Optional[Continuation] = None,
+    ):
+        self._request = request
+        self._start = start
+        self._slots = threading.Semaphore(depth)
+        self._pages: "queue.Queue[Any]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="konnektr-graph-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        start = self._start
+        next_link = start.next_link if start else None
+        token = start.continuation_token if start else None
+        initial = start is None
+        try:
+            while initial or next_link or token:
+                self._slots.acquire()
+                if self._stopped.is_set():
+                    return
+                page = self._request.fetch(next_link, token, initial=initial)
+                initial = False
+                next_link, token = page.next_link, page.continuation_token
+                self._pages.put(page)
+        except BaseException as e:
+            self._pages.put(e)
+            return
+        self._pages.put(None)
+
+    def get(self) -> Optional[Page[Any]]:
+        """Take the next page, with raw items, or None after the last page."""
+        page = self._pages.get()
+        if isinstance(page, BaseException):
+            raise page
+        if page is not None:
+            self._slots.release()
+        return page
+
+    def stop(self) -> None:
+        """Stop fetching. A request already in flight is completed and dropped."""
+        self._stopped.set()
+        self._slots.release()
+
+
 class PagedIterator(Iterator[T], Generic[T]):
     """
     Iterator for handling paged responses.
@@ -65,6 +260,10 @@ class PagedIterator(Iterator[T], Generic[T]):
         params: Optional[Dict[str, Any]] = None,
         model_cls: Optional[Type[T]] = None,
         items_key: str = "value",
+        stream: bool = False,
+        prefetch: int = 0,
+        continuation: Optional[Continuation] = None,
+        on_checkpoint: Optional[Callable[[Continuation], Any]] = None,
     ):
         """
         Initialize the paged iterator.
@@ -78,134 +277,579 @@ class PagedIterator(Iterator[T], Generic[T]):
             params: Optional query parameters for the request.
             model_cls: Optional class to instantiate for each item in the results.
             items_key: The key in the JSON response that contains the items list. Defaults to "value".
+            stream: Whether to parse each page incrementally as it is received,
+                yielding items before the whole page has arrived and without
+                holding the decoded page in memory. Ignored when prefetching.
+                Defaults to False.
+            prefetch: Number of pages to fetch ahead on a worker thread while
+                the current page is being consumed. 0 fetches each page only
+                when it is needed. Defaults to 0.
+            continuation: Optional checkpoint from ``continuation`` of an
+                earlier iterator over the same operation. The scan resumes at
+                that page boundary instead of the first page.
+            on_checkpoint: Optional callback called with the new
+                ``continuation`` each time a page has been fully consumed.
         """
         self._client = client
-        self._url = initial_url
-        self._method = method
-        self._headers = headers or {}
-        self._json_data = json_data
-        self._params = params
-        self._model_cls = model_cls
-        self._items_key = items_key
-        self._current_page_items = []
-        self._current_page_index = 0
-        self._continuation_token = None
-        self._next_link = None
+        self._request = _PageRequest(
+            client, initial_url, method, headers or {}, json_data, params, items_key
+        )
+        self._stream = stream
+        self._prefetch = prefetch
+        self._prefetcher: Optional[_PagePrefetcher] = None
+        self._convert = _item_converter(model_cls)
+        self._page_items: Iterator[T] = iter(())
+        self._page_parser: Optional[PageStreamParser] = None
+        self._continuation_token: Optional[str] = None
+        self._next_link: Optional[str] = None
         self._first_page_fetched = False
+        self._done = False
+        self._start = continuation
+        self._checkpoint = continuation
+        self._on_checkpoint = on_checkpoint
+        self._page_open = False
+        if continuation is not None:
+            self._next_link = continuation.next_link
+            self._continuation_token = continuation.continuation_token
+            self._first_page_fetched = True
+            self._done = continuation.done
 
     def __iter__(self) -> "PagedIterator[T]":
         return self
 
     def __next__(self) -> T:
-        if not self._first_page_fetched:
-            self._fetch_page(is_initial=True)
-            self._first_page_fetched = True
-
-        if self._current_page_index < len(self._current_page_items):
-            item = self._current_page_items[self._current_page_index]
-            self._current_page_index += 1
-            return item
-        else:
-            if not self._next_link and not self._continuation_token:
+        while True:
+            for item in self._page_items:
+                return item
+            if self._page_parser is not None:
+                # A streamed page has links in its body once fully read
+                self._next_link, self._continuation_token = _page_links(
+                    self._page_parser.metadata, self._continuation_token
+                )
+                self._page_parser = None
+            if self._page_open:
+                self._page_open = False
+                self._reached_checkpoint(
+                    Continuation(self._continuation_token, self._next_link)
+                )
+            if self._done:
                 raise StopIteration
-            self._fetch_page()
-            if not self._current_page_items:
+            if self._prefetch > 0:
+                # The prefetcher follows the continuation itself
+                self._next_prefetched_page()
+                continue
+            if self._first_page_fetched and not (
+                self._next_link or self._continuation_token
+            ):
                 raise StopIteration
-            self._current_page_index = 1
-            return self._current_page_items[0]
+            self._fetch_page(is_initial=not self._first_page_fetched)
+            self._first_page_fetched = True
 
-    def _fetch_page(self, is_initial: bool = False):
-        headers = self._headers.copy()
-        params = self._params if is_initial else None
+    @property
+    def continuation(self) -> Optional[Continuation]:
+        """
+        Checkpoint to resume the scan from: the start of the first page that
+        has not been fully consumed. Serialize it with ``to_dict`` and pass it
+        back as ``continuation`` to resume after a restart. None until the
+        first page has been consumed, unless the iterator was resumed.
+        """
+        return self._checkpoint
 
-        request_url = self._url
-        if not is_initial:
-            if self._next_link:
-                request_url = self._next_link
-                if not request_url.startswith("http"):
-                    request_url = f"{self._client.endpoint}/{request_url.lstrip('/')}"
-            elif self._continuation_token:
-                headers["x-ms-continuation"] = self._continuation_token
+    def close(self) -> None:
+        """
+        Stop iterating, stop any prefetching and release the connection of a
+        partially read streamed page.
+        """
+        close = getattr(self._page_items, "close", None)
+        if close is not None:
+            close()
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+        self._page_items = iter(())
+        self._page_parser = None
+        self._done = True
 
-        response = self._client._request(
-            self._method,
-            request_url,
-            headers=headers,
-            json=self._json_data,
-            params=params,
+    def by_page(self) -> Generator[Page[T], None, None]:
+        """
+        Iterate over the result page by page, starting from the first page, or
+        from ``continuation`` when resuming.
+
+        Each page carries its items together with the continuation token,
+        nextLink, response headers and the other keys of the page body, so a
+        scan can be checkpointed or pages handed to a batch consumer. The
+        checkpoint moves past a page once the consumer asks for the next one.
+        Pages are always read whole; ``prefetch`` applies, ``stream`` does not.
+
+        Yields:
+            Page: The next page of results.
+        """
+        prefetcher = (
+            _PagePrefetcher(self._request, self._prefetch, self._start)
+            if self._prefetch > 0
+            else None
         )
-        data = response.json()
+        try:
+            position = self._start
+            while position is None or not position.done:
+                if prefetcher is not None:
+                    page = prefetcher.get()
+                    if page is None:
+                        return
+                else:
+                    page = self._request.fetch(
+                        position.next_link if position else None,
+                        position.continuation_token if position else None,
+                        initial=position is None,
+                    )
+                yield replace(page, items=[self._convert(item) for item in page.items])
+                position = page.continuation
+                self._reached_checkpoint(position)
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
+
+    def _reached_checkpoint(self, continuation: Continuation) -> None:
+        self._checkpoint = continuation
+        if self._on_checkpoint is not None:
+            self._on_checkpoint(continuation)
+
+    def _next_prefetched_page(self) -> None:
+        if self._prefetcher is None:
+            self._prefetcher = _PagePrefetcher(
+                self._request, self._prefetch, self._start
+            )
+            # Stop the worker if the iterator is dropped before it is exhausted
+            weakref.finalize(self, self._prefetcher.stop)
+        try:
+            page = self._prefetcher.get()
+        except BaseException:
+            self.close()
+            raise
+        if page is None:
+            self._prefetcher = None
+            self._done = True
+            return
+        self._next_link = page.next_link
+        self._continuation_token = page.continuation_token
+        self._page_items = map(self._convert, page.items)
+        self._page_open = True
 
+    def _fetch_page(self, is_initial: bool = False):
+        if not self._stream:
+            page = self._request.fetch(
+                self._next_link, self._continuation_token, initial=is_initial
+            )
+            self._next_link = page.next_link
+            self._continuation_token = page.continuation_token
+            self._page_items = map(self._convert, page.items)
+            self._page_open = True
+            return
+
+        response = self._request.send(
+            self._next_link,
+            self._continuation_token,
+            initial=is_initial,
+            stream=True,
+        )
         # Check for continuation token in headers
         token = response.headers.get("x-ms-continuation")
         self._continuation_token = token if token else None
+        self._next_link = None
+        self._page_parser = PageStreamParser(
+            self._request.items_key, self._client.json_codec
+        )
+        self._page_items = _stream_page(response, self._page_parser, self._convert)
+        self._page_open = True
+
 
-        # Check for nextLink in body
-        self._next_link = data.get("nextLink")
+def _item_converter(model_cls: Optional[Type[T]]) -> Callable[[Any], T]:
+    if model_cls and hasattr(model_cls, "from_dict"):
+        return model_cls.from_dict  # type: ignore
+    return lambda raw_item: raw_item
 
-        # If continuationToken is in body (legacy or specific APIs)
-        if not self._continuation_token:
-            token = data.get("continuationToken")
-            self._continuation_token = token if token else None
 
-        raw_items = data.get(self._items_key, [])
-        if self._model_cls and hasattr(self._model_cls, "from_dict"):
-            self._current_page_items = [self._model_cls.from_dict(i) for i in raw_items]  # type: ignore
+def _stream_page(
+    response: HttpResponse, parser: PageStreamParser, convert: Callable[[Any], T]
+) -> Iterator[T]:
+    # Kept free of references to the iterator, so that dropping an unfinished
+    # iterator closes this generator and releases the connection right away
+    try:
+        if response.stream is None:
+            chunks: Iterator[bytes] = iter((response.content,))
         else:
-            self._current_page_items = raw_items  # type: ignore
+            chunks = response.stream  # type: ignore[assignment]
+        for chunk in chunks:
+            for raw_item in parser.feed(chunk):
+                yield convert(raw_item)
+        response.stream = None
+        tail = parser.close()
+    finally:
+        # Releases the connection if the page was abandoned
+        response.close()
+    for raw_item in tail:
+        yield convert(raw_item)
+
+
+class _PartitionScanner:
+    """
+    Scans the partitions of a query on worker threads and merges their pages.
 
-        self._current_page_index = 0
+    Each worker takes the next unscanned partition and follows its
+    continuation chain. At most ``buffer`` pages are fetched but not yet
+    taken by ``get``, across all partitions. Holds no reference to the
+    iterator it serves.
+    """
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        queries: List[str],
+        concurrency: int,
+        buffer: int,
+        stats: ParallelScanStats,
+        kwargs: Dict[str, Any],
+    ):
+        self._client = client
+        self._queries = queries
+        self._stats = stats
+        self._kwargs = kwargs
+        self._next = 0
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(buffer)
+        self._pages: "queue.Queue[Any]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._workers = min(concurrency, len(queries))
+        self._finished = 0
+        for i in range(self._workers):
+            threading.Thread(
+                target=self._run, name=f"konnektr-graph-scan-{i}", daemon=True
+            ).start()
+
+    def _take(self) -> Optional[int]:
+        with self._lock:
+            if self._stopped.is_set() or self._next >= len(self._queries):
+                return None
+            self._next += 1
+            return self._next - 1
+
+    def _run(self) -> None:
+        try:
+            index = self._take()
+            while index is not None:
+                self._stats._start(index)
+                try:
+                    self._scan(index)
+                except BaseException:
+                    self._stats._finish(index, failed=True)
+                    raise
+                self._stats._finish(index)
+                index = self._take()
+        except BaseException as e:
+            self._pages.put(e)
+            return
+        self._pages.put(None)
+
+    def _scan(self, index: int) -> None:
+        pages = self._client.query_twins(
+            self._queries[index], **self._kwargs
+        ).by_page()
+        try:
+            while True:
+                self._slots.acquire()
+                if self._stopped.is_set():
+                    return
+                page = next(pages, None)
+                if page is None:
+                    self._slots.release()
+                    return
+                self._stats._page(index, len(page.items))
+                self._pages.put(page.items)
+        finally:
+            pages.close()
+
+    def get(self) -> Optional[List[Any]]:
+        """Take the items of the next page, or None after the last page."""
+        while True:
+            entry = self._pages.get()
+            if isinstance(entry, BaseException):
+                raise entry
+            if entry is not None:
+                self._slots.release()
+                return entry
+            self._finished += 1
+            if self._finished == self._workers:
+                return None
+
+    def stop(self) -> None:
+        """Stop scanning. Requests already in flight are completed and dropped."""
+        self._stopped.set()
+        for _ in range(self._workers):
+            self._slots.release()
+
+
+class ParallelQueryIterator(Iterator[Dict[str, Any]]):
+    """
+    Iterator over the merged results of a query scanned in disjoint partitions.
+
+    Results arrive in no particular order. Per-partition progress and
+    throughput are available from ``stats``.
+    """
+
+    def __init__(
+        self,
+        client: "KonnektrGraphClient",
+        query_expression: QueryExpression,
+        partitions: Optional[Sequence[str]] = None,
+        max_concurrency: int = 4,
+        buffer_pages: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the parallel query iterator.
+
+        Args:
+            client: The KonnektrGraphClient instance.
+            query_expression: The query expression.
+            partitions: Partition predicates, see ``konnektr_graph.scan``. None
+                partitions by exact model, using the models from ``list_models``,
+                plus one partition for the twins of unlisted models.
+            max_concurrency: Maximum number of partitions scanned at once.
+                Defaults to 4.
+            buffer_pages: Maximum number of pages fetched ahead of the
+                consumer. Defaults to twice ``max_concurrency``.
+            **kwargs: Options passed to ``query_twins`` for each partition.
+
+        Raises:
+            ValueError: If the query cannot be partitioned.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._client = client
+        self._query = query_expression
+        self._queries: Optional[List[str]] = None
+        self._max_concurrency = max_concurrency
+        self._buffer_pages = buffer_pages or 2 * max_concurrency
+        self._kwargs = kwargs
+        self._scanner: Optional[_PartitionScanner] = None
+        self._page_items: Iterator[Dict[str, Any]] = iter(())
+        self._done = False
+        self.stats = ParallelScanStats()
+        if partitions is not None:
+            self._set_partitions(partitions)
+
+    def _set_partitions(self, partitions: Sequence[str]) -> None:
+        self._queries = [partition_query(self._query, p) for p in partitions]
+        self.stats._set_partitions(partitions)
+
+    def __iter__(self) -> "ParallelQueryIterator":
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        while True:
+            for item in self._page_items:
+                return item
+            if self._done:
+                raise StopIteration
+            try:
+                if self._scanner is None:
+                    self._start()
+                items = self._scanner.get() if self._scanner is not None else None
+            except BaseException:
+                self.close()
+                raise
+            if items is None:
+                self._scanner = None
+                self._done = True
+                raise StopIteration
+            self._page_items = iter(items)
+
+    def _start(self) -> None:
+        if self._queries is None:
+            model_ids = [model.id for model in self._client.list_models()]
+            self._set_partitions(model_partitions(model_ids, query_alias(self._query)))
+        if not self._queries:
+            return
+        self._scanner = _PartitionScanner(
+            self._client,
+            self._queries,  # type: ignore[arg-type]
+            self._max_concurrency,
+            self._buffer_pages,
+            self.stats,
+            self._kwargs,
+        )
+        # Stop the workers if the iterator is dropped before it is exhausted
+        weakref.finalize(self, self._scanner.stop)
+
+    def close(self) -> None:
+        """Stop iterating and stop scanning the remaining partitions."""
+        if self._scanner is not None:
+            self._scanner.stop()
+            self._scanner = None
+        self._page_items = iter(())
+        self._done = True
+
+
+def _relationship_key(relationship: BasicRelationship) -> str:
+    return f"{relationship.sourceId}/{relationship.relationshipId}"
 
 
 class KonnektrGraphClient:
 
-    def __init__(self, endpoint: str, credential: TokenProvider):
+    def __init__(
+        self,
+        endpoint: str,
+        credential: TokenProvider,
+        *,
+        transport: Optional[Transport] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        compression: Optional[CompressionPolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
         """
         Initialize the Konnektr Graph Client.
 
+        By default the client sends requests through a RequestsTransport that owns
+        a pooled ``requests.Session``, so connections are reused across calls. Use
+        the client as a context manager or call ``close()`` to release them.
+
         Args:
             endpoint: API endpoint (e.g. https://graph.konnektr.io)
             credential: TokenProvider credential for authentication.
+            transport: Optional transport to send requests through. When given, the
+                session and pool options below are ignored and the transport is
+                not closed by the client.
+            session: Optional externally managed session for the default transport.
+                When given, the pool options below are ignored and the session is
+                not closed by the client.
+            pool_connections: Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize: Maximum number of connections kept per host. Defaults to 10.
+            pool_block: Whether to block when the pool is exhausted instead of
+                opening extra, non-pooled connections. Defaults to False.
+            keep_alive: Whether to keep connections open between requests. Defaults to True.
+            http2: Whether to use an HttpxTransport that multiplexes requests over
+                HTTP/2 instead of the default transport. Requires the ``http2``
+                extra. ``pool_maxsize`` caps its connections. Defaults to False.
+            retry_policy: Policy for retrying throttled and failed requests. Defaults
+                to a RetryPolicy that retries idempotent requests up to 3 times.
+            rate_limiter: Optional RateLimiter consulted before every attempt. Share
+                one instance between clients to enforce an aggregate rate.
+            circuit_breaker: Optional CircuitBreakerPolicy. When the circuit for an
+                endpoint and operation class is open, calls fail fast with
+                CircuitOpenError instead of being sent.
+            compression: Policy for compressed responses and request bodies.
+                Defaults to a CompressionPolicy that accepts gzip and deflate
+                (and brotli when installed) but does not compress requests.
+            json_codec: Codec for request and response bodies. Defaults to the
+                fastest installed one (orjson, msgspec, then the standard library).
         """
         if not endpoint.startswith("http"):
             endpoint = "https://" + endpoint
         self.endpoint = endpoint.rstrip("/")
         self.credential = credential
+        self._owns_transport = transport is None
+        if transport is None and http2:
+            transport = HttpxTransport(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            )
+        elif transport is None:
+            transport = RequestsTransport(
+                session=session,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        self._transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.compression = compression or CompressionPolicy()
+        self.json_codec = json_codec or get_json_codec()
+
+    def __enter__(self) -> "KonnektrGraphClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the client transport and release pooled connections."""
+        if self._owns_transport:
+            self._transport.close()
+
+    def _send_once(self, request: HttpRequest) -> HttpResponse:
+        """Send a single attempt through the per-attempt policies and the transport."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request.operation_class)
+        if self.circuit_breaker is None:
+            return self._transport.send(request)
+
+        # Acquired last, right before sending, so that no wait holds a probe slot
+        circuit = self.circuit_breaker.get_circuit(request)
+        probe = circuit.acquire()
+        started = time.monotonic()
+        status_code: Optional[int] = None
+        cancelled = False
+        try:
+            response = self._transport.send(request)
+            status_code = response.status_code
+            return response
+        except ServiceRequestError:
+            raise
+        except BaseException:
+            cancelled = True
+            raise
+        finally:
+            circuit.record(
+                time.monotonic() - started,
+                status_code,
+                cancelled=cancelled,
+                probe=probe,
+            )
 
     def _request(
         self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
-    ) -> requests.Response:
-        if headers is None:
-            headers = {}
-        headers.update(self.credential.get_headers())
-
-        # Ensure content type is set if json body is present and not set
-        if "json" in kwargs and "Content-Type" not in headers:
-            headers["Content-Type"] = "application/json"
-
-        response = requests.request(method, url, headers=headers, **kwargs)
-
-        if not response.ok:
-            self._handle_error(response)
-
-        return response
-
-    def _handle_error(self, response: requests.Response):
-        try:
-            error_data = response.json()
-            message = json.dumps(error_data)
-        except ValueError:
-            message = response.text
-
-        status_code = response.status_code
-        if status_code == 404:
-            raise ResourceNotFoundError(message, status_code)
-        elif status_code == 409:
-            raise ResourceExistsError(message, status_code)
-        elif status_code in (401, 403):
-            raise AuthenticationError(message, status_code)
-        else:
-            raise HttpResponseError(f"Error {status_code}: {message}", status_code)
+    ) -> HttpResponse:
+        request = build_request(
+            method,
+            url,
+            headers=headers,
+            auth_headers=self.credential.get_headers(),
+            json_codec=self.json_codec,
+            **kwargs,
+        )
+        self.compression.prepare_request(request)
+        policy = self.retry_policy
+        policy.record_request()
+        attempt = 0
+        while True:
+            try:
+                response = self._send_once(request)
+            except ServiceRequestError as error:
+                delay = policy.next_delay(request, attempt, error=error)
+                if delay is None:
+                    raise
+            else:
+                self.compression.decode_response(response)
+                response.json_codec = self.json_codec
+                if response.ok:
+                    return response
+                response.read()
+                delay = policy.next_delay(request, attempt, response=response)
+                if delay is None:
+                    raise_for_response(response)
+            time.sleep(delay)  # type: ignore
+            attempt += 1
 
     # --- Digital Twins ---
 
@@ -226,6 +870,50 @@ class KonnektrGraphClient:
         response = self._request("GET", url)
         return BasicDigitalTwin.from_dict(response.json())
 
+    def get_digital_twins(
+        self,
+        digital_twin_ids: Iterable[DigitalTwinId],
+        max_concurrency: int = 4,
+        max_ids_per_query: int = 100,
+        max_query_length: int = 8000,
+        **kwargs: Any,
+    ) -> DigitalTwinsLookup:
+        """
+        Get many digital twins by ID with a few queries instead of one request
+        per twin.
+
+        The IDs are split into ``$dtId IN [...]`` queries that stay under the
+        query length limit, and the queries are run concurrently on a pool of
+        threads.
+
+        Args:
+            digital_twin_ids: The IDs of the digital twins.
+            max_concurrency: Maximum number of queries run at once.
+            max_ids_per_query: Maximum number of IDs per query.
+            max_query_length: Maximum length of a query in characters.
+            **kwargs: Additional options for each ``query_twins`` call.
+
+        Returns:
+            The twins found, keyed by ID, and the IDs that were not found.
+        """
+        ids = list(dict.fromkeys(digital_twin_ids))
+        queries = id_lookup_queries(ids, max_ids_per_query, max_query_length)
+
+        def run(query: str) -> List[Dict[str, Any]]:
+            return list(self.query_twins(query, **kwargs))
+
+        found: Dict[DigitalTwinId, BasicDigitalTwin] = {}
+        if queries:
+            workers = min(max_concurrency, len(queries))
+            with ThreadPoolExecutor(workers, "konnektr-graph-get") as executor:
+                for results in executor.map(run, queries):
+                    for data in results:
+                        found[data["$dtId"]] = BasicDigitalTwin.from_dict(data)
+        return DigitalTwinsLookup(
+            twins={i: found[i] for i in ids if i in found},
+            missing=[i for i in ids if i not in found],
+        )
+
     def upsert_digital_twin(
         self,
         digital_twin_id: DigitalTwinId,
@@ -247,6 +935,44 @@ class KonnektrGraphClient:
         response = self._request("PUT", url, json=digital_twin.to_dict(), **kwargs)
         return BasicDigitalTwin.from_dict(response.json())
 
+    def bulk_upsert_digital_twins(
+        self,
+        digital_twins: Iterable[BasicDigitalTwin],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> BulkResults:
+        """
+        Create or update many digital twins concurrently on a pool of threads.
+
+        The input is consumed lazily, so it can be a generator over a large
+        file, and the results are streamed as the upserts complete. A failing
+        twin is reported in its result and does not stop the others. Size the
+        connection pool (``pool_maxsize``) to at least ``max_workers``.
+
+        Args:
+            digital_twins: The digital twins to create or update.
+            max_workers: Number of threads sending requests.
+            max_in_flight: Maximum number of twins read from the input but not
+                yet returned as results. Defaults to twice ``max_workers``.
+            **kwargs: Additional request options for each upsert.
+
+        Returns:
+            An iterator over the per-twin results, in completion order, with
+            success and latency counters in ``stats``. The upserts only make
+            progress while it is iterated.
+        """
+        stats = BulkStats()
+        results = iter_threaded(
+            lambda twin: self.upsert_digital_twin(twin.dtId, twin, **kwargs),
+            digital_twins,
+            key=lambda twin: twin.dtId,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight or 2 * max_workers,
+            stats=stats,
+        )
+        return BulkResults(results, stats)
+
     def update_digital_twin(
         self,
         digital_twin_id: DigitalTwinId,
@@ -281,6 +1007,268 @@ class KonnektrGraphClient:
         url = f"{self.endpoint}/digitaltwins/{digital_twin_id}"
         self._request("DELETE", url, **kwargs)
 
+    def delete_subtree(
+        self,
+        root_id: DigitalTwinId,
+        relationship_names: Optional[Iterable[RelationshipName]] = None,
+        max_workers: int = 8,
+        dry_run: bool = False,
+        **kwargs: Any,
+    ) -> SubtreeDeleteResult:
+        """
+        Delete a twin and every twin below it, such as a building with its
+        floors, rooms and devices.
+
+        The subtree is discovered level by level, listing the relationships of
+        all twins of a level concurrently. Then every relationship from or to a
+        twin of the subtree is deleted in parallel, including relationships
+        from twins outside it. Finally the twins are deleted in leaf-first
+        waves. Twins and relationships that are already gone count as deleted,
+        so an interrupted delete can be run again.
+
+        Args:
+            root_id: The ID of the root twin of the subtree.
+            relationship_names: Names of the relationships to descend, such as
+                ``["contains"]``. None descends all outgoing relationships.
+            max_workers: Number of threads sending requests.
+            dry_run: Only discover the subtree and return the plan.
+            **kwargs: Additional request options for each delete, such as
+                ``timeout``. Only ``headers`` also apply to the listings.
+
+        Returns:
+            The deletion waves, the relationships and the outcome. Deletion
+            stops after the first phase or wave with a failure.
+        """
+        names = set(relationship_names) if relationship_names is not None else None
+        children: Dict[DigitalTwinId, Set[DigitalTwinId]] = {}
+        edges: Dict[Tuple[DigitalTwinId, RelationshipId], BasicRelationship] = {}
+        base_headers = kwargs.pop("headers", None) or {}
+
+        def discover(twin_id: DigitalTwinId):
+            outgoing = list(
+                self.list_relationships(twin_id, headers=dict(base_headers))
+            )
+            incoming = list(
+                self.list_incoming_relationships(twin_id, headers=dict(base_headers))
+            )
+            return twin_id, outgoing, incoming
+
+        frontier = [root_id]
+        children[root_id] = set()
+        with ThreadPoolExecutor(max_workers, "konnektr-graph-discover") as executor:
+            while frontier:
+                level, frontier = frontier, []
+                for twin_id, outgoing, incoming in executor.map(discover, level):
+                    for relationship in outgoing:
+                        edges[(twin_id, relationship.relationshipId)] = relationship
+                        if names is None or relationship.relationshipName in names:
+                            target = relationship.targetId
+                            children[twin_id].add(target)
+                            if target not in children:
+                                children[target] = set()
+                                frontier.append(target)
+                    for relationship in incoming:
+                        relationship = incoming_relationship(relationship, twin_id)
+                        edges[(relationship.sourceId, relationship.relationshipId)] = (
+                            relationship
+                        )
+
+        result = SubtreeDeleteResult(
+            waves=leaf_first_waves(children),
+            relationships=list(edges.values()),
+            dry_run=dry_run,
+        )
+        if dry_run:
+            return result
+
+        def delete_relationship(relationship: BasicRelationship) -> None:
+            try:
+                self.delete_relationship(
+                    relationship.sourceId,
+                    relationship.relationshipId,
+                    headers=dict(base_headers),
+                    **kwargs,
+                )
+            except ResourceNotFoundError:
+                pass
+
+        def delete_twin(twin_id: DigitalTwinId) -> None:
+            try:
+                self.delete_digital_twin(twin_id, headers=dict(base_headers), **kwargs)
+            except ResourceNotFoundError:
+                pass
+
+        for outcome in iter_threaded(
+            delete_relationship,
+            result.relationships,
+            key=_relationship_key,
+            max_workers=max_workers,
+            max_in_flight=2 * max_workers,
+            stats=BulkStats(),
+        ):
+            if outcome.ok:
+                result.deleted_relationships += 1
+            else:
+                result.failures.append(outcome)
+        for wave in result.waves:
+            if result.failures:
+                break
+            for outcome in iter_threaded(
+                delete_twin,
+                wave,
+                key=lambda twin_id: twin_id,
+                max_workers=max_workers,
+                max_in_flight=2 * max_workers,
+                stats=BulkStats(),
+            ):
+                if outcome.ok:
+                    result.deleted_twins += 1
+                else:
+                    result.failures.append(outcome)
+        return result
+
+    def update_twins_where(
+        self,
+        query_expression: QueryExpression,
+        json_patch: List[JsonPatchOperation],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        match_etag: bool = False,
+        **kwargs: Any,
+    ) -> BulkResults:
+        """
+        Apply a JSON patch to every twin matching a query.
+
+        The query results are streamed into concurrent updates, so memory use
+        does not grow with the number of matches. A failing update is reported
+        in its result and does not stop the others.
+
+        Args:
+            query_expression: A query selecting twins, such as
+                ``SELECT * FROM DIGITALTWINS T WHERE T.status = 'stale'``.
+            json_patch: The JSON patch to apply to each twin.
+            max_workers: Number of threads sending updates.
+            max_in_flight: Maximum number of matched twins not yet returned as
+                results. Defaults to twice ``max_workers``.
+            match_etag: Send each twin's ``$etag`` from the query as
+                ``If-Match``, so a twin changed since it was matched is not
+                updated and fails with status 412.
+            **kwargs: Additional request options for each update, such as
+                ``timeout``. Only ``headers`` also apply to the query.
+
+        Returns:
+            An iterator over the per-twin results, keyed by twin ID, with
+            ``read`` (twins matched so far), success and latency counters in
+            ``stats``. The updates only make progress while it is iterated.
+
+        Raises:
+            ValueError: While iterating, if a query result is not a twin.
+        """
+        base_headers = kwargs.pop("headers", None) or {}
+
+        def update(twin: Dict[str, Any]) -> None:
+            headers = dict(base_headers)
+            if match_etag:
+                headers["If-Match"] = twin["$etag"]
+            self.update_digital_twin(
+                twin["$dtId"], json_patch, headers=headers, **kwargs
+            )
+
+        rows = self.query_twins(query_expression, headers=dict(base_headers))
+        stats = BulkStats()
+        results = iter_threaded(
+            update,
+            (matched_twin(row, match_etag) for row in rows),
+            key=lambda twin: twin["$dtId"],
+            max_workers=max_workers,
+            max_in_flight=max_in_flight or 2 * max_workers,
+            stats=stats,
+        )
+        return BulkResults(results, stats)
+
+    def delete_twins_where(
+        self,
+        query_expression: QueryExpression,
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        match_etag: bool = False,
+        delete_relationships: bool = False,
+        **kwargs: Any,
+    ) -> BulkResults:
+        """
+        Delete every twin matching a query.
+
+        The query results are streamed into concurrent deletes, so memory use
+        does not grow with the number of matches. Twins that are already gone
+        count as deleted. A twin that still has relationships cannot be
+        deleted, unless ``delete_relationships`` is set.
+
+        Args:
+            query_expression: A query selecting twins, such as
+                ``SELECT * FROM DIGITALTWINS T WHERE T.decommissioned = true``.
+            max_workers: Number of threads sending deletes.
+            max_in_flight: Maximum number of matched twins not yet returned as
+                results. Defaults to twice ``max_workers``.
+            match_etag: Send each twin's ``$etag`` from the query as
+                ``If-Match``, so a twin changed since it was matched is not
+                deleted and fails with status 412.
+            delete_relationships: First delete the relationships from and to
+                each twin.
+            **kwargs: Additional request options for each delete, such as
+                ``timeout``. Only ``headers`` also apply to the query.
+
+        Returns:
+            An iterator over the per-twin results, keyed by twin ID, with
+            ``read`` (twins matched so far), success and latency counters in
+            ``stats``. The deletes only make progress while it is iterated.
+
+        Raises:
+            ValueError: While iterating, if a query result is not a twin.
+        """
+        base_headers = kwargs.pop("headers", None) or {}
+
+        def delete(twin: Dict[str, Any]) -> None:
+            twin_id = twin["$dtId"]
+            if delete_relationships:
+                relationships = list(
+                    self.list_relationships(twin_id, headers=dict(base_headers))
+                )
+                relationships.extend(
+                    incoming_relationship(relationship, twin_id)
+                    for relationship in self.list_incoming_relationships(
+                        twin_id, headers=dict(base_headers)
+                    )
+                )
+                for relationship in relationships:
+                    try:
+                        self.delete_relationship(
+                            relationship.sourceId,
+                            relationship.relationshipId,
+                            headers=dict(base_headers),
+                            **kwargs,
+                        )
+                    except ResourceNotFoundError:
+                        pass
+            headers = dict(base_headers)
+            if match_etag:
+                headers["If-Match"] = twin["$etag"]
+            try:
+                self.delete_digital_twin(twin_id, headers=headers, **kwargs)
+            except ResourceNotFoundError:
+                pass
+
+        rows = self.query_twins(query_expression, headers=dict(base_headers))
+        stats = BulkStats()
+        results = iter_threaded(
+            delete,
+            (matched_twin(row, match_etag) for row in rows),
+            key=lambda twin: twin["$dtId"],
+            max_workers=max_workers,
+            max_in_flight=max_in_flight or 2 * max_workers,
+            stats=stats,
+        )
+        return BulkResults(results, stats)
+
     # --- Components ---
 
     def get_component(
@@ -417,6 +1405,7 @@ class KonnektrGraphClient:
         self,
         digital_twin_id: DigitalTwinId,
         relationship_name: Optional[RelationshipName] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> PagedIterator[BasicRelationship]:
         """
@@ -425,6 +1414,8 @@ class KonnektrGraphClient:
         Args:
             digital_twin_id: The ID of the digital twin.
             relationship_name: Optional name of the relationship to filter by.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -436,7 +1427,12 @@ class KonnektrGraphClient:
             params["relationshipName"] = relationship_name
 
         return PagedIterator(
-            self, url, params=params, model_cls=BasicRelationship, **kwargs
+            self,
+            url,
+            params=params,
+            model_cls=BasicRelationship,
+            continuation=continuation,
+            **kwargs,
         )
 
     def list_incoming_relationships(
@@ -455,12 +1451,106 @@ class KonnektrGraphClient:
         url = f"{self.endpoint}/digitaltwins/{digital_twin_id}/incomingrelationships"
         return PagedIterator(self, url, model_cls=BasicRelationship, **kwargs)
 
+    def bulk_upsert_relationships(
+        self,
+        relationships: Iterable[BasicRelationship],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> BulkResults:
+        """
+        Create or update many relationships concurrently on a pool of threads.
+
+        Relationships are grouped by ``sourceId``: those of one source twin are
+        sent one at a time in input order, while different sources proceed in
+        parallel. Throughput therefore comes from having many distinct sources
+        within the ``max_in_flight`` window; interleave large single-source
+        inputs with other sources where possible. Size the connection pool
+        (``pool_maxsize``) to at least ``max_workers``.
+
+        Args:
+            relationships: The relationships to create or update, consumed
+                lazily.
+            max_workers: Number of threads sending requests.
+            max_in_flight: Maximum number of relationships read from the input
+                but not yet returned as results. Defaults to four times
+                ``max_workers``.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            An iterator over the per-relationship results, in completion order,
+            with success and latency counters in ``stats``. The upserts only
+            make progress while it is iterated.
+        """
+        stats = BulkStats()
+        results = iter_threaded(
+            lambda relationship: self.upsert_relationship(
+                relationship.sourceId,
+                relationship.relationshipId,
+                relationship,
+                **kwargs,
+            ),
+            relationships,
+            key=_relationship_key,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight or 4 * max_workers,
+            stats=stats,
+            group=lambda relationship: relationship.sourceId,
+        )
+        return BulkResults(results, stats)
+
+    def bulk_delete_relationships(
+        self,
+        relationships: Iterable[BasicRelationship],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> BulkResults:
+        """
+        Delete many relationships concurrently on a pool of threads.
+
+        Relationships are grouped by ``sourceId``: those of one source twin are
+        sent one at a time in input order, while different sources proceed in
+        parallel. Throughput therefore comes from having many distinct sources
+        within the ``max_in_flight`` window; interleave large single-source
+        inputs with other sources where possible. Size the connection pool
+        (``pool_maxsize``) to at least ``max_workers``.
+
+        Args:
+            relationships: The relationships to delete; only ``sourceId`` and
+                ``relationshipId`` are used. Consumed lazily.
+            max_workers: Number of threads sending requests.
+            max_in_flight: Maximum number of relationships read from the input
+                but not yet returned as results. Defaults to four times
+                ``max_workers``.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            An iterator over the per-relationship results, in completion order,
+            with success and latency counters in ``stats``. The deletes only
+            make progress while it is iterated.
+        """
+        stats = BulkStats()
+        results = iter_threaded(
+            lambda relationship: self.delete_relationship(
+                relationship.sourceId, relationship.relationshipId, **kwargs
+            ),
+            relationships,
+            key=_relationship_key,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight or 4 * max_workers,
+            stats=stats,
+            group=lambda relationship: relationship.sourceId,
+        )
+        return BulkResults(results, stats)
+
     # --- Query ---
 
     def query_twins(
         self,
         query_expression: QueryExpression,
         max_items_per_page: Optional[int] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> PagedIterator[Dict[str, Any]]:
         """
@@ -469,6 +1559,8 @@ class KonnektrGraphClient:
         Args:
             query_expression: The query expression.
             max_items_per_page: Optional maximum items per page.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -482,7 +1574,56 @@ class KonnektrGraphClient:
         body = {"query": query_expression}
 
         return PagedIterator(
-            self, url, method="POST", json_data=body, headers=headers, **kwargs
+            self,
+            url,
+            method="POST",
+            json_data=body,
+            headers=headers,
+            continuation=continuation,
+            **kwargs,
+        )
+
+    def query_twins_parallel(
+        self,
+        query_expression: QueryExpression,
+        partitions: Optional[Sequence[str]] = None,
+        max_concurrency: int = 4,
+        **kwargs: Any,
+    ) -> ParallelQueryIterator:
+        """
+        Query digital twins by scanning disjoint partitions of the query
+        concurrently on a pool of threads.
+
+        Each partition adds a predicate to the query's WHERE clause and follows
+        its own continuation chain, so a full-graph export can use several
+        connections at once. Build partitions with ``model_partitions``,
+        ``id_range_partitions`` or ``id_prefix_partitions`` from
+        ``konnektr_graph.scan``. Size the connection pool (``pool_maxsize``)
+        to at least ``max_concurrency``.
+
+        Args:
+            query_expression: The query expression. TOP and COUNT queries
+                cannot be partitioned.
+            partitions: Partition predicates. None partitions by exact model,
+                using the models from ``list_models``, plus one partition for
+                the twins of unlisted models such as deleted ones.
+            max_concurrency: Maximum number of partitions scanned at once.
+            **kwargs: Additional options for the iterator (``buffer_pages``)
+                and for each partition's ``query_twins`` call.
+
+        Returns:
+            An iterator over the merged query results, in no particular order,
+            with per-partition throughput in ``stats``.
+
+        Raises:
+            ValueError: If the query cannot be partitioned.
+        """
+        return ParallelQueryIterator(
+            self,
+            query_expression,
+            partitions=partitions,
+            max_concurrency=max_concurrency,
+            **kwargs,
         )
 
     # --- Models ---
@@ -516,6 +1657,7 @@ class KonnektrGraphClient:
         dependencies_for: Optional[Union[ModelId, List[ModelId]]] = None,
         include_model_definition: bool = False,
         results_per_page: Optional[int] = None,
+        continuation: Optional[Continuation] = None,
         **kwargs: Any,
     ) -> PagedIterator[DigitalTwinsModelData]:
         """
@@ -525,6 +1667,8 @@ class KonnektrGraphClient:
             dependencies_for: Optional model ID or list of model IDs to get dependencies for.
             include_model_definition: Whether to include the model definition.
             results_per_page: Optional maximum items per page.
+            continuation: Optional checkpoint to resume an earlier scan from,
+                taken from the iterator's ``continuation``.
             **kwargs: Additional request options.
 
         Returns:
@@ -552,6 +1696,7 @@ class KonnektrGraphClient:
             params=params,
             headers=headers,
             model_cls=DigitalTwinsModelData,
+            continuation=continuation,
             **kwargs,
         )
 
@@ -619,6 +1764,7 @@ class KonnektrGraphClient:
         """
         url = f"{self.endpoint}/models/search"
         body = {"searchText": search_text, "limit": limit}
+        kwargs.setdefault("idempotent", True)
         response = self._request("POST", url, json=body, **kwargs)
         return response.json()
 
@@ -643,6 +1789,7 @@ class KonnektrGraphClient:
         """
         url = f"{self.endpoint}/digitaltwins/search"
         body = {"searchText": search_text, "limit": limit}
+        kwargs.setdefault("idempotent", True)
         if model_id:
             body["modelId"] = model_id
         response = self._request("POST", url, json=body, **kwargs)
@@ -670,6 +1817,8 @@ class KonnektrGraphClient:
         headers = kwargs.pop("headers", {})
         if message_id:
             headers["Message-Id"] = message_id
+        # Retrying is only safe when the service can deduplicate by Message-Id
+        kwargs.setdefault("idempotent", bool(message_id))
 
         self._request("POST", url, json=telemetry, headers=headers, **kwargs)
 
@@ -695,6 +1844,8 @@ class KonnektrGraphClient:
         headers = kwargs.pop("headers", {})
         if message_id:
             headers["Message-Id"] = message_id
+        # Retrying is only safe when the service can deduplicate by Message-Id
+        kwargs.setdefault("idempotent", bool(message_id))
 
         self._request("POST", url, json=telemetry, headers=headers, **kwargs)
 
@@ -772,6 +1923,121 @@ class KonnektrGraphClient:
         response = self._request("POST", url, **kwargs)
         return ImportJob.from_dict(response.json())
 
+    def bulk_write(
+        self,
+        twins: Sequence[BasicDigitalTwin] = (),
+        relationships: Sequence[BasicRelationship] = (),
+        models: Sequence[DtdlInterface] = (),
+        blob_store: Optional[BlobStore] = None,
+        import_threshold: int = 10000,
+        job_id: Optional[JobId] = None,
+        max_workers: int = 8,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BulkWriteResult:
+        """
+        Write a batch of models, twins and relationships, picking the faster
+        path for its size.
+
+        Batches smaller than ``import_threshold`` items are written with
+        concurrent requests: first the models, then the twins, then the
+        relationships. Larger batches are written as an import file to
+        ``blob_store`` as gzip-compressed NDJSON and loaded with an import job,
+        which this method waits for. Without a ``blob_store`` every batch is
+        written with requests, and a ``UserWarning`` is issued for batches of
+        ``import_threshold`` items or more.
+
+        Args:
+            twins: The digital twins to create or replace.
+            relationships: The relationships to create or replace.
+            models: The models to create, in dependency order. Models that
+                already exist are skipped in REST mode.
+            blob_store: Storage the import file is uploaded to. Required for
+                import mode.
+            import_threshold: Number of items from which an import job is used.
+            job_id: ID of the import job. Defaults to a random ID.
+            max_workers: Number of threads sending requests in REST mode.
+            poll_interval: Seconds before the first poll of the import job.
+                Later polls back off, as in ``wait_for_jobs``.
+            timeout: Maximum seconds to wait for the import job.
+            **kwargs: Additional request options for each request.
+
+        Returns:
+            The mode used and its outcome: the failed requests, or the finished
+            import job.
+
+        Raises:
+            TimeoutError: If the import job does not finish within ``timeout``.
+        """
+        result = BulkWriteResult(
+            mode="rest",
+            models=len(models),
+            twins=len(twins),
+            relationships=len(relationships),
+        )
+        size = result.models + result.twins + result.relationships
+        if blob_store is None and size >= import_threshold:
+            warnings.warn(
+                f"bulk_write of {size} items is sent as requests because no "
+                "blob_store was given for an import job",
+                stacklevel=2,
+            )
+        if blob_store is not None and size >= import_threshold:
+            result.mode = "import"
+            job_id = job_id or f"bulk-write-{uuid.uuid4().hex}"
+            input_uri = blob_store.upload(
+                f"{job_id}.ndjson.gz",
+                import_file_chunks(
+                    models, twins, relationships, json_codec=self.json_codec
+                ),
+            )
+            created = self.create_import_job(
+                job_id,
+                {
+                    "inputBlobUri": input_uri,
+                    "outputBlobUri": blob_store.uri(f"{job_id}.output.ndjson"),
+                },
+                **kwargs,
+            )
+            for finished in self.wait_for_jobs(
+                [created], timeout, initial_interval=poll_interval, **kwargs
+            ):
+                if isinstance(finished, ImportJob):
+                    result.job = finished
+            return result
+
+        if models:
+            try:
+                self._create_models_skipping_existing(models, **kwargs)
+            except Exception as e:
+                result.failures.append(BulkItemResult("models", list(models), error=e))
+                return result
+        for outcome in self.bulk_upsert_digital_twins(
+            twins, max_workers=max_workers, **kwargs
+        ):
+            if not outcome.ok:
+                result.failures.append(outcome)
+        for outcome in self.bulk_upsert_relationships(
+            relationships, max_workers=max_workers, **kwargs
+        ):
+            if not outcome.ok:
+                result.failures.append(outcome)
+        return result
+
+    def _create_models_skipping_existing(
+        self, models: Sequence[DtdlInterface], **kwargs: Any
+    ) -> None:
+        try:
+            self.create_models(list(models), **kwargs)
+        except ResourceExistsError:
+            # Some models exist: create the others one at a time
+            for model in models:
+                try:
+                    self.create_models([model], **kwargs)
+                except ResourceExistsError:
+                    pass
+
     # --- Delete Jobs ---
 
     def list_delete_jobs(self, **kwargs: Any) -> PagedIterator[DeleteJob]:
@@ -821,3 +2087,89 @@ class KonnektrGraphClient:
         # ADT usually takes an empty body or optional params
         response = self._request("PUT", url, json=delete_job or {}, **kwargs)
         return DeleteJob.from_dict(response.json())
+
+    # --- Jobs ---
+
+    def wait_for_jobs(
+        self,
+        jobs: Iterable[Union[ImportJob, DeleteJob]],
+        timeout: Optional[float] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> Iterator[Union[ImportJob, DeleteJob]]:
+        """
+        Wait for import and delete jobs to finish, polling them concurrently.
+
+        Each job is polled after ``initial_interval`` seconds, and the interval
+        grows by ``backoff`` after every poll up to ``max_interval``, so short
+        jobs are seen finishing quickly and long ones cost few requests. Jobs
+        that are due at the same time are polled together on a pool of
+        threads, from a single loop, and each is yielded as soon as its own
+        poll returns.
+
+        Args:
+            jobs: The jobs, as returned by ``create_import_job`` or
+                ``create_delete_job``.
+            timeout: Maximum seconds to wait for all jobs.
+            initial_interval: Seconds before the first poll of each job.
+            max_interval: Maximum seconds between polls of a job.
+            backoff: Factor the interval grows by after each poll.
+            max_workers: Maximum number of polls in flight.
+            **kwargs: Additional request options for each poll.
+
+        Yields:
+            Each job once it reaches a terminal status (completed, failed or
+            cancelled), in the order they finish.
+
+        Raises:
+            TimeoutError: If jobs are unfinished after ``timeout`` seconds.
+        """
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        # Unfinished jobs by position, with their next poll time and interval
+        pending: Dict[int, Tuple[Union[ImportJob, DeleteJob], float, float]] = {}
+        for index, job in enumerate(jobs):
+            if job.status in TERMINAL_JOB_STATUSES:
+                yield job
+            else:
+                pending[index] = (job, now + initial_interval, initial_interval)
+
+        def poll(job: Union[ImportJob, DeleteJob]) -> Union[ImportJob, DeleteJob]:
+            if isinstance(job, ImportJob):
+                return self.get_import_job(job.id, **kwargs)
+            return self.get_delete_job(job.id, **kwargs)
+
+        with ThreadPoolExecutor(max_workers, "konnektr-graph-jobs") as executor:
+            while pending:
+                due = min(poll_at for _, poll_at, _ in pending.values())
+                if deadline is not None:
+                    due = min(due, deadline)
+                time.sleep(max(0.0, due - time.monotonic()))
+                now = time.monotonic()
+                indexes = [i for i, (_, at, _) in pending.items() if at <= now]
+                if deadline is not None and now >= deadline:
+                    indexes = list(pending)
+                futures = {executor.submit(poll, pending[i][0]): i for i in indexes}
+                try:
+                    # Each job is handled as soon as its own poll returns
+                    for future in as_completed(futures):
+                        index, job = futures[future], future.result()
+                        if job.status in TERMINAL_JOB_STATUSES:
+                            del pending[index]
+                            yield job
+                        else:
+                            interval = min(pending[index][2] * backoff, max_interval)
+                            poll_at = time.monotonic() + interval
+                            pending[index] = (job, poll_at, interval)
+                finally:
+                    for future in futures:
+                        future.cancel()
+                now = time.monotonic()
+                if pending and deadline is not None and now >= deadline:
+                    unfinished = ", ".join(job.id for job, _, _ in pending.values())
+                    raise TimeoutError(
+                        f"Jobs did not finish within {timeout} seconds: {unfinished}"
+                    )
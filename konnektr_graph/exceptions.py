@@ -41,3 +41,15 @@ class ValidationError(KonnektrGraphError):
     """Raised when input validation fails."""
 
     pass
+
+
+class ServiceRequestError(KonnektrGraphError):
+    """Raised when a request could not be sent or no response was received."""
+
+    pass
+
+
+class CircuitOpenError(KonnektrGraphError):
+    """Raised without sending the request when the circuit for it is open."""
+
+    pass
@@ -0,0 +1,444 @@
+# konnektr_graph/imports.py
+"""
+Import files and the blob storage they are uploaded to for import jobs.
+
+An import job reads an NDJSON file with a header, models, twins and
+relationships section from blob storage. ``ImportFileWriter`` writes the file,
+gzip-compressed, and ``import_file_chunks`` streams it for an upload. A
+``BlobStore`` uploads it; ``LocalBlobStore`` stands in for blob storage in
+tests and local setups.
+"""
+import gzip
+import hashlib
+import io
+import os
+import pathlib
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
+
+from .transport import JsonCodec, get_json_codec
+from .types import BasicDigitalTwin, BasicRelationship, DtdlInterface
+
+IMPORT_FILE_VERSION = "1.0.0"
+
+_SECTIONS = ("Models", "Twins", "Relationships")
+# Lines are compressed in chunks of about this many bytes
+_CHUNK_SIZE = 64 * 1024
+# Items read at a time when streaming a file for an upload
+_BATCH_SIZE = 1000
+
+
+@runtime_checkable
+class BlobStore(Protocol):
+    """Protocol for the storage that import job files are uploaded to."""
+
+    def upload(
+        self, name: str, chunks: Iterable[bytes]
+    ) -> Union[str, Awaitable[str]]:
+        """
+        Upload a blob.
+
+        The asynchronous client also accepts an ``async def`` implementation.
+
+        Args:
+            name: The name of the blob.
+            chunks: The content of the blob.
+
+        Returns:
+            The URI the service reads the blob from.
+        """
+        ...
+
+    def uri(self, name: str) -> str:
+        """Get the URI the service writes a blob to, such as a job's output log."""
+        ...
+
+
+class LocalBlobStore:
+    """
+    Blob store in a local directory.
+
+    :param directory: Directory the blobs are written to, created if missing
+    :param base_uri: URI the service reaches the directory at. Defaults to the
+        directory's ``file://`` URI
+    """
+
+    def __init__(
+        self, directory: Union[str, "os.PathLike[str]"], base_uri: Optional[str] = None
+    ):
+        self.directory = pathlib.Path(directory).resolve()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.base_uri = (base_uri or self.directory.as_uri()).rstrip("/")
+
+    def path(self, name: str) -> pathlib.Path:
+        """Get the local path of a blob."""
+        return self.directory / name
+
+    def upload(self, name: str, chunks: Iterable[bytes]) -> str:
+        """Write a blob and return its URI."""
+        with open(self.path(name), "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return self.uri(name)
+
+    def uri(self, name: str) -> str:
+        """Get the URI of a blob."""
+        return f"{self.base_uri}/{name}"
+
+
+def _header(author: str = "", organization: str = "") -> Dict[str, Any]:
+    return {
+        "fileVersion": IMPORT_FILE_VERSION,
+        "author": author,
+        "organization": organization,
+    }
+
+
+def _twin_line(twin: BasicDigitalTwin) -> Dict[str, Any]:
+    line = twin.to_dict()
+    line.pop("$etag", None)
+    return line
+
+
+def _relationship_line(relationship: BasicRelationship) -> Dict[str, Any]:
+    # Import files key relationships by their source twin's $dtId
+    line: Dict[str, Any] = {
+        "$dtId": relationship.sourceId,
+        "$relationshipId": relationship.relationshipId,
+        "$targetId": relationship.targetId,
+        "$relationshipName": relationship.relationshipName,
+    }
+    line.update(relationship.properties)
+    return line
+
+
+@dataclass
+class ImportFileSummary:
+    """
+    Contents and checksums of a written import file.
+
+    Attributes:
+        counts: Number of items per section: ``models``, ``twins`` and
+            ``relationships``.
+        checksums: SHA-256 hex digest per section of its item lines, before
+            compression, for comparing exports regardless of compression.
+        sha256: SHA-256 hex digest of the file as written, for verifying an
+            upload.
+        size: Size of the file as written, in bytes.
+        uncompressed_size: Size of the NDJSON content, in bytes.
+    """
+
+    counts: Dict[str, int]
+    checksums: Dict[str, str]
+    sha256: str
+    size: int
+    uncompressed_size: int
+
+
+class _HashingWriter:
+    # Counts and hashes the bytes written to the underlying file
+    def __init__(self, raw: IO[bytes]):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        self.size += len(data)
+        self.raw.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
+
+
+class ImportFileWriter:
+    """
+    Streaming writer of import files, gzip-compressed by default.
+
+    Items are serialized and compressed as they are written, so memory use
+    stays constant however large the graph. Sections are written in order,
+    models, twins, then relationships, but each ``write_*`` method can be
+    called repeatedly while its section is current. Sections that are never
+    written are left empty. ``close`` finishes the file and returns its
+    summary. Leaving a ``with`` block with an exception aborts the file
+    instead, so a partial export never looks complete.
+
+    :param file: Path or binary file object to write to. A file object is
+        left open
+    :param compress: Whether to gzip the file
+    :param compresslevel: Gzip compression level, from 1 (fastest) to 9
+    :param json_codec: Codec to serialize the lines with. Defaults to the
+        fastest installed one
+    :param author: Author recorded in the file header
+    :param organization: Organization recorded in the file header
+    """
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", IO[bytes]],
+        compress: bool = True,
+        compresslevel: int = 6,
+        json_codec: Optional[JsonCodec] = None,
+        author: str = "",
+        organization: str = "",
+    ):
+        self._path: Optional[Union[str, "os.PathLike[str]"]] = None
+        if isinstance(file, (str, os.PathLike)):
+            self._raw: IO[bytes] = open(file, "wb")
+            self._path = file
+        else:
+            self._raw = file
+        self._aborted = False
+        self._sink = _HashingWriter(self._raw)
+        self._out: Any = (
+            gzip.GzipFile(
+                fileobj=self._sink, mode="wb", compresslevel=compresslevel, mtime=0
+            )
+            if compress
+            else self._sink
+        )
+        self._codec = json_codec or get_json_codec()
+        self._buffer = bytearray()
+        self._uncompressed_size = 0
+        self._section = -1
+        self._counts = {name: 0 for name in _SECTIONS}
+        self._digests = {name: hashlib.sha256() for name in _SECTIONS}
+        self.summary: Optional[ImportFileSummary] = None
+        self._emit(self._line({"Section": "Header"}))
+        self._emit(self._line(_header(author, organization)))
+
+    def _line(self, obj: Any) -> bytes:
+        return self._codec.dumps(obj) + b"\n"
+
+    def _emit(self, line: bytes) -> None:
+        self._buffer += line
+        if len(self._buffer) >= _CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._out.write(self._buffer)
+            self._uncompressed_size += len(self._buffer)
+            self._buffer.clear()
+
+    def _enter(self, index: int) -> None:
+        if self.summary is not None or self._aborted:
+            raise ValueError("The import file is closed")
+        if index < self._section:
+            raise ValueError(
+                "Sections must be written in order: models, twins, relationships"
+            )
+        while self._section < index:
+            self._section += 1
+            self._emit(self._line({"Section": _SECTIONS[self._section]}))
+
+    def _write_section(self, index: int, items: Iterable[Dict[str, Any]]) -> int:
+        self._enter(index)
+        name = _SECTIONS[index]
+        digest = self._digests[name]
+        count = 0
+        for item in items:
+            line = self._line(item)
+            digest.update(line)
+            self._emit(line)
+            count += 1
+        self._counts[name] += count
+        return count
+
+    def write_models(self, models: Iterable[DtdlInterface]) -> int:
+        """
+        Write models, in dependency order.
+
+        Returns:
+            The number of models written.
+        """
+        return self._write_section(0, (model.to_dict() for model in models))
+
+    def write_twins(self, twins: Iterable[BasicDigitalTwin]) -> int:
+        """
+        Write digital twins. Their ETags are left out.
+
+        Returns:
+            The number of twins written.
+        """
+        return self._write_section(1, (_twin_line(twin) for twin in twins))
+
+    def write_relationships(self, relationships: Iterable[BasicRelationship]) -> int:
+        """
+        Write relationships.
+
+        Returns:
+            The number of relationships written.
+        """
+        return self._write_section(
+            2, (_relationship_line(relationship) for relationship in relationships)
+        )
+
+    def close(self) -> ImportFileSummary:
+        """
+        Write the remaining section headers and finish the file.
+
+        Returns:
+            The counts, checksums and sizes of the file.
+
+        Raises:
+            ValueError: If the file was aborted.
+        """
+        if self._aborted:
+            raise ValueError("The import file was aborted")
+        if self.summary is None:
+            self._enter(len(_SECTIONS) - 1)
+            self._flush()
+            if self._out is not self._sink:
+                self._out.close()
+            if self._path is not None:
+                self._raw.close()
+            else:
+                self._raw.flush()
+            self.summary = ImportFileSummary(
+                counts={name.lower(): n for name, n in self._counts.items()},
+                checksums={
+                    name.lower(): digest.hexdigest()
+                    for name, digest in self._digests.items()
+                },
+                sha256=self._sink.digest.hexdigest(),
+                size=self._sink.size,
+                uncompressed_size=self._uncompressed_size,
+            )
+        return self.summary
+
+    def abort(self) -> None:
+        """
+        Stop writing without finishing the file.
+
+        Neither the remaining section headers nor the gzip trailer are written.
+        A file the writer opened from a path is deleted; a file object is left
+        open with the partial, unterminated content.
+        """
+        if self.summary is not None or self._aborted:
+            return
+        self._aborted = True
+        self._buffer.clear()
+        if self._out is not self._sink:
+            # Detach the compressor so that it never writes a trailer
+            self._out.fileobj = None
+        if self._path is not None:
+            self._raw.close()
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "ImportFileWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_import_file(
+    file: Union[str, "os.PathLike[str]", IO[bytes]],
+    models: Iterable[DtdlInterface] = (),
+    twins: Iterable[BasicDigitalTwin] = (),
+    relationships: Iterable[BasicRelationship] = (),
+    compress: bool = True,
+    json_codec: Optional[JsonCodec] = None,
+) -> ImportFileSummary:
+    """
+    Write an import file from iterables of models, twins and relationships.
+
+    The iterables are read lazily, one at a time, so they can be generators
+    over an export of any size.
+
+    Args:
+        file: Path or binary file object to write to. A file object is left
+            open.
+        models: The models, in dependency order.
+        twins: The digital twins.
+        relationships: The relationships.
+        compress: Whether to gzip the file.
+        json_codec: Codec to serialize the lines with. Defaults to the fastest
+            installed one.
+
+    Returns:
+        The counts, checksums and sizes of the file.
+    """
+    with ImportFileWriter(file, compress=compress, json_codec=json_codec) as writer:
+        writer.write_models(models)
+        writer.write_twins(twins)
+        writer.write_relationships(relationships)
+    return writer.close()
+
+
+class _ChunkSink(io.BytesIO):
+    # A file object whose written bytes are taken out as upload chunks
+    def take(self) -> bytes:
+        chunk = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return chunk
+
+
+def import_file_chunks(
+    models: Iterable[DtdlInterface] = (),
+    twins: Iterable[BasicDigitalTwin] = (),
+    relationships: Iterable[BasicRelationship] = (),
+    compress: bool = True,
+    json_codec: Optional[JsonCodec] = None,
+) -> Iterator[bytes]:
+    """
+    Write an import file as a stream of chunks, for uploading it while it is
+    written.
+
+    The inputs are read lazily, a batch of items at a time, so memory use stays
+    constant however large the graph.
+
+    Args:
+        models: The models, in dependency order.
+        twins: The digital twins.
+        relationships: The relationships, whose twins must be in the file or
+            already exist.
+        compress: Whether to gzip the file.
+        json_codec: Codec to serialize the lines with. Defaults to the fastest
+            installed one.
+
+    Yields:
+        bytes: Consecutive chunks of the file.
+    """
+    sink = _ChunkSink()
+    writer = ImportFileWriter(sink, compress=compress, json_codec=json_codec)
+    sections: List[Tuple[Callable[[List[Any]], Any], Iterable[Any]]] = [
+        (writer.write_models, models),
+        (writer.write_twins, twins),
+        (writer.write_relationships, relationships),
+    ]
+    for write, items in sections:
+        iterator = iter(items)
+        batch = list(islice(iterator, _BATCH_SIZE))
+        while batch:
+            write(batch)
+            chunk = sink.take()
+            if chunk:
+                yield chunk
+            batch = list(islice(iterator, _BATCH_SIZE))
+    writer.close()
+    yield sink.take()
@@ -2,10 +2,12 @@
 """
 Konnektr Graph SDK models (Azure-free).
 """
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Mapping, Optional, TypeVar
 
 from .types import (
+    BasicDigitalTwin,
+    DigitalTwinId,
     DtdlCommand,
     DtdlComponent,
     DtdlInterface,
@@ -18,6 +20,11 @@ from .types import (
     ModelId,
 )
 
+T = TypeVar("T")
+
+# Statuses after which a job no longer changes
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 @dataclass
 class ImportJob:
@@ -269,3 +276,100 @@ class DigitalTwinsModelData:
         if self.commands is not None:
             result["commands"] = [c.to_dict() for c in self.commands]
         return result
+
+
+@dataclass
+class DigitalTwinsLookup:
+    """
+    Result of looking up digital twins by ID.
+
+    Attributes:
+        twins: The twins found, keyed by ID.
+        missing: The requested IDs for which no twin exists, in request order.
+    """
+
+    twins: Dict[DigitalTwinId, BasicDigitalTwin] = field(default_factory=dict)
+    missing: List[DigitalTwinId] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Continuation:
+    """
+    Position of a paged scan at a page boundary, used to resume the scan.
+
+    A continuation with neither a token nor a link marks a finished scan;
+    resuming from it yields nothing.
+
+    Attributes:
+        continuation_token: Token of the next page to fetch.
+        next_link: Link to the next page to fetch.
+    """
+
+    continuation_token: Optional[str] = None
+    next_link: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the scan had no more pages."""
+        return not (self.continuation_token or self.next_link)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Continuation":
+        """
+        Create a Continuation instance from a dictionary.
+
+        Args:
+            data: A dictionary created by ``to_dict``.
+
+        Returns:
+            A Continuation instance.
+        """
+        return cls(
+            continuation_token=data.get("continuationToken"),
+            next_link=data.get("nextLink"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the Continuation instance to a JSON-serializable dictionary.
+
+        Returns:
+            A dictionary representation of the Continuation.
+        """
+        result: Dict[str, Any] = {}
+        if self.continuation_token is not None:
+            result["continuationToken"] = self.continuation_token
+        if self.next_link is not None:
+            result["nextLink"] = self.next_link
+        return result
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of results from a paged operation.
+
+    Attributes:
+        items: The items on the page.
+        continuation_token: Token for the next page, from the x-ms-continuation
+            header or the response body. None if the service returned none.
+        next_link: Link to the next page, if the service returned one.
+        headers: The response headers.
+        metadata: The other top-level fields of the response body.
+    """
+
+    items: List[T]
+    continuation_token: Optional[str] = None
+    next_link: Optional[str] = None
+    headers: Mapping[str, str] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def has_more(self) -> bool:
+        """Whether there is another page after this one."""
+        return bool(self.continuation_token or self.next_link)
+
+    @property
+    def continuation(self) -> Continuation:
+        """The continuation to resume the scan from after this page."""
+        return Continuation(self.continuation_token, self.next_link)
@@ -0,0 +1,26 @@
+# konnektr_graph/policies/__init__.py
+"""
+Request policies (retries, throttling, resilience) for Konnektr Graph SDK.
+"""
+
+from .retry import RetryBudget, RetryPolicy, RetryStats
+from .rate_limit import RateLimiter, TokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .hedging import HedgingPolicy, HedgingStats
+from .circuit_breaker import Circuit, CircuitBreakerPolicy
+from .compression import CompressionPolicy, CompressionStats
+
+__all__ = [
+    "RetryPolicy",
+    "RetryBudget",
+    "RetryStats",
+    "RateLimiter",
+    "TokenBucket",
+    "AdaptiveConcurrencyLimiter",
+    "HedgingPolicy",
+    "HedgingStats",
+    "CircuitBreakerPolicy",
+    "Circuit",
+    "CompressionPolicy",
+    "CompressionStats",
+]
@@ -0,0 +1,238 @@
+# konnektr_graph/policies/circuit_breaker.py
+"""
+Circuit breakers scoped per endpoint and operation class.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Literal, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..exceptions import CircuitOpenError
+from ..transport.protocol import HttpRequest
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class Circuit:
+    """
+    A single circuit with closed, open and half-open states.
+
+    While closed, the outcomes of the last ``window_size`` calls are kept. Once
+    at least ``minimum_calls`` were seen and the failure rate or the slow call
+    rate reaches its threshold, the circuit opens and calls fail fast. After
+    ``open_duration`` seconds it lets up to ``half_open_calls`` probe calls
+    through; if they all succeed it closes, otherwise it opens again. Only
+    probe calls decide the half-open state: calls started while the circuit was
+    closed that finish after it opened are ignored.
+    """
+
+    def __init__(self, policy: "CircuitBreakerPolicy", name: str):
+        self._policy = policy
+        self.name = name
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=policy.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # Incremented on every transition to half-open, to tell probes apart
+        self._half_open_period = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def _refresh(self) -> None:
+        if (
+            self._state == "open"
+            and time.monotonic() - self._opened_at >= self._policy.open_duration
+        ):
+            self._state = "half_open"
+            self._probes = 0
+            self._probe_successes = 0
+            self._half_open_period += 1
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._times_opened += 1
+
+    def acquire(self) -> Optional[int]:
+        """
+        Check that a call may be made.
+
+        Returns:
+            None for a call through the closed circuit, or a probe token to
+            pass to ``record`` for a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probes in use.
+        """
+        with self._lock:
+            self._refresh()
+            if self._state == "closed":
+                return None
+            if self._state == "half_open":
+                if self._probes < self._policy.half_open_calls:
+                    self._probes += 1
+                    return self._half_open_period
+                self._rejected += 1
+                message = (
+                    f"Circuit '{self.name}' is half-open and its "
+                    f"{self._policy.half_open_calls} probe call(s) are in flight; "
+                    "failing fast"
+                )
+            else:
+                self._rejected += 1
+                retry_in = max(
+                    0.0,
+                    self._policy.open_duration - (time.monotonic() - self._opened_at),
+                )
+                message = (
+                    f"Circuit '{self.name}' is open; failing fast "
+                    f"(probing in {retry_in:.1f}s)"
+                )
+        raise CircuitOpenError(message)
+
+    def record(
+        self,
+        latency: float,
+        status_code: Optional[int] = None,
+        *,
+        cancelled: bool = False,
+        probe: Optional[int] = None,
+    ) -> None:
+        """
+        Record the outcome of a call allowed by ``acquire``.
+
+        Args:
+            latency: The call duration in seconds.
+            status_code: The response status code, or None if no response was received.
+            cancelled: Whether the call was abandoned. Cancelled calls are not
+                counted, and a cancelled probe frees its slot.
+            probe: The token returned by ``acquire``.
+        """
+        policy = self._policy
+        failed = status_code is None or status_code in policy.failure_status
+        slow = (
+            policy.slow_call_duration is not None
+            and latency >= policy.slow_call_duration
+        )
+        with self._lock:
+            if probe is not None:
+                if self._state != "half_open" or probe != self._half_open_period:
+                    # A probe of an earlier half-open period
+                    return
+                if cancelled:
+                    self._probes = max(0, self._probes - 1)
+                elif failed or slow:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= policy.half_open_calls:
+                        self._state = "closed"
+                        self._outcomes.clear()
+                return
+            if cancelled or self._state != "closed":
+                return
+
+            self._outcomes.append((failed, slow))
+            calls = len(self._outcomes)
+            if calls < policy.minimum_calls:
+                return
+            failures = sum(1 for f, _ in self._outcomes if f)
+            slow_calls = sum(1 for _, s in self._outcomes if s)
+            if (
+                failures / calls >= policy.failure_rate_threshold
+                or slow_calls / calls >= policy.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the circuit state and counters for monitoring."""
+        with self._lock:
+            self._refresh()
+            calls = len(self._outcomes)
+            return {
+                "state": self._state,
+                "calls": calls,
+                "failure_rate": (
+                    sum(1 for f, _ in self._outcomes if f) / calls if calls else 0.0
+                ),
+                "slow_call_rate": (
+                    sum(1 for _, s in self._outcomes if s) / calls if calls else 0.0
+                ),
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+
+class CircuitBreakerPolicy:
+    """
+    Keeps one circuit per endpoint (scheme and host) and operation class.
+
+    Scoping by operation class means, for example, that failing queries do not
+    stop twin reads or telemetry to the same endpoint.
+
+    :param failure_rate_threshold: Failure rate that opens the circuit (default: 0.5)
+    :param slow_call_duration: Optional latency in seconds above which a call is slow
+    :param slow_call_rate_threshold: Slow call rate that opens the circuit (default: 1.0)
+    :param window_size: Number of recent calls the rates are computed over (default: 50)
+    :param minimum_calls: Calls needed before the circuit may open (default: 20)
+    :param open_duration: Seconds the circuit stays open before probing (default: 30)
+    :param half_open_calls: Probe calls that must succeed to close the circuit (default: 1)
+    :param failure_status: Status codes counted as failures, in addition to
+        connection errors (default: 500, 502, 503 and 504)
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 1.0,
+        window_size: int = 50,
+        minimum_calls: int = 20,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        failure_status: FrozenSet[int] = FAILURE_STATUS_CODES,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.failure_status = failure_status
+        self._circuits: Dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def get_circuit(self, request: HttpRequest) -> Circuit:
+        """Get the circuit for the request's endpoint and operation class."""
+        parts = urlsplit(request.url)
+        name = f"{parts.scheme}://{parts.netloc}:{request.operation_class}"
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(name, Circuit(self, name))
+        return circuit
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the state of every circuit for monitoring.
+
+        Returns:
+            A dictionary keyed by ``<endpoint>:<operation class>``.
+        """
+        with self._lock:
+            circuits = list(self._circuits.items())
+        return {name: circuit.snapshot() for name, circuit in circuits}
@@ -0,0 +1,306 @@
+# konnektr_graph/policies/compression.py
+"""
+Response decoding and request body compression.
+"""
+import gzip
+import threading
+import time
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore
+
+from ..transport.protocol import HttpRequest, HttpResponse
+
+# Encodings that can be decoded, best first
+SUPPORTED_ENCODINGS: Tuple[str, ...] = (
+    ("br", "gzip", "deflate") if brotli is not None else ("gzip", "deflate")
+)
+REQUEST_CODECS = ("gzip", "deflate")
+
+
+class _Decoder:
+    """Incremental decoder for one content coding."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._obj: Any = brotli.Decompressor()
+        elif encoding == "gzip":
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            # deflate is zlib-wrapped per RFC 9110; fall back to raw deflate below
+            self._obj = zlib.decompressobj()
+        self._first = True
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._obj.process(data)
+        if self._first and data:
+            self._first = False
+            if self.encoding == "deflate" and (data[0] & 0x0F) != 8:
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            if not self._obj.is_finished():
+                raise brotli.error("Truncated br response body")
+            return b""
+        data = self._obj.flush()
+        if not self._obj.eof:
+            raise zlib.error(f"Truncated {self.encoding} response body")
+        return data
+
+
+class _ChainedDecoder:
+    """Decoder for several content codings, undone in reverse order."""
+
+    def __init__(self, decoders: List[_Decoder]):
+        self._decoders = decoders
+
+    def decompress(self, data: bytes) -> bytes:
+        for decoder in self._decoders:
+            data = decoder.decompress(data)
+        return data
+
+    def flush(self) -> bytes:
+        data = b""
+        for decoder in self._decoders:
+            data = decoder.decompress(data) + decoder.flush()
+        return data
+
+
+def get_decoder(encoding: str) -> Optional[Union[_Decoder, _ChainedDecoder]]:
+    """
+    Get an incremental decoder for a Content-Encoding value.
+
+    A value listing several codings, such as ``gzip, br``, is decoded in the
+    reverse of the order in which the codings were applied.
+
+    Args:
+        encoding: The Content-Encoding header value.
+
+    Returns:
+        A decoder with ``decompress(chunk)`` and ``flush()``, or None if the
+        value is ``identity`` or lists a coding that is not supported.
+    """
+    decoders = []
+    for coding in reversed(encoding.split(",")):
+        coding = coding.strip().lower()
+        if coding == "x-gzip":
+            coding = "gzip"
+        if coding in ("", "identity"):
+            continue
+        if coding not in SUPPORTED_ENCODINGS:
+            return None
+        decoders.append(_Decoder(coding))
+    if not decoders:
+        return None
+    if len(decoders) == 1:
+        return decoders[0]
+    return _ChainedDecoder(decoders)
+
+
+class CompressionStats:
+    """Thread-safe compression counters for monitoring."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_compressed = 0
+        self.request_bytes = 0
+        self.request_bytes_compressed = 0
+        self.request_cpu_time = 0.0
+        self.responses_decoded = 0
+        self.response_bytes_wire = 0
+        self.response_bytes_decoded = 0
+        self.response_cpu_time = 0.0
+
+    def _add(self, **counters: Any) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the counters.
+
+        Returns:
+            A dictionary with the number of compressed requests and decoded
+            responses, their sizes before and after compression, the
+            compression ratios (uncompressed / compressed) and the CPU time
+            spent compressing and decoding, in seconds.
+        """
+        with self._lock:
+            return {
+                "requests_compressed": self.requests_compressed,
+                "request_bytes": self.request_bytes,
+                "request_bytes_compressed": self.request_bytes_compressed,
+                "request_ratio": (
+                    self.request_bytes / self.request_bytes_compressed
+                    if self.request_bytes_compressed
+                    else 1.0
+                ),
+                "request_cpu_time": self.request_cpu_time,
+                "responses_decoded": self.responses_decoded,
+                "response_bytes_wire": self.response_bytes_wire,
+                "response_bytes_decoded": self.response_bytes_decoded,
+                "response_ratio": (
+                    self.response_bytes_decoded / self.response_bytes_wire
+                    if self.response_bytes_wire
+                    else 1.0
+                ),
+                "response_cpu_time": self.response_cpu_time,
+            }
+
+
+class CompressionPolicy:
+    """
+    Negotiates compressed responses and optionally compresses request bodies.
+
+    Responses are requested with ``Accept-Encoding`` (gzip and deflate, plus
+    brotli when the ``brotli`` extra is installed) and decoded by the client.
+    Request bodies of at least ``request_threshold`` bytes, such as large DTDL
+    uploads or import job payloads, are compressed with ``request_codec``.
+    The service must accept compressed request bodies for this to be enabled.
+
+    :param accept_encodings: Encodings to accept, best first (default: all supported)
+    :param request_threshold: Minimum body size in bytes to compress; None
+        disables request compression (default: None)
+    :param request_codec: ``"gzip"`` or ``"deflate"`` (default: ``"gzip"``)
+    :param level: Compression level from 1 (fastest) to 9 (smallest) (default: 6)
+    """
+
+    def __init__(
+        self,
+        accept_encodings: Optional[Tuple[str, ...]] = None,
+        request_threshold: Optional[int] = None,
+        request_codec: str = "gzip",
+        level: int = 6,
+    ):
+        if request_codec not in REQUEST_CODECS:
+            raise ValueError(f"request_codec must be one of {REQUEST_CODECS}")
+        self.accept_encodings = (
+            accept_encodings if accept_encodings is not None else SUPPORTED_ENCODINGS
+        )
+        self.request_threshold = request_threshold
+        self.request_codec = request_codec
+        self.level = level
+        self.stats = CompressionStats()
+
+    def prepare_request(self, request: HttpRequest) -> None:
+        """Add Accept-Encoding and compress the body if it is large enough."""
+        if self.accept_encodings and "Accept-Encoding" not in request.headers:
+            request.headers["Accept-Encoding"] = ", ".join(self.accept_encodings)
+
+        content = request.content
+        if (
+            self.request_threshold is None
+            or content is None
+            or len(content) < self.request_threshold
+            or "Content-Encoding" in request.headers
+        ):
+            return
+        started = time.thread_time()
+        if self.request_codec == "gzip":
+            compressed = gzip.compress(content, compresslevel=self.level, mtime=0)
+        else:
+            compressed = zlib.compress(content, self.level)
+        self.stats._add(
+            requests_compressed=1,
+            request_bytes=len(content),
+            request_bytes_compressed=len(compressed),
+            request_cpu_time=time.thread_time() - started,
+        )
+        request.content = compressed
+        request.headers["Content-Encoding"] = self.request_codec
+
+    def decode_response(self, response: HttpResponse) -> None:
+        """
+        Decode the response body in place according to its Content-Encoding.
+
+        A streamed body is wrapped so that chunks are decoded as they are read.
+        """
+        encoding = response.headers.get("Content-Encoding")
+        if not encoding:
+            return
+        decoder = get_decoder(encoding)
+        if decoder is None:
+            return
+        if response.stream is not None:
+            state = _StreamDecoder(self.stats, decoder)
+            if hasattr(response.stream, "__aiter__"):
+                response.stream = state.decode_async(response.stream)  # type: ignore[arg-type]
+            else:
+                response.stream = state.decode(response.stream)  # type: ignore[arg-type]
+            del response.headers["Content-Encoding"]
+            return
+        if not response.content:
+            return
+        started = time.thread_time()
+        wire = response.content
+        response.content = decoder.decompress(wire) + decoder.flush()
+        self.stats._add(
+            responses_decoded=1,
+            response_bytes_wire=len(wire),
+            response_bytes_decoded=len(response.content),
+            response_cpu_time=time.thread_time() - started,
+        )
+        del response.headers["Content-Encoding"]
+
+
+class _StreamDecoder:
+    """Decodes a streamed body chunk by chunk and records the totals at the end."""
+
+    def __init__(
+        self, stats: CompressionStats, decoder: Union[_Decoder, _ChainedDecoder]
+    ):
+        self._stats = stats
+        self._decoder = decoder
+        self._wire = 0
+        self._decoded = 0
+        self._cpu = 0.0
+
+    def _chunk(self, chunk: bytes) -> bytes:
+        started = time.thread_time()
+        data = self._decoder.decompress(chunk)
+        self._cpu += time.thread_time() - started
+        self._wire += len(chunk)
+        self._decoded += len(data)
+        return data
+
+    def _finish(self) -> bytes:
+        if not self._wire:
+            # An empty body, such as that of a 204, has nothing to decode
+            return b""
+        started = time.thread_time()
+        data = self._decoder.flush()
+        self._decoded += len(data)
+        self._stats._add(
+            responses_decoded=1,
+            response_bytes_wire=self._wire,
+            response_bytes_decoded=self._decoded,
+            response_cpu_time=self._cpu + time.thread_time() - started,
+        )
+        return data
+
+    def decode(self, stream: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in stream:
+            data = self._chunk(chunk)
+            if data:
+                yield data
+        tail = self._finish()
+        if tail:
+            yield tail
+
+    async def decode_async(self, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in stream:
+            data = self._chunk(chunk)
+            if data:
+                yield data
+        tail = self._finish()
+        if tail:
+            yield tail
@@ -0,0 +1,192 @@
+# konnektr_graph/policies/concurrency.py
+"""
+Adaptive (AIMD) concurrency limiting for the async client.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Optional
+
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits in-flight requests with additive-increase/multiplicative-decrease.
+
+    Every healthy response grows the limit by ``increase / limit``, so the limit
+    rises by about ``increase`` per round of requests. A throttling response
+    (429/503), a connection failure or a latency spike above
+    ``latency_threshold`` times the baseline latency multiplies the limit by
+    ``decrease_factor``. Requests that started before the last decrease cannot
+    trigger another one, so a single burst of failures cuts the limit once.
+    Spikes still feed the baseline, with the smaller ``spike_smoothing``
+    weight, so after a lasting latency shift the baseline settles on the new
+    normal and the limit grows back.
+
+    :param initial_limit: Starting number of in-flight requests (default: 10)
+    :param min_limit: Lower bound for the limit (default: 1)
+    :param max_limit: Upper bound for the limit (default: 500)
+    :param increase: Additive increase per round of requests (default: 1)
+    :param decrease_factor: Multiplier applied on overload (default: 0.5)
+    :param latency_threshold: Latency, as a multiple of the baseline, that counts
+        as a spike (default: 2.0)
+    :param smoothing: Weight of a new sample in the baseline latency average (default: 0.05)
+    :param spike_smoothing: Weight of a latency spike in the baseline latency
+        average (default: 0.01)
+    :param overload_status: Status codes that signal overload (default: 429 and 503)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 500,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 2.0,
+        smoothing: float = 0.05,
+        spike_smoothing: float = 0.01,
+        overload_status: FrozenSet[int] = OVERLOAD_STATUS_CODES,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.smoothing = smoothing
+        self.spike_smoothing = spike_smoothing
+        self.overload_status = overload_status
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._increases = 0
+        self._decreases = 0
+        self._last_decision = "hold"
+        self._last_reason = ""
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot.
+
+        Returns:
+            The start time to pass to ``release``.
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before the cancellation
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        status_code: Optional[int] = None,
+        *,
+        cancelled: bool = False,
+    ) -> None:
+        """
+        Free a slot and adjust the limit from the outcome of the request.
+
+        Args:
+            started: The value returned by ``acquire``.
+            status_code: The response status code, or None if no response was received.
+            cancelled: Whether the request was abandoned. Cancelled requests do
+                not change the limit.
+        """
+        self._in_flight -= 1
+        if not cancelled:
+            self._adjust(started, status_code)
+        self._wake()
+
+    def _adjust(self, started: float, status_code: Optional[int]) -> None:
+        latency = time.monotonic() - started
+        if status_code is None:
+            reason = "connection error"
+        elif status_code in self.overload_status:
+            reason = f"status {status_code}"
+        elif (
+            self._baseline is not None
+            and latency > self._baseline * self.latency_threshold
+        ):
+            reason = f"latency {latency * 1000:.0f}ms"
+            if status_code < 500:
+                # Creep towards the spike, in case it is the new normal latency
+                self._baseline += self.spike_smoothing * (latency - self._baseline)
+        else:
+            reason = ""
+            if status_code < 500:
+                self._baseline = (
+                    latency
+                    if self._baseline is None
+                    else self._baseline + self.smoothing * (latency - self._baseline)
+                )
+
+        if reason:
+            if started < self._last_decrease:
+                return
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            self._last_decrease = time.monotonic()
+            self._decreases += 1
+            self._last_decision = "decrease"
+            self._last_reason = reason
+        elif status_code is not None and status_code < 500:
+            if self._in_flight + 1 < self.limit:
+                # Not limited by the limit, so there is no signal to grow on
+                return
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._increases += 1
+            self._last_decision = "increase"
+            self._last_reason = "healthy"
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the limiter state for monitoring.
+
+        Returns:
+            A dictionary with the current ``limit``, ``in_flight`` and ``waiting``
+            requests, ``baseline_latency`` in seconds, the number of
+            ``increases`` and ``decreases``, and the ``last_decision`` with its
+            ``last_reason``.
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self._baseline,
+            "increases": self._increases,
+            "decreases": self._decreases,
+            "last_decision": self._last_decision,
+            "last_reason": self._last_reason,
+        }
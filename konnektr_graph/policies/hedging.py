@@ -0,0 +1,135 @@
+# konnektr_graph/policies/hedging.py
+"""
+Hedged requests for latency-sensitive reads in the async client.
+"""
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Optional
+
+from ..transport.protocol import HttpRequest
+from .retry import RetryBudget
+
+
+class HedgingStats:
+    """Hedging counters for monitoring."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+        self.budget_exhausted = 0
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the counters.
+
+        Returns:
+            A dictionary with ``requests`` (eligible reads), ``hedged`` (reads
+            that sent a second request), ``hedge_wins`` and ``primary_wins``
+            (which of the two succeeded first), ``hedge_win_rate`` and
+            ``budget_exhausted`` (hedges skipped because the budget was empty).
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "primary_wins": self.primary_wins,
+                "hedge_win_rate": (
+                    self.hedge_wins / self.hedged if self.hedged else 0.0
+                ),
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+
+def _default_budget() -> RetryBudget:
+    return RetryBudget(ratio=0.05, capacity=10.0)
+
+
+@dataclass
+class HedgingPolicy:
+    """
+    Sends a second, identical read when the first one is slower than usual.
+
+    The hedge delay is the ``percentile`` of recently observed read latencies,
+    clamped to ``[min_delay, max_delay]``. No hedges are sent until
+    ``min_samples`` latencies have been observed. Whichever request finishes
+    first is used and the other one is cancelled. The budget caps the extra
+    load, by default to 5% of reads.
+
+    Attributes:
+        percentile: Latency percentile after which a hedge is sent.
+        min_delay: Lower bound for the hedge delay in seconds.
+        max_delay: Upper bound for the hedge delay in seconds.
+        min_samples: Number of latencies to observe before hedging.
+        window: Number of recent latencies the percentile is computed over.
+        operations: Operation classes that are hedged.
+        budget: Budget that caps hedges to a fraction of eligible reads.
+        stats: Hedging counters for monitoring.
+    """
+
+    percentile: float = 95.0
+    min_delay: float = 0.005
+    max_delay: float = 1.0
+    min_samples: int = 20
+    window: int = 1000
+    operations: FrozenSet[str] = frozenset({"read"})
+    budget: RetryBudget = field(default_factory=_default_budget)
+    stats: HedgingStats = field(default_factory=HedgingStats, repr=False)
+
+    def __post_init__(self):
+        self._latencies: Deque[float] = deque(maxlen=self.window)
+        self._delay: Optional[float] = None
+        self._since_update = 0
+
+    def applies_to(self, request: HttpRequest) -> bool:
+        """Whether the request is an idempotent read that may be hedged."""
+        # A losing streamed response would keep its connection busy
+        return (
+            not request.stream
+            and request.method.upper() == "GET"
+            and request.operation_class in self.operations
+        )
+
+    def record_latency(self, latency: float) -> None:
+        """Record the latency of a completed read."""
+        self._latencies.append(latency)
+        self._since_update += 1
+        # Re-sorting the window on every read is wasteful; refresh periodically
+        if self._delay is None or self._since_update >= max(1, self.window // 20):
+            self._since_update = 0
+            if len(self._latencies) >= self.min_samples:
+                ordered = sorted(self._latencies)
+                index = min(
+                    len(ordered) - 1, int(len(ordered) * self.percentile / 100)
+                )
+                self._delay = min(self.max_delay, max(self.min_delay, ordered[index]))
+
+    def get_delay(self) -> Optional[float]:
+        """
+        Get the current hedge delay.
+
+        Returns:
+            Seconds to wait before hedging, or None while there are too few samples.
+        """
+        return self._delay
+
+    def try_hedge(self) -> bool:
+        """Take budget for a hedge. Returns False when the budget is exhausted."""
+        if self.budget.try_withdraw():
+            self.stats._record("hedged")
+            return True
+        self.stats._record("budget_exhausted")
+        return False
+
+    def record_request(self) -> None:
+        """Record an eligible read."""
+        self.stats._record("requests")
+        self.budget.deposit()
@@ -0,0 +1,128 @@
+# konnektr_graph/policies/rate_limit.py
+"""
+Client-side token-bucket rate limiting shared across threads and tasks.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from ..transport.protocol import OperationClass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Callers
+    reserve a token and wait for the returned delay, so waiters are served in
+    arrival order and the bucket never needs to be polled.
+
+    :param rate: Sustained requests per second.
+    :param burst: Maximum number of requests sent back to back (default: ``rate``, at least 1)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve one token.
+
+        Returns:
+            Seconds to wait before the reserved request may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Smooths the request rate of one or more clients to stay under a service quota.
+
+    A limiter can combine an overall limit with limits per operation class
+    (``"read"``, ``"write"``, ``"query"`` and ``"telemetry"``); a request waits
+    for every bucket that applies to it. Share one instance between clients to
+    enforce an aggregate rate.
+
+    :param requests_per_second: Optional overall rate limit.
+    :param burst: Overall burst size (default: ``requests_per_second``)
+    :param operation_limits: Optional buckets per operation class.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        operation_limits: Optional[Mapping[OperationClass, TokenBucket]] = None,
+    ):
+        self._bucket = (
+            TokenBucket(requests_per_second, burst)
+            if requests_per_second is not None
+            else None
+        )
+        self._operation_limits: Dict[OperationClass, TokenBucket] = dict(
+            operation_limits or {}
+        )
+        self._lock = threading.Lock()
+        self._delayed = 0
+        self._total_delay = 0.0
+
+    def reserve(self, operation_class: OperationClass) -> float:
+        """
+        Reserve capacity for one request.
+
+        Args:
+            operation_class: The operation class of the request.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        delay = 0.0
+        if self._bucket is not None:
+            delay = self._bucket.reserve()
+        bucket = self._operation_limits.get(operation_class)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        if delay > 0:
+            with self._lock:
+                self._delayed += 1
+                self._total_delay += delay
+        return delay
+
+    def acquire(self, operation_class: OperationClass) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve(operation_class)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, operation_class: OperationClass) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self.reserve(operation_class)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return limiter counters for monitoring.
+
+        Returns:
+            A dictionary with ``delayed`` (requests that had to wait) and
+            ``total_delay`` (seconds spent waiting in total).
+        """
+        with self._lock:
+            return {"delayed": self._delayed, "total_delay": self._total_delay}
@@ -0,0 +1,236 @@
+# konnektr_graph/policies/retry.py
+"""
+Retry policy with exponential backoff, jitter, Retry-After and a retry budget.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional
+
+from ..transport.protocol import HttpRequest, HttpResponse
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Caps retry amplification to a fraction of the request volume.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so in
+    steady state at most ``ratio`` retries are sent per request. ``capacity``
+    bounds the tokens that can be saved up for a burst of retries.
+
+    :param ratio: Retries allowed per request (default: 0.2)
+    :param capacity: Maximum number of saved up retries (default: 10)
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take a token for a retry. Returns False when the budget is exhausted."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class RetryStats:
+    """Thread-safe retry counters for monitoring."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.retries_by_reason: Dict[str, int] = {}
+        self.exhausted = 0
+        self.budget_exhausted = 0
+
+    def _record(self, counter: str, reason: Optional[str] = None) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if reason is not None:
+                self.retries_by_reason[reason] = (
+                    self.retries_by_reason.get(reason, 0) + 1
+                )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the counters.
+
+        Returns:
+            A dictionary with ``requests``, ``retries``, ``retries_by_reason``
+            (keyed by status code or ``"connection"``), ``exhausted`` (requests
+            that failed after the last attempt, or were asked to wait longer
+            than ``max_retry_after``) and ``budget_exhausted``
+            (retries skipped because the retry budget was empty).
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "retries_by_reason": dict(self.retries_by_reason),
+                "exhausted": self.exhausted,
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Only idempotent requests are retried: GET, HEAD, OPTIONS, PUT and DELETE by
+    default, or any request explicitly marked with ``idempotent=True`` (such as
+    ``publish_telemetry`` with a ``message_id``). Use ``total_retries=0`` to
+    disable retries.
+
+    Attributes:
+        total_retries: Maximum number of retries per request.
+        backoff_factor: Base delay in seconds, doubled on every retry.
+        backoff_max: Maximum backoff delay in seconds.
+        jitter: Fraction of the backoff delay that is randomized (1.0 is full jitter).
+        retry_on_status: Status codes that are retried.
+        retry_methods: HTTP methods that are considered idempotent.
+        retry_on_connection_errors: Whether to retry when no response was received.
+        respect_retry_after: Whether to wait as long as a Retry-After header asks.
+        max_retry_after: Longest Retry-After delay in seconds that is waited
+            for. A request asked to wait longer is not retried. None waits for
+            any delay.
+        budget: Optional retry budget shared by all requests using this policy.
+        stats: Retry counters for monitoring.
+    """
+
+    total_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 1.0
+    retry_on_status: FrozenSet[int] = RETRY_STATUS_CODES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    retry_on_connection_errors: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: Optional[float] = 60.0
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+    stats: RetryStats = field(default_factory=RetryStats, repr=False)
+
+    def is_idempotent(self, request: HttpRequest) -> bool:
+        """Whether the request may be safely sent more than once."""
+        if request.idempotent is not None:
+            return request.idempotent
+        return request.method.upper() in self.retry_methods
+
+    def record_request(self) -> None:
+        """Record the first attempt of a request."""
+        self.stats._record("requests")
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get the jittered exponential backoff delay for a retry.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return delay - random.uniform(0, delay * self.jitter)
+
+    @staticmethod
+    def get_retry_after(response: HttpResponse) -> Optional[float]:
+        """
+        Get the delay requested by the service, if any.
+
+        Supports ``retry-after-ms``, ``x-ms-retry-after-ms`` and ``Retry-After``
+        (in seconds or as an HTTP date).
+
+        Args:
+            response: The failed response.
+
+        Returns:
+            The delay in seconds, or None if the response does not ask for one.
+        """
+        for header in ("retry-after-ms", "x-ms-retry-after-ms"):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    return max(0.0, float(value) / 1000)
+                except ValueError:
+                    pass
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(
+        self,
+        request: HttpRequest,
+        attempt: int,
+        response: Optional[HttpResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            request: The request that failed.
+            attempt: Zero-based index of the attempt that failed.
+            response: The unsuccessful response, if one was received.
+            error: The error raised by the transport, if no response was received.
+
+        Returns:
+            The delay in seconds before the next attempt, or None to give up.
+        """
+        if response is not None:
+            if response.status_code not in self.retry_on_status:
+                return None
+            reason = str(response.status_code)
+        elif error is not None and self.retry_on_connection_errors:
+            reason = "connection"
+        else:
+            return None
+
+        if not self.is_idempotent(request):
+            return None
+        if attempt >= self.total_retries:
+            self.stats._record("exhausted")
+            return None
+        delay = None
+        if response is not None and self.respect_retry_after:
+            delay = self.get_retry_after(response)
+            if (
+                delay is not None
+                and self.max_retry_after is not None
+                and delay > self.max_retry_after
+            ):
+                self.stats._record("exhausted")
+                return None
+        if self.budget is not None and not self.budget.try_withdraw():
+            self.stats._record("budget_exhausted")
+            return None
+
+        self.stats._record("retries", reason)
+        if delay is None:
+            delay = self.get_backoff(attempt)
+        return delay
@@ -0,0 +1,296 @@
+# konnektr_graph/scan.py
+"""
+Partitioning of twin queries for parallel scans, and batched ID lookups.
+
+A query is split into disjoint partitions by adding a predicate to its WHERE
+clause, one partition per predicate. The partitions can then be scanned
+concurrently, each following its own continuation chain, with
+``query_twins_parallel`` on either client.
+"""
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+# Keywords that can follow the collection, and so are never its alias
+_CLAUSE_KEYWORDS = r"(?:WHERE|JOIN|ORDER|GROUP|LIMIT|OFFSET)\b"
+_FROM = re.compile(
+    r"\bFROM\s+DIGITALTWINS\b"
+    rf"(?:\s+(?:AS\s+)?(?!{_CLAUSE_KEYWORDS})([A-Za-z_]\w*))?",
+    re.IGNORECASE,
+)
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+_TRAILING_CLAUSE = re.compile(
+    r"\b(?:ORDER\s+BY|GROUP\s+BY|LIMIT|OFFSET)\b", re.IGNORECASE
+)
+_UNPARTITIONABLE = re.compile(r"\bSELECT\s+(?:TOP\s*\(|COUNT\s*\()", re.IGNORECASE)
+
+
+def _mask_literals(query: str) -> str:
+    # Blank out string literals so keywords inside them are not matched
+    return _STRING_LITERAL.sub(lambda m: " " * len(m.group()), query)
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _field(name: str, alias: Optional[str]) -> str:
+    return f"{alias}.{name}" if alias else name
+
+
+def query_alias(query_expression: str) -> Optional[str]:
+    """
+    Get the alias of the twins collection of a query.
+
+    Args:
+        query_expression: A query such as ``SELECT T FROM DIGITALTWINS T``.
+
+    Returns:
+        The alias, or None if the query declares none.
+    """
+    match = _FROM.search(_mask_literals(query_expression))
+    return match.group(1) if match else None
+
+
+def partition_query(query_expression: str, predicate: str) -> str:
+    """
+    Restrict a query to one partition by adding a predicate to its WHERE clause.
+
+    Clauses after the condition, such as ORDER BY, are kept after it. A merged
+    parallel scan does not preserve their order.
+
+    Args:
+        query_expression: The query to partition.
+        predicate: The partition predicate, using the query's alias if it has one.
+
+    Returns:
+        The partitioned query.
+
+    Raises:
+        ValueError: If the query selects TOP or COUNT, whose results cannot be
+            merged across partitions, or has no FROM DIGITALTWINS clause.
+    """
+    masked = _mask_literals(query_expression)
+    if _UNPARTITIONABLE.search(masked):
+        raise ValueError("TOP and COUNT queries cannot be partitioned")
+    if not _FROM.search(masked):
+        raise ValueError("Only queries over DIGITALTWINS can be partitioned")
+    where = _WHERE.search(masked)
+    # The predicate must not swallow clauses such as ORDER BY that follow WHERE
+    trailing = _TRAILING_CLAUSE.search(masked, where.end() if where else 0)
+    end = trailing.start() if trailing else len(query_expression)
+    tail = f" {query_expression[end:]}" if trailing else ""
+    if where is None:
+        return f"{query_expression[:end].rstrip()} WHERE {predicate}{tail}"
+    condition = query_expression[where.end() : end].strip()
+    head = query_expression[: where.start()]
+    return f"{head}WHERE ({predicate}) AND ({condition}){tail}"
+
+
+def model_partitions(
+    model_ids: Sequence[str],
+    alias: Optional[str] = None,
+    include_unlisted: bool = True,
+) -> List[str]:
+    """
+    Partition predicates matching twins by their exact model, one per model.
+
+    Unless disabled, a last partition matches the twins of every model that is
+    not listed, such as twins of a deleted model, so every twin is in exactly
+    one partition.
+
+    Args:
+        model_ids: The model IDs, for example from ``list_models``.
+        alias: The alias of the twins collection in the query, if any.
+        include_unlisted: Whether to add the partition of unlisted models.
+
+    Returns:
+        The partition predicates.
+    """
+    model = _field("$metadata.$model", alias)
+    literals = [_quote(model_id) for model_id in dict.fromkeys(model_ids)]
+    predicates = [f"{model} = {literal}" for literal in literals]
+    if include_unlisted:
+        if literals:
+            predicates.append(f"{model} NOT IN [{', '.join(literals)}]")
+        else:
+            predicates.append(f"IS_DEFINED({_field('$dtId', alias)})")
+    return predicates
+
+
+def id_range_partitions(
+    boundaries: Sequence[str], alias: Optional[str] = None
+) -> List[str]:
+    """
+    Partition predicates splitting twins into ``$dtId`` ranges.
+
+    The ranges are ``< b0``, ``>= b0 AND < b1``, ... ``>= bn``, so every twin
+    is in exactly one partition. Pick boundaries that split the IDs evenly.
+
+    Args:
+        boundaries: The range boundaries, e.g. ``["g", "n", "t"]``.
+        alias: The alias of the twins collection in the query, if any.
+
+    Returns:
+        ``len(boundaries) + 1`` partition predicates.
+    """
+    dt_id = _field("$dtId", alias)
+    bounds = sorted(set(boundaries))
+    if not bounds:
+        return [f"IS_DEFINED({dt_id})"]
+    predicates = [f"{dt_id} < {_quote(bounds[0])}"]
+    for low, high in zip(bounds, bounds[1:]):
+        predicates.append(f"{dt_id} >= {_quote(low)} AND {dt_id} < {_quote(high)}")
+    predicates.append(f"{dt_id} >= {_quote(bounds[-1])}")
+    return predicates
+
+
+def id_prefix_partitions(
+    prefixes: Sequence[str], alias: Optional[str] = None
+) -> List[str]:
+    """
+    Partition predicates matching twins whose ``$dtId`` starts with a prefix.
+
+    The partitions are only disjoint and complete if no prefix is a prefix of
+    another and every twin ID starts with one of them.
+
+    Args:
+        prefixes: The ID prefixes.
+        alias: The alias of the twins collection in the query, if any.
+
+    Returns:
+        The partition predicates.
+    """
+    dt_id = _field("$dtId", alias)
+    return [f"STARTSWITH({dt_id}, {_quote(p)})" for p in dict.fromkeys(prefixes)]
+
+
+def id_lookup_queries(
+    ids: Sequence[str], max_ids: int = 100, max_length: int = 8000
+) -> List[str]:
+    """
+    Split twin IDs into ``SELECT * FROM DIGITALTWINS T WHERE T.$dtId IN [...]``
+    queries.
+
+    Args:
+        ids: The twin IDs. Duplicates are looked up once.
+        max_ids: Maximum number of IDs per query.
+        max_length: Maximum length of a query in characters.
+
+    Returns:
+        The queries, in the order of the IDs.
+
+    Raises:
+        ValueError: If a single ID does not fit in a query of ``max_length``.
+    """
+    prefix = "SELECT * FROM DIGITALTWINS T WHERE T.$dtId IN ["
+    queries: List[str] = []
+    batch: List[str] = []
+    length = len(prefix) + 1
+    for twin_id in dict.fromkeys(ids):
+        literal = _quote(twin_id)
+        if len(prefix) + len(literal) + 1 > max_length:
+            raise ValueError(f"Twin ID is too long for a query: {twin_id[:50]}...")
+        if batch and (
+            len(batch) >= max_ids or length + len(literal) + 2 > max_length
+        ):
+            queries.append(prefix + ", ".join(batch) + "]")
+            batch = []
+            length = len(prefix) + 1
+        length += len(literal) + (2 if batch else 0)
+        batch.append(literal)
+    if batch:
+        queries.append(prefix + ", ".join(batch) + "]")
+    return queries
+
+
+class ParallelScanStats:
+    """Thread-safe per-partition throughput counters of a parallel scan."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started: Optional[float] = None
+        self.partitions: List[Dict[str, Any]] = []
+
+    def _set_partitions(self, predicates: Sequence[str]) -> None:
+        with self._lock:
+            self.partitions = [
+                {
+                    "predicate": predicate,
+                    "state": "pending",
+                    "pages": 0,
+                    "items": 0,
+                    "started": None,
+                    "finished": None,
+                }
+                for predicate in predicates
+            ]
+
+    def _start(self, index: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._started is None:
+                self._started = now
+            partition = self.partitions[index]
+            partition["state"] = "running"
+            partition["started"] = now
+
+    def _page(self, index: int, items: int) -> None:
+        with self._lock:
+            partition = self.partitions[index]
+            partition["pages"] += 1
+            partition["items"] += items
+
+    def _finish(self, index: int, failed: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            partition = self.partitions[index]
+            partition["state"] = "failed" if failed else "done"
+            partition["finished"] = now
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the counters.
+
+        Returns:
+            A dictionary with the total ``items``, ``pages``, ``elapsed``
+            seconds and ``items_per_second`` of the scan, and ``partitions``:
+            for each partition its ``predicate``, ``state`` (pending, running,
+            done or failed), ``pages``, ``items``, ``elapsed`` and
+            ``items_per_second``.
+        """
+        now = time.monotonic()
+        with self._lock:
+            partitions = []
+            for p in self.partitions:
+                if p["started"] is None:
+                    elapsed = 0.0
+                else:
+                    elapsed = (p["finished"] or now) - p["started"]
+                partitions.append(
+                    {
+                        "predicate": p["predicate"],
+                        "state": p["state"],
+                        "pages": p["pages"],
+                        "items": p["items"],
+                        "elapsed": elapsed,
+                        "items_per_second": p["items"] / elapsed if elapsed else 0.0,
+                    }
+                )
+            running = any(p["state"] in ("pending", "running") for p in self.partitions)
+            if self._started is None:
+                elapsed = 0.0
+            elif running:
+                elapsed = now - self._started
+            else:
+                elapsed = max(p["finished"] for p in self.partitions) - self._started
+        items = sum(p["items"] for p in partitions)
+        return {
+            "items": items,
+            "pages": sum(p["pages"] for p in partitions),
+            "elapsed": elapsed,
+            "items_per_second": items / elapsed if elapsed else 0.0,
+            "partitions": partitions,
+        }
@@ -0,0 +1,46 @@
+# konnektr_graph/transport/__init__.py
+"""
+HTTP transport layer for Konnektr Graph SDK.
+"""
+
+from .protocol import (
+    AsyncTransport,
+    HttpHeaders,
+    HttpRequest,
+    HttpResponse,
+    OperationClass,
+    Transport,
+)
+from .codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
+from .json_stream import PageStreamParser
+from .pipeline import build_request, raise_for_response
+from .requests_transport import RequestsTransport
+from .aiohttp_transport import AiohttpTransport
+from .httpx_transport import AsyncHttpxTransport, HttpxTransport
+
+__all__ = [
+    "Transport",
+    "AsyncTransport",
+    "HttpHeaders",
+    "HttpRequest",
+    "HttpResponse",
+    "OperationClass",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonCodec",
+    "MsgspecJsonCodec",
+    "get_json_codec",
+    "PageStreamParser",
+    "build_request",
+    "raise_for_response",
+    "RequestsTransport",
+    "AiohttpTransport",
+    "HttpxTransport",
+    "AsyncHttpxTransport",
+]
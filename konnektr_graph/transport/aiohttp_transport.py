@@ -0,0 +1,126 @@
+# konnektr_graph/transport/aiohttp_transport.py
+"""
+Asynchronous transport built on an aiohttp.ClientSession.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from ..exceptions import ServiceRequestError
+from .protocol import HttpHeaders, HttpRequest, HttpResponse
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class AiohttpTransport:
+    """
+    Sends requests through an ``aiohttp.ClientSession`` created on first use.
+
+    Response bodies are returned as received; the client decodes them.
+
+    :param connector: Optional shared connector. When given, the connector options
+        are ignored and the connector is not closed by the transport.
+    :param limit: Maximum number of simultaneous connections, 0 for no limit (default: 100)
+    :param limit_per_host: Maximum number of simultaneous connections to the same
+        host, 0 for no limit (default: 0)
+    :param keepalive_timeout: Seconds an idle connection is kept open for reuse (default: 15)
+    :param ttl_dns_cache: Seconds resolved DNS entries are cached, None to cache
+        forever (default: 10)
+    """
+
+    def __init__(
+        self,
+        *,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+    ):
+        self._connector = connector
+        self._connector_options: Dict[str, Any] = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": ttl_dns_cache,
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AiohttpTransport":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            if self._connector is not None:
+                self._session = aiohttp.ClientSession(
+                    connector=self._connector,
+                    connector_owner=False,
+                    auto_decompress=False,
+                )
+            else:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(**self._connector_options),
+                    auto_decompress=False,
+                )
+        return self._session
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        """
+        Send a request and return the undecoded response, read unless streamed.
+
+        :param request: The request to send.
+        :return: The response.
+        :raises ServiceRequestError: If the request could not be sent.
+        """
+        session = await self._get_session()
+        try:
+            response = await session.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                data=request.content,
+                **request.options,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ServiceRequestError(str(e)) from e
+
+        if request.stream:
+            return HttpResponse(
+                request=request,
+                status_code=response.status,
+                headers=HttpHeaders(response.headers),
+                stream=self._iter_body(response),
+                release=response.close,
+            )
+        content = b"".join([chunk async for chunk in self._iter_body(response)])
+        return HttpResponse(
+            request=request,
+            status_code=response.status,
+            headers=HttpHeaders(response.headers),
+            content=content,
+        )
+
+    @staticmethod
+    async def _iter_body(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                yield chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            response.close()
+            raise ServiceRequestError(str(e)) from e
+        except BaseException:
+            response.close()
+            raise
+        # Fully read, so the connection can go back to the pool
+        response.release()
+
+    async def close(self) -> None:
+        """Close the session. A shared connector is left open."""
+        if self._session:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,141 @@
+# konnektr_graph/transport/codec.py
+"""
+JSON codecs used to encode request bodies and decode response bodies.
+
+orjson and msgspec are used when installed (``pip install konnektr-graph[fast-json]``),
+otherwise the standard library ``json`` module.
+"""
+import json
+from typing import Any, Callable, Dict, Optional, Protocol, Union, runtime_checkable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """Protocol for JSON codecs. ``loads`` raises ValueError on invalid JSON."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON."""
+        ...
+
+    def loads(self, data: Union[bytes, bytearray]) -> Any:
+        """Decode UTF-8 JSON from bytes or a bytearray."""
+        ...
+
+
+class StdlibJsonCodec:
+    """JSON codec built on the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    JSON codec built on orjson.
+
+    Objects orjson cannot encode, such as integers wider than 64 bits, fall
+    back to the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson. Install it with: pip install orjson"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _stdlib.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray]) -> Any:
+        # orjson.JSONDecodeError is a ValueError
+        return orjson.loads(data)
+
+
+class MsgspecJsonCodec:
+    """
+    JSON codec built on msgspec.
+
+    Objects msgspec cannot encode fall back to the standard library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError(
+                "MsgspecJsonCodec requires msgspec. Install it with: pip install msgspec"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except TypeError:
+            return _stdlib.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+_stdlib = StdlibJsonCodec()
+
+_CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecJsonCodec,
+    "json": StdlibJsonCodec,
+}
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Get a JSON codec by name.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"`` or ``"json"``. None picks the fastest
+            installed backend, in that order.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ImportError: If the named backend is not installed.
+        ValueError: If the name is unknown.
+    """
+    if name is None:
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecJsonCodec()
+        return _stdlib
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}', expected one of {list(_CODECS)}")
+    return _CODECS[name]()
+
+
+default_json_codec: JsonCodec = get_json_codec()
@@ -0,0 +1,246 @@
+# konnektr_graph/transport/httpx_transport.py
+"""
+HTTP/2 capable transports built on httpx.
+
+Requires the optional ``http2`` extra: ``pip install konnektr-graph[http2]``.
+"""
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore
+
+from ..exceptions import ServiceRequestError
+from .protocol import HttpHeaders, HttpRequest, HttpResponse
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "HTTP/2 support requires httpx. "
+            "Install it with: pip install konnektr-graph[http2]"
+        )
+
+
+def _client_options(
+    http1: bool,
+    http2: bool,
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+) -> Dict[str, Any]:
+    return {
+        "http1": http1,
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        # Timeouts are opt-in per request, as with the other transports
+        "timeout": None,
+    }
+
+
+class HttpxTransport:
+    """
+    Sends requests through an ``httpx.Client``, multiplexing them over HTTP/2.
+
+    With HTTP/2 many requests share a single connection per host, so a small
+    connection pool can serve a large number of threads.
+
+    :param client: Optional externally managed client. When given, the other
+        options are ignored and the client is not closed by the transport.
+    :param http2: Whether to negotiate HTTP/2 (default: True)
+    :param http1: Whether to allow HTTP/1.1. Set to False to use HTTP/2 with prior
+        knowledge on plain-text (http://) endpoints (default: True)
+    :param max_connections: Maximum number of open connections (default: 10)
+    :param max_keepalive_connections: Maximum number of idle connections kept open (default: 10)
+    :param keepalive_expiry: Seconds an idle connection is kept open (default: 15)
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Optional["httpx.Client"] = None,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: Optional[int] = 10,
+        max_keepalive_connections: Optional[int] = 10,
+        keepalive_expiry: Optional[float] = 15.0,
+    ):
+        _require_httpx()
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(
+                **_client_options(
+                    http1,
+                    http2,
+                    max_connections,
+                    max_keepalive_connections,
+                    keepalive_expiry,
+                )
+            )
+        self.client = client
+
+    def __enter__(self) -> "HttpxTransport":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        """
+        Send a request and return the undecoded response, read unless streamed.
+
+        :param request: The request to send.
+        :return: The response.
+        :raises ServiceRequestError: If the request could not be sent.
+        """
+        try:
+            response = self.client.send(
+                self.client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.content,
+                    **request.options,
+                ),
+                stream=True,
+            )
+        except httpx.HTTPError as e:
+            raise ServiceRequestError(str(e)) from e
+
+        if request.stream:
+            return HttpResponse(
+                request=request,
+                status_code=response.status_code,
+                headers=HttpHeaders(response.headers),
+                stream=self._iter_body(response),
+                release=response.close,
+            )
+        # Keep the body as sent on the wire; the client decodes it
+        content = b"".join(self._iter_body(response))
+        return HttpResponse(
+            request=request,
+            status_code=response.status_code,
+            headers=HttpHeaders(response.headers),
+            content=content,
+        )
+
+    @staticmethod
+    def _iter_body(response: "httpx.Response") -> Iterator[bytes]:
+        try:
+            yield from response.iter_raw()
+        except httpx.HTTPError as e:
+            raise ServiceRequestError(str(e)) from e
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Close the client if it is owned by the transport."""
+        if self._owns_client:
+            self.client.close()
+
+
+class AsyncHttpxTransport:
+    """
+    Sends requests through an ``httpx.AsyncClient``, multiplexing them over HTTP/2.
+
+    With HTTP/2 many concurrent requests share a single connection per host
+    instead of needing one socket per in-flight request.
+
+    :param client: Optional externally managed client. When given, the other
+        options are ignored and the client is not closed by the transport.
+    :param http2: Whether to negotiate HTTP/2 (default: True)
+    :param http1: Whether to allow HTTP/1.1. Set to False to use HTTP/2 with prior
+        knowledge on plain-text (http://) endpoints (default: True)
+    :param max_connections: Maximum number of open connections (default: 10)
+    :param max_keepalive_connections: Maximum number of idle connections kept open (default: 10)
+    :param keepalive_expiry: Seconds an idle connection is kept open (default: 15)
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Optional["httpx.AsyncClient"] = None,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: Optional[int] = 10,
+        max_keepalive_connections: Optional[int] = 10,
+        keepalive_expiry: Optional[float] = 15.0,
+    ):
+        _require_httpx()
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                **_client_options(
+                    http1,
+                    http2,
+                    max_connections,
+                    max_keepalive_connections,
+                    keepalive_expiry,
+                )
+            )
+        self.client = client
+
+    async def __aenter__(self) -> "AsyncHttpxTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        """
+        Send a request and return the undecoded response, read unless streamed.
+
+        :param request: The request to send.
+        :return: The response.
+        :raises ServiceRequestError: If the request could not be sent.
+        """
+        try:
+            response = await self.client.send(
+                self.client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.content,
+                    **request.options,
+                ),
+                stream=True,
+            )
+        except httpx.HTTPError as e:
+            raise ServiceRequestError(str(e)) from e
+
+        if request.stream:
+            return HttpResponse(
+                request=request,
+                status_code=response.status_code,
+                headers=HttpHeaders(response.headers),
+                stream=self._iter_body(response),
+                release=response.aclose,
+            )
+        # Keep the body as sent on the wire; the client decodes it
+        content = b"".join([chunk async for chunk in self._iter_body(response)])
+        return HttpResponse(
+            request=request,
+            status_code=response.status_code,
+            headers=HttpHeaders(response.headers),
+            content=content,
+        )
+
+    @staticmethod
+    async def _iter_body(response: "httpx.Response") -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_raw():
+                yield chunk
+        except httpx.HTTPError as e:
+            raise ServiceRequestError(str(e)) from e
+        finally:
+            await response.aclose()
+
+    async def close(self) -> None:
+        """Close the client if it is owned by the transport."""
+        if self._owns_client:
+            await self.client.aclose()
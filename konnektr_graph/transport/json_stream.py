@@ -0,0 +1,285 @@
+# konnektr_graph/transport/json_stream.py
+"""
+Incremental parsing of paged list responses.
+
+A page is a JSON object whose items array (``value``) can be large. The parser
+is fed the body chunk by chunk and returns every item as soon as its closing
+bracket arrives, so the first items can be used before the page is fully
+received and the decoded page is never held in memory at once. The other keys
+of the page, such as ``nextLink`` and ``continuationToken``, are collected in
+``metadata``.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from .codec import JsonCodec, default_json_codec
+
+_WHITESPACE = b" \t\r\n"
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,}\]\s]")
+
+# Compact the buffer once this many bytes have been consumed
+_COMPACT_AFTER = 1 << 16
+
+_INCOMPLETE = object()
+
+
+class PageStreamParser:
+    """
+    Incremental parser for ``{"<items_key>": [...], ...}`` response bodies.
+
+    Args:
+        items_key: The key of the items array. Defaults to "value".
+        json_codec: Codec used to decode each item and metadata value.
+    """
+
+    def __init__(
+        self, items_key: str = "value", json_codec: Optional[JsonCodec] = None
+    ):
+        self._items_key = items_key
+        self._codec = json_codec or default_json_codec
+        self._buf = bytearray()
+        self._pos = 0
+        self._phase = "start"  # start, key, colon, value, items, end
+        self._key: Optional[str] = None
+        # Resumable scan state of the value being read
+        self._value_start: Optional[int] = None
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+        self._fast = False
+        self.metadata: Dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the page was seen."""
+        return self._phase == "end"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feed the next chunk of the body.
+
+        Returns:
+            The items completed by this chunk, decoded, in order.
+
+        Raises:
+            ValueError: If the body is not a JSON object or is malformed.
+        """
+        self._buf += chunk
+        items: List[Any] = []
+        self._parse(items, final=False)
+        if self._value_start is None and self._pos > _COMPACT_AFTER:
+            del self._buf[: self._pos]
+            self._pos = 0
+        return items
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body.
+
+        Returns:
+            Any items completed at the end of the body.
+
+        Raises:
+            ValueError: If the body ended before the page was complete.
+        """
+        items: List[Any] = []
+        self._parse(items, final=True)
+        if self._phase != "end":
+            raise ValueError("Incomplete JSON page")
+        return items
+
+    def _skip(self, extra: bytes = b"") -> Optional[int]:
+        """Skip whitespace (and ``extra``); return the next byte or None."""
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and (buf[pos] in _WHITESPACE or buf[pos] in extra):
+            pos += 1
+        self._pos = pos
+        return buf[pos] if pos < len(buf) else None
+
+    def _parse(self, items: List[Any], final: bool) -> None:
+        codec = self._codec
+        while True:
+            phase = self._phase
+            if phase == "end":
+                if self._skip() is not None:
+                    raise ValueError("Unexpected data after JSON page")
+                return
+
+            if phase == "start":
+                c = self._skip()
+                if c is None:
+                    return
+                if c != ord("{"):
+                    raise ValueError("Expected a JSON object")
+                self._pos += 1
+                self._phase = "key"
+
+            elif phase == "key":
+                c = self._skip(b",")
+                if c is None:
+                    return
+                if c == ord("}"):
+                    self._pos += 1
+                    self._phase = "end"
+                    continue
+                end = self._scan_value(final)
+                if end is None:
+                    return
+                self._key = codec.loads(self._buf[self._pos : end])
+                self._pos = end
+                self._phase = "colon"
+
+            elif phase == "colon":
+                c = self._skip()
+                if c is None:
+                    return
+                if c != ord(":"):
+                    raise ValueError("Expected ':' in JSON object")
+                self._pos += 1
+                self._phase = "value"
+
+            elif phase == "value":
+                c = self._skip()
+                if c is None:
+                    return
+                if self._key == self._items_key and c == ord("["):
+                    self._pos += 1
+                    self._phase = "items"
+                    continue
+                end = self._scan_value(final)
+                if end is None:
+                    return
+                self.metadata[self._key] = codec.loads(  # type: ignore[index]
+                    self._buf[self._pos : end]
+                )
+                self._pos = end
+                self._phase = "key"
+
+            elif phase == "items":
+                c = self._skip(b",")
+                if c is None:
+                    return
+                if c == ord("]"):
+                    self._pos += 1
+                    self._phase = "key"
+                    continue
+                item = self._read_item(final)
+                if item is _INCOMPLETE:
+                    return
+                items.append(item)
+
+    def _read_item(self, final: bool) -> Any:
+        """Decode the item starting at ``self._pos``, or return _INCOMPLETE."""
+        buf = self._buf
+        if buf[self._pos] in b"{[" and (self._value_start != self._pos or self._fast):
+            end = self._scan_balanced(final)
+            if end is None:
+                return _INCOMPLETE
+            try:
+                item = self._codec.loads(buf[self._pos : end])
+            except ValueError:
+                # Brackets inside strings misled the fast scan; scan exactly
+                self._value_start = None
+                end = None
+            else:
+                self._pos = end
+                return item
+        end = self._scan_value(final)
+        if end is None:
+            return _INCOMPLETE
+        item = self._codec.loads(buf[self._pos : end])
+        self._pos = end
+        return item
+
+    def _scan_balanced(self, final: bool) -> Optional[int]:
+        """
+        Find a candidate end of the object or array at ``self._pos`` by counting
+        its bracket type, ignoring strings. The caller validates the candidate.
+        """
+        buf = self._buf
+        opening = buf[self._pos : self._pos + 1]
+        closing = b"}" if opening == b"{" else b"]"
+        if self._value_start != self._pos:
+            self._value_start = self._pos
+            self._fast = True
+            self._scan = self._pos
+            self._depth = 0
+        i = self._scan
+        while True:
+            e = buf.find(closing, i)
+            if e < 0:
+                self._scan = i
+                if final:
+                    # Never balanced: let the exact scan report the error
+                    self._value_start = None
+                    self._fast = False
+                    return len(buf)
+                return None
+            self._depth += buf.count(opening, i, e) - 1
+            i = e + 1
+            if self._depth == 0:
+                self._value_start = None
+                self._fast = False
+                return i
+
+    def _scan_value(self, final: bool) -> Optional[int]:
+        """
+        Find the end of the JSON value starting at ``self._pos``.
+
+        Returns None when the value is not complete yet; the scan resumes where
+        it stopped on the next call.
+        """
+        buf = self._buf
+        if self._value_start != self._pos or self._fast:
+            self._value_start = self._pos
+            self._fast = False
+            self._scan = self._pos
+            self._depth = 0
+            self._in_string = False
+            first = buf[self._pos]
+            if first not in b'"{[':
+                m = _SCALAR_END.search(buf, self._pos)
+                if m is None and not final:
+                    self._value_start = None
+                    return None
+                return self._finish_value(m.start() if m else len(buf))
+
+        i = self._scan
+        while True:
+            if self._in_string:
+                m = _STRING_END.search(buf, i)
+                if m is None:
+                    self._scan = len(buf)
+                    return None
+                if buf[m.start()] == ord("\\"):
+                    i = m.start() + 2
+                    if i > len(buf):
+                        self._scan = m.start()
+                        return None
+                    continue
+                self._in_string = False
+                i = m.end()
+                if self._depth == 0:
+                    return self._finish_value(i)
+                continue
+
+            m = _STRUCTURE.search(buf, i)
+            if m is None:
+                self._scan = len(buf)
+                return None
+            c = buf[m.start()]
+            i = m.end()
+            if c == ord('"'):
+                self._in_string = True
+            elif c in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return self._finish_value(i)
+
+    def _finish_value(self, end: int) -> int:
+        self._value_start = None
+        return end
@@ -0,0 +1,109 @@
+# konnektr_graph/transport/pipeline.py
+"""
+Request building and error mapping shared by the sync and async clients.
+"""
+import json
+from typing import Any, Mapping, Optional
+from urllib.parse import urlencode
+
+from ..exceptions import (
+    AuthenticationError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
+from .codec import JsonCodec, default_json_codec
+from .protocol import HttpHeaders, HttpRequest, HttpResponse
+
+
+def build_request(
+    method: str,
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    auth_headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    idempotent: Optional[bool] = None,
+    json_codec: Optional[JsonCodec] = None,
+    stream: bool = False,
+    **kwargs: Any,
+) -> HttpRequest:
+    """
+    Build an HttpRequest from the arguments used by the client operations.
+
+    Args:
+        method: The HTTP method.
+        url: The request URL.
+        headers: Optional request headers.
+        auth_headers: Optional authentication headers, merged over ``headers``.
+        params: Optional query parameters. List values become repeated parameters.
+        idempotent: Whether the request may be safely retried. None means it is
+            decided by the HTTP method.
+        json_codec: Optional codec used to encode ``json``. Defaults to the
+            fastest installed codec.
+        stream: Whether the transport may stream the response body.
+        **kwargs: ``json`` (object to encode as the request body) or ``data``
+            (raw request body). Anything else is passed to the transport unchanged.
+
+    Returns:
+        The built request.
+    """
+    request_headers = HttpHeaders(headers)
+    if auth_headers:
+        request_headers.update(auth_headers)
+
+    content = kwargs.pop("data", None)
+    if "json" in kwargs:
+        content = (json_codec or default_json_codec).dumps(kwargs.pop("json"))
+        if "Content-Type" not in request_headers:
+            request_headers["Content-Type"] = "application/json"
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    if params:
+        query = urlencode(
+            {k: v for k, v in params.items() if v is not None}, doseq=True
+        )
+        if query:
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+
+    return HttpRequest(
+        method=method,
+        url=url,
+        headers=request_headers,
+        content=content,
+        options=kwargs,
+        idempotent=idempotent,
+        stream=stream,
+    )
+
+
+def raise_for_response(response: HttpResponse) -> None:
+    """
+    Raise the SDK exception matching an unsuccessful response.
+
+    Args:
+        response: The response to check.
+
+    Raises:
+        ResourceNotFoundError: On 404.
+        ResourceExistsError: On 409.
+        AuthenticationError: On 401 or 403.
+        HttpResponseError: On any other unsuccessful status code.
+    """
+    if response.ok:
+        return
+    try:
+        error_data = response.json()
+        message = json.dumps(error_data)
+    except ValueError:
+        message = response.text
+
+    status_code = response.status_code
+    if status_code == 404:
+        raise ResourceNotFoundError(message, status_code)
+    elif status_code == 409:
+        raise ResourceExistsError(message, status_code)
+    elif status_code in (401, 403):
+        raise AuthenticationError(message, status_code)
+    else:
+        raise HttpResponseError(f"Error {status_code}: {message}", status_code)
@@ -0,0 +1,199 @@
+# konnektr_graph/transport/protocol.py
+"""
+Sans-IO request/response objects and the Transport protocols.
+"""
+from dataclasses import dataclass, field
+import inspect
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+from urllib.parse import urlsplit
+
+from .codec import JsonCodec, default_json_codec
+
+# Operation classes used to scope throttling and resilience policies
+OperationClass = Literal["read", "write", "query", "telemetry"]
+
+
+class HttpHeaders(MutableMapping[str, str]):
+    """Case-insensitive header mapping that preserves the original key casing."""
+
+    def __init__(self, headers: Optional[Mapping[str, str]] = None):
+        self._store: Dict[str, tuple] = {}
+        if headers:
+            for key, value in headers.items():
+                self[key] = value
+
+    def __getitem__(self, key: str) -> str:
+        return self._store[key.lower()][1]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._store[key.lower()] = (key, value)
+
+    def __delitem__(self, key: str) -> None:
+        del self._store[key.lower()]
+
+    def __iter__(self) -> Iterator[str]:
+        return (original for original, _ in self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __repr__(self) -> str:
+        return f"HttpHeaders({dict(self.items())!r})"
+
+
+@dataclass
+class HttpRequest:
+    """
+    A fully built HTTP request, independent of any HTTP library.
+
+    Attributes:
+        method: The HTTP method.
+        url: The absolute URL, including any query string.
+        headers: Request headers, including authentication headers.
+        content: Optional encoded request body.
+        options: Transport-specific options (e.g. ``timeout``) passed through as-is.
+        idempotent: Whether the request may be safely retried. None means it is
+            decided by the HTTP method.
+        stream: Whether the transport may return the body as a stream of
+            chunks instead of reading it first.
+    """
+
+    method: str
+    url: str
+    headers: HttpHeaders = field(default_factory=HttpHeaders)
+    content: Optional[bytes] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    idempotent: Optional[bool] = None
+    stream: bool = False
+
+    @property
+    def operation_class(self) -> OperationClass:
+        """The kind of operation: telemetry, query (including search), read or write."""
+        path = urlsplit(self.url).path.rstrip("/")
+        if path.endswith("/telemetry"):
+            return "telemetry"
+        if path.endswith("/query") or path.endswith("/search"):
+            return "query"
+        if self.method.upper() in ("GET", "HEAD", "OPTIONS"):
+            return "read"
+        return "write"
+
+
+@dataclass
+class HttpResponse:
+    """
+    An HTTP response, independent of any HTTP library. The body is fully read
+    into ``content`` unless the request asked for a stream.
+
+    Attributes:
+        request: The request that produced this response.
+        status_code: The HTTP status code.
+        headers: Response headers (case-insensitive).
+        content: The response body. Transports may return it still encoded as
+            given by the Content-Encoding header; the client decodes it.
+        json_codec: Optional codec used by ``json()``. Set by the client.
+        stream: For streamed requests, an iterator (or async iterator) over the
+            body chunks that have not been read into ``content`` yet.
+        release: Callable (possibly async) that releases the connection of a
+            stream that is not read to the end.
+    """
+
+    request: HttpRequest
+    status_code: int
+    headers: HttpHeaders = field(default_factory=HttpHeaders)
+    content: bytes = b""
+    json_codec: Optional[JsonCodec] = field(default=None, repr=False, compare=False)
+    stream: Optional[Union[Iterator[bytes], AsyncIterator[bytes]]] = field(
+        default=None, repr=False, compare=False
+    )
+    release: Optional[Callable[[], Any]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code indicates success (below 400)."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Decode the response body as JSON.
+
+        Raises:
+            ValueError: If the body is empty or not valid JSON.
+        """
+        return (self.json_codec or default_json_codec).loads(self.content)
+
+    def read(self) -> bytes:
+        """Read the rest of a streamed body into ``content`` and return it."""
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            self.content += b"".join(stream)  # type: ignore[arg-type]
+        return self.content
+
+    async def aread(self) -> bytes:
+        """Read the rest of an asynchronously streamed body into ``content``."""
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            self.content += b"".join([chunk async for chunk in stream])  # type: ignore[union-attr]
+        return self.content
+
+    def close(self) -> None:
+        """Abandon a streamed body that was not read to the end."""
+        if self.stream is not None:
+            self.stream = None
+            if self.release is not None:
+                self.release()
+
+    async def aclose(self) -> None:
+        """Abandon an asynchronously streamed body that was not read to the end."""
+        if self.stream is not None:
+            self.stream = None
+            if self.release is not None:
+                result = self.release()
+                if inspect.isawaitable(result):
+                    await result
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Protocol that synchronous HTTP transports must implement."""
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        """Send a request and return the fully read response."""
+        ...
+
+    def close(self) -> None:
+        """Release any resources (connections, sessions) held by the transport."""
+        ...
+
+
+@runtime_checkable
+class AsyncTransport(Protocol):
+    """Protocol that asynchronous HTTP transports must implement."""
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        """Send a request and return the fully read response."""
+        ...
+
+    async def close(self) -> None:
+        """Release any resources (connections, sessions) held by the transport."""
+        ...
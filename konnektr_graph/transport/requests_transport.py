@@ -0,0 +1,110 @@
+# konnektr_graph/transport/requests_transport.py
+"""
+Synchronous transport built on a pooled requests.Session.
+"""
+from typing import Iterator, Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from ..exceptions import ServiceRequestError
+from .protocol import HttpHeaders, HttpRequest, HttpResponse
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class RequestsTransport:
+    """
+    Sends requests through a pooled, keep-alive ``requests.Session``.
+
+    :param session: Optional externally managed session. When given, the pool
+        options are ignored and the session is not closed by the transport.
+    :param pool_connections: Number of per-host connection pools to cache (default: 10)
+    :param pool_maxsize: Maximum number of connections kept per host (default: 10)
+    :param pool_block: Whether to block when the pool is exhausted instead of
+        opening extra, non-pooled connections (default: False)
+    :param keep_alive: Whether to keep connections open between requests (default: True)
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+        self.session = session
+
+    def __enter__(self) -> "RequestsTransport":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        """
+        Send a request and return the undecoded response, read unless streamed.
+
+        :param request: The request to send.
+        :return: The response.
+        :raises ServiceRequestError: If the request could not be sent.
+        """
+        try:
+            response = self.session.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                data=request.content,
+                stream=True,
+                **request.options,
+            )
+        except requests.RequestException as e:
+            raise ServiceRequestError(str(e)) from e
+
+        if request.stream:
+            return HttpResponse(
+                request=request,
+                status_code=response.status_code,
+                headers=HttpHeaders(response.headers),
+                stream=self._iter_body(response),
+                release=response.close,
+            )
+        # Keep the body as sent on the wire; the client decodes it
+        content = b"".join(self._iter_body(response))
+
+        return HttpResponse(
+            request=request,
+            status_code=response.status_code,
+            headers=HttpHeaders(response.headers),
+            content=content,
+        )
+
+    @staticmethod
+    def _iter_body(response: requests.Response) -> Iterator[bytes]:
+        try:
+            yield from response.raw.stream(_CHUNK_SIZE, decode_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            response.close()
+            raise ServiceRequestError(str(e)) from e
+        # Fully read, so the connection can go back to the pool
+        response.raw.release_conn()
+
+    def close(self) -> None:
+        """Close the session if it is owned by the transport."""
+        if self._owns_session:
+            self.session.close()
@@ -0,0 +1,303 @@
+# tests/test_bulk_write.py
+"""
+Tests of ``bulk_write`` against a fake transport and ``LocalBlobStore``.
+"""
+import asyncio
+import gzip
+import json
+import threading
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+import pytest
+
+from konnektr_graph import (
+    BasicDigitalTwin,
+    BasicRelationship,
+    DigitalTwinMetadata,
+    DtdlInterface,
+    KonnektrGraphClient,
+    LocalBlobStore,
+)
+from konnektr_graph.aio import KonnektrGraphClient as AsyncKonnektrGraphClient
+from konnektr_graph.transport import HttpRequest, HttpResponse
+from konnektr_graph.transport.protocol import HttpHeaders
+
+ENDPOINT = "https://graph.example.com"
+MODEL_ID = "dtmi:example:Room;1"
+
+
+class FakeCredential:
+    def get_token(self) -> str:
+        return "token"
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeAsyncCredential:
+    async def get_token(self) -> str:
+        return "token"
+
+    async def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeGraph:
+    """In-memory stand-in for the twins, models and import jobs endpoints."""
+
+    def __init__(self, polls_until_done: int = 2):
+        self.lock = threading.Lock()
+        self.requests: List[HttpRequest] = []
+        self.models: Dict[str, Any] = {}
+        self.twins: Dict[str, Any] = {}
+        self.relationships: Dict[Any, Any] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.job_polls: Dict[str, int] = {}
+        self.polls_until_done = polls_until_done
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        with self.lock:
+            self.requests.append(request)
+            status, body = self._route(request)
+        return HttpResponse(
+            request,
+            status,
+            HttpHeaders({"Content-Type": "application/json"}),
+            json.dumps(body).encode() if body is not None else b"",
+        )
+
+    def _route(self, request: HttpRequest):
+        parts = urlsplit(request.url).path.strip("/").split("/")
+        body = json.loads(request.content) if request.content else None
+        if parts == ["models"] and request.method == "POST":
+            if any(model["@id"] in self.models for model in body):
+                return 409, {"error": {"code": "ModelIdAlreadyExists", "message": ""}}
+            for model in body:
+                self.models[model["@id"]] = model
+            return 201, [{"id": model["@id"], "model": model} for model in body]
+        if parts[0] == "digitaltwins" and len(parts) == 2:
+            self.twins[parts[1]] = body
+            return 200, body
+        if parts[0] == "digitaltwins" and len(parts) == 4:
+            self.relationships[(parts[1], parts[3])] = body
+            return 200, body
+        if parts[:2] == ["jobs", "import"]:
+            job_id = parts[2]
+            if request.method == "PUT":
+                self.jobs[job_id] = dict(
+                    body,
+                    id=job_id,
+                    status="notstarted",
+                    createdDateTime="2026-01-01T00:00:00Z",
+                )
+                self.job_polls[job_id] = 0
+            else:
+                self.job_polls[job_id] += 1
+                done = self.job_polls[job_id] >= self.polls_until_done
+                self.jobs[job_id]["status"] = "completed" if done else "running"
+            return 200, self.jobs[job_id]
+        return 404, {"error": {"code": "NotFound", "message": request.url}}
+
+
+class FakeTransport:
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        return self.graph.handle(request)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncTransport(FakeTransport):
+    async def send(self, request: HttpRequest) -> HttpResponse:  # type: ignore[override]
+        return self.graph.handle(request)
+
+    async def close(self) -> None:  # type: ignore[override]
+        pass
+
+
+def make_batch(count: int):
+    model = DtdlInterface.from_dict(
+        {
+            "@id": MODEL_ID,
+            "@type": "Interface",
+            "@context": "dtmi:dtdl:context;3",
+            "contents": [],
+        }
+    )
+    twins = [
+        BasicDigitalTwin(
+            dtId=f"room-{i}",
+            metadata=DigitalTwinMetadata(model=MODEL_ID),
+            contents={"temperature": i},
+        )
+        for i in range(count)
+    ]
+    relationships = [
+        BasicRelationship(
+            relationshipId=f"next-{i}",
+            sourceId=f"room-{i}",
+            targetId=f"room-{i + 1}",
+            relationshipName="next",
+        )
+        for i in range(count - 1)
+    ]
+    return [model], twins, relationships
+
+
+def read_import_file(path) -> List[Dict[str, Any]]:
+    with gzip.open(path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def graph() -> FakeGraph:
+    return FakeGraph()
+
+
+@pytest.fixture
+def client(graph: FakeGraph) -> KonnektrGraphClient:
+    return KonnektrGraphClient(
+        ENDPOINT, FakeCredential(), transport=FakeTransport(graph)
+    )
+
+
+def test_rest_mode_below_threshold(client, graph, tmp_path):
+    models, twins, relationships = make_batch(20)
+    store = LocalBlobStore(tmp_path)
+
+    result = client.bulk_write(
+        twins, relationships, models, blob_store=store, import_threshold=100
+    )
+
+    assert result.mode == "rest"
+    assert result.completed
+    assert (result.models, result.twins, result.relationships) == (1, 20, 19)
+    assert list(graph.models) == [MODEL_ID]
+    assert set(graph.twins) == {f"room-{i}" for i in range(20)}
+    assert graph.relationships[("room-0", "next-0")]["$targetId"] == "room-1"
+    assert not graph.jobs
+    assert not list(tmp_path.iterdir())
+
+
+def test_rest_mode_skips_existing_models(client, graph):
+    models, twins, _ = make_batch(3)
+    client.bulk_write(twins, models=models)
+
+    result = client.bulk_write(twins, models=models)
+
+    assert result.completed
+    assert not result.failures
+
+
+def test_rest_mode_without_blob_store_warns(client, graph):
+    models, twins, relationships = make_batch(5)
+
+    with pytest.warns(UserWarning, match="no blob_store"):
+        result = client.bulk_write(twins, relationships, models, import_threshold=5)
+
+    assert result.mode == "rest"
+    assert result.completed
+    assert len(graph.twins) == 5
+
+
+def test_import_mode_above_threshold(client, graph, tmp_path):
+    models, twins, relationships = make_batch(50)
+    store = LocalBlobStore(tmp_path)
+
+    result = client.bulk_write(
+        twins,
+        relationships,
+        models,
+        blob_store=store,
+        import_threshold=100,
+        job_id="job-1",
+        poll_interval=0.01,
+    )
+
+    assert result.mode == "import"
+    assert result.completed
+    assert result.job is not None and result.job.status == "completed"
+    assert not graph.twins and not graph.models
+
+    # The import file, uploaded to the blob store
+    lines = read_import_file(store.path("job-1.ndjson.gz"))
+    assert lines[0] == {"Section": "Header"}
+    assert lines[1]["fileVersion"] == "1.0.0"
+    assert lines[2] == {"Section": "Models"}
+    assert lines[3]["@id"] == MODEL_ID
+    assert lines[4] == {"Section": "Twins"}
+    assert lines[5] == {
+        "$dtId": "room-0",
+        "$metadata": {"$model": MODEL_ID},
+        "temperature": 0,
+    }
+    assert lines[55] == {"Section": "Relationships"}
+    assert lines[56] == {
+        "$dtId": "room-0",
+        "$relationshipId": "next-0",
+        "$targetId": "room-1",
+        "$relationshipName": "next",
+    }
+    assert len(lines) == 56 + 49
+
+    # The import job payload and its polling
+    create = [r for r in graph.requests if r.method == "PUT"]
+    assert [urlsplit(r.url).path for r in create] == ["/jobs/import/job-1"]
+    assert json.loads(create[0].content) == {
+        "inputBlobUri": store.uri("job-1.ndjson.gz"),
+        "outputBlobUri": store.uri("job-1.output.ndjson"),
+    }
+    polls = [r for r in graph.requests if r.method == "GET"]
+    assert len(polls) == graph.polls_until_done
+    assert all(urlsplit(r.url).path == "/jobs/import/job-1" for r in polls)
+
+
+def test_import_mode_timeout(client, graph, tmp_path):
+    graph.polls_until_done = 1000
+    models, twins, relationships = make_batch(10)
+
+    with pytest.raises(TimeoutError, match="job-2"):
+        client.bulk_write(
+            twins,
+            relationships,
+            models,
+            blob_store=LocalBlobStore(tmp_path),
+            import_threshold=1,
+            job_id="job-2",
+            poll_interval=0.01,
+            timeout=0.05,
+        )
+
+
+def test_async_import_mode_with_async_upload(graph, tmp_path):
+    class AsyncBlobStore(LocalBlobStore):
+        async def upload(self, name, chunks):  # type: ignore[override]
+            return super().upload(name, chunks)
+
+    models, twins, relationships = make_batch(10)
+    store = AsyncBlobStore(tmp_path)
+
+    async def run():
+        async with AsyncKonnektrGraphClient(
+            ENDPOINT, FakeAsyncCredential(), transport=FakeAsyncTransport(graph)
+        ) as client:
+            return await client.bulk_write(
+                twins,
+                relationships,
+                models,
+                blob_store=store,
+                import_threshold=1,
+                job_id="job-3",
+                poll_interval=0.01,
+            )
+
+    result = asyncio.run(run())
+
+    assert result.mode == "import"
+    assert result.completed
+    lines = read_import_file(store.path("job-3.ndjson.gz"))
+    assert sum(1 for line in lines if "$dtId" in line) == 10 + 9
@@ -0,0 +1,179 @@
+# tests/test_circuit_breaker.py
+"""
+Tests of the circuit breaker states and half-open probes, on a fake clock, and
+of probe release in the async client.
+"""
+import asyncio
+import json
+from typing import Dict
+
+import pytest
+
+from konnektr_graph.aio import KonnektrGraphClient as AsyncKonnektrGraphClient
+from konnektr_graph.exceptions import CircuitOpenError, HttpResponseError
+from konnektr_graph.policies import CircuitBreakerPolicy, RateLimiter, RetryPolicy
+from konnektr_graph.policies import circuit_breaker
+from konnektr_graph.transport import HttpRequest, HttpResponse
+from konnektr_graph.transport.protocol import HttpHeaders
+
+ENDPOINT = "https://graph.example.com"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def make_circuit(**options) -> circuit_breaker.Circuit:
+    settings = dict(minimum_calls=2, window_size=4, open_duration=10.0)
+    settings.update(options)
+    return CircuitBreakerPolicy(**settings).get_circuit(
+        HttpRequest("GET", f"{ENDPOINT}/digitaltwins/a")
+    )
+
+
+def trip(circuit: circuit_breaker.Circuit) -> None:
+    for _ in range(2):
+        assert circuit.acquire() is None
+        circuit.record(0.01, 503)
+    assert circuit.state == "open"
+
+
+def test_open_half_open_closed(clock):
+    circuit = make_circuit(half_open_calls=2)
+    trip(circuit)
+    with pytest.raises(CircuitOpenError, match="probing in 10.0s"):
+        circuit.acquire()
+
+    clock.now += 10
+    assert circuit.state == "half_open"
+    first, second = circuit.acquire(), circuit.acquire()
+    assert first is not None and first == second
+    with pytest.raises(CircuitOpenError, match="half-open"):
+        circuit.acquire()
+
+    circuit.record(0.01, 200, probe=first)
+    assert circuit.state == "half_open"
+    circuit.record(0.01, 200, probe=second)
+    assert circuit.state == "closed"
+    assert circuit.acquire() is None
+    assert circuit.snapshot()["times_opened"] == 1
+
+
+def test_open_half_open_reopened(clock):
+    circuit = make_circuit()
+    trip(circuit)
+    clock.now += 10
+    probe = circuit.acquire()
+    circuit.record(0.01, None, probe=probe)
+    assert circuit.state == "open"
+    assert circuit.snapshot()["times_opened"] == 2
+
+    # The next half-open period gets a new token; a late result of the old
+    # probe does not count
+    clock.now += 10
+    new_probe = circuit.acquire()
+    assert new_probe != probe
+    circuit.record(0.01, 200, probe=probe)
+    assert circuit.state == "half_open"
+    circuit.record(0.01, 200, probe=new_probe)
+    assert circuit.state == "closed"
+
+
+def test_cancelled_probe_releases_its_slot(clock):
+    circuit = make_circuit()
+    trip(circuit)
+    clock.now += 10
+    probe = circuit.acquire()
+    with pytest.raises(CircuitOpenError):
+        circuit.acquire()
+
+    circuit.record(0.01, cancelled=True, probe=probe)
+    assert circuit.state == "half_open"
+    assert circuit.acquire() == probe
+
+
+def test_calls_started_while_closed_do_not_settle_half_open(clock):
+    circuit = make_circuit()
+    assert circuit.acquire() is None  # a slow call, started while closed
+    trip(circuit)
+    clock.now += 10
+    probe = circuit.acquire()
+
+    circuit.record(0.01, 200)
+    assert circuit.state == "half_open"
+    circuit.record(0.01, 503)
+    assert circuit.state == "half_open"
+    circuit.record(0.01, 200, probe=probe)
+    assert circuit.state == "closed"
+
+
+def test_calls_started_while_closed_are_ignored_when_open(clock):
+    circuit = make_circuit()
+    trip(circuit)
+    circuit.record(0.01, 200)
+    assert circuit.snapshot()["calls"] == 0
+
+
+class FakeCredential:
+    async def get_token(self) -> str:
+        return "token"
+
+    async def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeTransport:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        return HttpResponse(
+            request,
+            self.status_code,
+            HttpHeaders({"Content-Type": "application/json"}),
+            json.dumps({"$dtId": "a", "$metadata": {"$model": "m"}}).encode(),
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+def test_probe_cancelled_while_rate_limited_is_not_leaked():
+    policy = CircuitBreakerPolicy(minimum_calls=1, window_size=1, open_duration=0.05)
+    circuit = policy.get_circuit(HttpRequest("GET", f"{ENDPOINT}/digitaltwins/a"))
+    transport = FakeTransport(503)
+
+    async def scenario():
+        client = AsyncKonnektrGraphClient(
+            ENDPOINT,
+            FakeCredential(),
+            transport=transport,
+            circuit_breaker=policy,
+            rate_limiter=RateLimiter(requests_per_second=1, burst=1),
+            retry_policy=RetryPolicy(total_retries=0),
+        )
+        with pytest.raises(HttpResponseError):
+            await client.get_digital_twin("a")
+        assert circuit.state == "open"
+        await asyncio.sleep(0.06)
+        assert circuit.state == "half_open"
+
+        # The bucket is empty, so this call waits for the rate limiter and is
+        # cancelled there, before it could send a probe
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get_digital_twin("a"), 0.05)
+
+        assert circuit.acquire() is not None
+
+    asyncio.run(scenario())
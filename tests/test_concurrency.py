@@ -0,0 +1,94 @@
+# tests/test_concurrency.py
+"""
+Tests of the adaptive (AIMD) concurrency limiter, on a fake clock.
+"""
+import asyncio
+
+import pytest
+
+from konnektr_graph.policies import AdaptiveConcurrencyLimiter
+from konnektr_graph.policies import concurrency
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(concurrency, "time", clock)
+    return clock
+
+
+def run_round(limiter, clock, latency, status_code=200):
+    """Fill every slot, let ``latency`` pass, then complete all requests."""
+
+    async def round_trip():
+        started = [await limiter.acquire() for _ in range(limiter.limit)]
+        clock.now += latency
+        for start in started:
+            limiter.release(start, status_code)
+
+    asyncio.run(round_trip())
+
+
+def test_limit_grows_while_healthy(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+    for _ in range(50):
+        run_round(limiter, clock, 0.1)
+    assert limiter.limit == 8
+    assert limiter.snapshot()["baseline_latency"] == pytest.approx(0.1)
+
+
+def test_overload_cuts_the_limit_once_per_burst(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    run_round(limiter, clock, 0.1, status_code=429)
+    snapshot = limiter.snapshot()
+    assert limiter.limit == 8
+    assert snapshot["decreases"] == 1
+    assert snapshot["last_reason"] == "status 429"
+
+
+def test_latency_spike_cuts_the_limit(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    for _ in range(5):
+        run_round(limiter, clock, 0.1)
+    limit = limiter.limit
+    run_round(limiter, clock, 1.0)
+    assert limiter.limit == limit // 2
+    assert limiter.snapshot()["last_reason"] == "latency 1000ms"
+
+
+def test_lasting_latency_shift_becomes_the_new_baseline(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=1)
+    for _ in range(20):
+        run_round(limiter, clock, 0.1)
+    for _ in range(10):
+        run_round(limiter, clock, 0.5)
+    assert limiter.limit == 1
+
+    for _ in range(200):
+        run_round(limiter, clock, 0.5)
+    snapshot = limiter.snapshot()
+    assert snapshot["baseline_latency"] > 0.25
+    assert snapshot["last_decision"] == "increase"
+    assert limiter.limit > 1
+
+
+def test_cancelled_requests_do_not_change_the_limit(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+    async def cancelled_round():
+        started = [await limiter.acquire() for _ in range(4)]
+        for start in started:
+            limiter.release(start, None, cancelled=True)
+
+    asyncio.run(cancelled_round())
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+    assert limiter.snapshot()["decreases"] == 0
@@ -0,0 +1,151 @@
+# tests/test_json_stream.py
+"""
+Tests of the incremental page parser, fed whole bodies and bodies split into
+chunks of every size.
+"""
+import json
+
+import pytest
+
+from konnektr_graph.transport import PageStreamParser, get_json_codec
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return get_json_codec(request.param)
+
+
+def parse(body: bytes, chunk_size: int, codec, items_key: str = "value"):
+    parser = PageStreamParser(items_key, json_codec=codec)
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start : start + chunk_size]))
+    items.extend(parser.close())
+    assert parser.done
+    return items, parser.metadata
+
+
+def assert_parses(page, codec, items_key: str = "value"):
+    body = json.dumps(page).encode()
+    expected_metadata = {k: v for k, v in page.items() if k != items_key}
+    for chunk_size in (1, 2, 3, 7, 64, len(body)):
+        items, metadata = parse(body, chunk_size, codec, items_key)
+        assert items == page.get(items_key, [])
+        assert metadata == expected_metadata
+
+
+def test_items_split_across_chunks(codec):
+    page = {
+        "value": [
+            {"$dtId": "room-1", "temperature": 21.5, "tags": ["a", "b"]},
+            {"$dtId": "room-2", "nested": {"deep": [{"x": [1, [2, [3]]]}]}},
+            [1, 2, {"three": 3}],
+            "a string item",
+            42,
+            -1.5e3,
+            True,
+            None,
+        ]
+    }
+    assert_parses(page, codec)
+
+
+def test_strings_with_brackets_and_escaped_quotes(codec):
+    page = {
+        "value": [
+            {"name": "}]{[", "path": "a\\b"},
+            {"quote": 'say "}" and "]"', "list": ["]", "[", "{", "}"]},
+            ['"[', "\\", '\\"]'],
+            {"unicode": "café ☃ }"},
+        ],
+        "nextLink": "https://graph.example.com/query?q={x}[y]",
+    }
+    assert_parses(page, codec)
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        {"nextLink": "https://next", "value": [{"a": 1}, {"b": 2}]},
+        {"value": [{"a": 1}, {"b": 2}], "nextLink": "https://next"},
+        {
+            "continuationToken": "token",
+            "value": [{"a": 1}],
+            "nextLink": None,
+            "extra": {"k": [1, {"v": "]"}]},
+        },
+    ],
+)
+def test_metadata_before_and_after_items(page, codec):
+    assert_parses(page, codec)
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        {"value": []},
+        {},
+        {"value": [], "continuationToken": None},
+        {"items": [{"a": 1}], "nextLink": "https://next"},
+    ],
+)
+def test_empty_pages(page, codec):
+    assert_parses(page, codec)
+
+
+def test_custom_items_key(codec):
+    assert_parses({"items": [{"a": 1}], "value": "metadata"}, codec, "items")
+
+
+def test_items_are_returned_as_soon_as_they_are_complete(codec):
+    parser = PageStreamParser(json_codec=codec)
+    assert parser.feed(b'{"value": [{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}") == [{"b": 2}]
+    assert parser.feed(b'], "nextLink": "x"}') == []
+    assert parser.close() == []
+    assert parser.metadata == {"nextLink": "x"}
+
+
+def test_large_page_is_compacted(codec):
+    page = {"value": [{"$dtId": f"twin-{i}", "pad": "x" * 50} for i in range(5000)]}
+    body = json.dumps(page).encode()
+    items, _ = parse(body, 4096, codec)
+    assert items == page["value"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"[1, 2]",
+        b'"value"',
+        b'{"value" [1]}',
+        b'{"value": [{"a": }]}',
+        b'{"value": [{"a": 1]]}',
+        b'{"value": [1, 2]} trailing',
+        b'{"value": [tru]}',
+    ],
+)
+def test_malformed_input_raises(body, codec):
+    for chunk_size in (1, len(body)):
+        with pytest.raises(ValueError):
+            parse(body, chunk_size, codec)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"{",
+        b'{"value": [',
+        b'{"value": [{"a": 1}',
+        b'{"value": [{"a": "unterminated',
+        b'{"value": [{"a": 1}], "nextLink": "https://ne',
+        b'{"value": [1, 2]',
+    ],
+)
+def test_truncated_input_raises(body, codec):
+    for chunk_size in (1, max(1, len(body))):
+        with pytest.raises(ValueError):
+            parse(body, chunk_size, codec)
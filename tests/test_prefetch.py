@@ -0,0 +1,318 @@
+# tests/test_prefetch.py
+"""
+Tests of page prefetching in both paged iterators against a fake transport:
+how far the worker runs ahead, errors in page order, and stopping the worker.
+"""
+import asyncio
+import gc
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pytest
+
+from konnektr_graph import KonnektrGraphClient
+from konnektr_graph.aio import KonnektrGraphClient as AsyncKonnektrGraphClient
+from konnektr_graph.exceptions import HttpResponseError
+from konnektr_graph.transport import HttpRequest, HttpResponse
+from konnektr_graph.transport.protocol import HttpHeaders
+
+ENDPOINT = "https://graph.example.com"
+QUERY = "SELECT * FROM DIGITALTWINS"
+WORKER_NAME = "konnektr-graph-prefetch"
+
+
+class FakeCredential:
+    def get_token(self) -> str:
+        return "token"
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeAsyncCredential:
+    async def get_token(self) -> str:
+        return "token"
+
+    async def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakePages:
+    """
+    Query endpoint serving pages of two twins each, chained by continuation
+    tokens. ``pages`` of None never runs out; page ``fail_at`` answers 400.
+    """
+
+    def __init__(self, pages: Optional[int] = None, fail_at: Optional[int] = None):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.block_at: Optional[int] = None
+        self.lock = threading.Lock()
+        self.requested: List[int] = []
+        self.cancelled: List[int] = []
+
+    def _request(self, request: HttpRequest) -> int:
+        index = int(request.headers.get("x-ms-continuation", "0"))
+        with self.lock:
+            self.requested.append(index)
+        return index
+
+    def _respond(self, request: HttpRequest, index: int) -> HttpResponse:
+        if index == self.fail_at:
+            status = 400
+            body = {"error": {"code": "BadRequest", "message": f"page {index}"}}
+        else:
+            status = 200
+            body = {"value": [{"$dtId": f"{index}-{n}"} for n in range(2)]}
+        headers = {"Content-Type": "application/json"}
+        if status == 200 and (self.pages is None or index + 1 < self.pages):
+            headers["x-ms-continuation"] = str(index + 1)
+        return HttpResponse(
+            request, status, HttpHeaders(headers), json.dumps(body).encode()
+        )
+
+    def items(self, pages: int) -> List[str]:
+        return [f"{index}-{n}" for index in range(pages) for n in range(2)]
+
+
+class FakeTransport:
+    def __init__(self, pages: FakePages):
+        self.pages = pages
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        return self.pages._respond(request, self.pages._request(request))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncTransport:
+    def __init__(self, pages: FakePages):
+        self.pages = pages
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        index = self.pages._request(request)
+        if index == self.pages.block_at:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.pages.cancelled.append(index)
+                raise
+        return self.pages._respond(request, index)
+
+    async def close(self) -> None:
+        pass
+
+
+def make_client(pages: FakePages) -> KonnektrGraphClient:
+    return KonnektrGraphClient(
+        ENDPOINT, FakeCredential(), transport=FakeTransport(pages)
+    )
+
+
+def make_async_client(pages: FakePages) -> AsyncKonnektrGraphClient:
+    return AsyncKonnektrGraphClient(
+        ENDPOINT, FakeAsyncCredential(), transport=FakeAsyncTransport(pages)
+    )
+
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the worker"
+        time.sleep(0.005)
+
+
+def settle() -> None:
+    """Give a worker that should be idle the chance to run on regardless."""
+    time.sleep(0.05)
+
+
+def workers() -> List[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == WORKER_NAME]
+
+
+@pytest.fixture(autouse=True)
+def no_workers_left():
+    yield
+    for worker in workers():
+        worker.join(2)
+    assert workers() == []
+
+
+def test_worker_runs_at_most_depth_pages_ahead():
+    pages = FakePages(pages=6)
+    twins = make_client(pages).query_twins(QUERY, prefetch=2)
+
+    # The first page has been taken, so pages 1 and 2 may be fetched ahead
+    assert next(twins)["$dtId"] == "0-0"
+    wait_until(lambda: len(pages.requested) == 3)
+    settle()
+    assert pages.requested == [0, 1, 2]
+
+    assert next(twins)["$dtId"] == "0-1"
+    settle()
+    assert pages.requested == [0, 1, 2]
+
+    # Taking page 1 frees a slot for page 3
+    assert next(twins)["$dtId"] == "1-0"
+    wait_until(lambda: len(pages.requested) == 4)
+    settle()
+    assert pages.requested == [0, 1, 2, 3]
+
+    assert [twin["$dtId"] for twin in twins] == pages.items(6)[3:]
+    assert pages.requested == list(range(6))
+
+
+def test_by_page_runs_at_most_depth_pages_ahead():
+    pages = FakePages(pages=6)
+    by_page = make_client(pages).query_twins(QUERY, prefetch=1).by_page()
+
+    assert [twin["$dtId"] for twin in next(by_page).items] == ["0-0", "0-1"]
+    wait_until(lambda: len(pages.requested) == 2)
+    settle()
+    assert pages.requested == [0, 1]
+    by_page.close()
+
+
+def test_error_reaches_the_consumer_after_earlier_pages():
+    pages = FakePages(pages=5, fail_at=2)
+    twins = make_client(pages).query_twins(QUERY, prefetch=4)
+    seen = [next(twins)["$dtId"]]
+
+    # The worker has already hit the error; it waits behind pages 0 and 1
+    wait_until(lambda: len(pages.requested) == 3)
+    with pytest.raises(HttpResponseError, match="page 2"):
+        for twin in twins:
+            seen.append(twin["$dtId"])
+
+    assert seen == pages.items(2)
+    assert pages.requested == [0, 1, 2]
+    assert list(twins) == []
+
+
+def test_close_stops_the_worker():
+    pages = FakePages()
+    twins = make_client(pages).query_twins(QUERY, prefetch=2)
+    next(twins)
+    wait_until(lambda: len(pages.requested) == 3)
+
+    twins.close()
+
+    for worker in workers():
+        worker.join(2)
+    assert workers() == []
+    assert pages.requested == [0, 1, 2]
+    assert list(twins) == []
+
+
+def test_dropped_iterator_stops_the_worker():
+    pages = FakePages()
+    twins = make_client(pages).query_twins(QUERY, prefetch=2)
+    next(twins)
+    wait_until(lambda: len(pages.requested) == 3)
+
+    del twins
+    gc.collect()
+
+    for worker in workers():
+        worker.join(2)
+    assert workers() == []
+    assert pages.requested == [0, 1, 2]
+
+
+async def collect_ids(twins, seen: List[str]) -> None:
+    async for twin in twins:
+        seen.append(twin["$dtId"])
+
+
+async def idle() -> None:
+    """Run the event loop long enough for the prefetch task to get ahead."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_async_task_runs_at_most_depth_pages_ahead():
+    pages = FakePages(pages=6)
+
+    async def scenario():
+        twins = make_async_client(pages).query_twins(QUERY, prefetch=2)
+        assert (await twins.__anext__())["$dtId"] == "0-0"
+        await idle()
+        assert pages.requested == [0, 1, 2]
+
+        assert (await twins.__anext__())["$dtId"] == "0-1"
+        await idle()
+        assert pages.requested == [0, 1, 2]
+
+        assert (await twins.__anext__())["$dtId"] == "1-0"
+        await idle()
+        assert pages.requested == [0, 1, 2, 3]
+
+        seen: List[str] = []
+        await collect_ids(twins, seen)
+        assert seen == pages.items(6)[3:]
+
+    asyncio.run(scenario())
+    assert pages.requested == list(range(6))
+
+
+def test_async_error_reaches_the_consumer_after_earlier_pages():
+    pages = FakePages(pages=5, fail_at=2)
+
+    async def scenario():
+        twins = make_async_client(pages).query_twins(QUERY, prefetch=4)
+        seen = [(await twins.__anext__())["$dtId"]]
+        await idle()
+        assert pages.requested == [0, 1, 2]
+
+        with pytest.raises(HttpResponseError, match="page 2"):
+            await collect_ids(twins, seen)
+        assert seen == pages.items(2)
+
+        with pytest.raises(StopAsyncIteration):
+            await twins.__anext__()
+
+    asyncio.run(scenario())
+    assert pages.requested == [0, 1, 2]
+
+
+def test_async_aclose_cancels_the_request_in_flight():
+    pages = FakePages()
+    pages.block_at = 2
+
+    async def scenario():
+        twins = make_async_client(pages).query_twins(QUERY, prefetch=2)
+        await twins.__anext__()
+        await idle()
+        assert pages.requested == [0, 1, 2]
+
+        await asyncio.wait_for(twins.aclose(), 1)
+        assert pages.cancelled == [2]
+
+        with pytest.raises(StopAsyncIteration):
+            await twins.__anext__()
+
+    asyncio.run(scenario())
+    assert pages.requested == [0, 1, 2]
+
+
+def test_async_dropped_iterator_cancels_the_task():
+    pages = FakePages()
+    pages.block_at = 2
+
+    async def scenario():
+        twins = make_async_client(pages).query_twins(QUERY, prefetch=2)
+        await twins.__anext__()
+        await idle()
+        assert pages.requested == [0, 1, 2]
+
+        del twins
+        gc.collect()
+        await idle()
+        assert pages.cancelled == [2]
+
+    asyncio.run(scenario())
+    assert pages.requested == [0, 1, 2]
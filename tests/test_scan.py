@@ -0,0 +1,219 @@
+# tests/test_scan.py
+"""
+Tests of query partitioning and of ``query_twins_parallel`` against a fake
+transport.
+"""
+import asyncio
+import json
+import threading
+from typing import Dict, List
+
+import pytest
+
+from konnektr_graph import KonnektrGraphClient
+from konnektr_graph.aio import KonnektrGraphClient as AsyncKonnektrGraphClient
+from konnektr_graph.scan import (
+    id_lookup_queries,
+    id_range_partitions,
+    model_partitions,
+    partition_query,
+    query_alias,
+)
+from konnektr_graph.transport import HttpRequest, HttpResponse
+from konnektr_graph.transport.protocol import HttpHeaders
+
+ENDPOINT = "https://graph.example.com"
+
+
+class FakeCredential:
+    def get_token(self) -> str:
+        return "token"
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeAsyncCredential:
+    async def get_token(self) -> str:
+        return "token"
+
+    async def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeGraph:
+    """Lists two models and answers every query with one twin per partition."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queries: List[str] = []
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        if request.url.startswith(f"{ENDPOINT}/models"):
+            body = {"value": [{"id": "dtmi:a;1"}, {"id": "dtmi:b;1"}]}
+        else:
+            query = json.loads(request.content)["query"]
+            with self.lock:
+                self.queries.append(query)
+                index = len(self.queries)
+            body = {"value": [{"$dtId": f"twin-{index}"}]}
+        return HttpResponse(
+            request,
+            200,
+            HttpHeaders({"Content-Type": "application/json"}),
+            json.dumps(body).encode(),
+        )
+
+
+class FakeTransport:
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        return self.graph.handle(request)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncTransport:
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        return self.graph.handle(request)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    "query, alias",
+    [
+        ("SELECT * FROM DIGITALTWINS", None),
+        ("SELECT * FROM DIGITALTWINS T", "T"),
+        ("SELECT T FROM DIGITALTWINS AS T WHERE T.x = 1", "T"),
+        ("SELECT * FROM DIGITALTWINS WHERE $dtId = 'a'", None),
+        ("SELECT * FROM DIGITALTWINS ORDER BY $dtId", None),
+        ("SELECT * FROM digitaltwins order by $dtId", None),
+        ("SELECT * FROM DIGITALTWINS GROUP BY $metadata.$model", None),
+        ("SELECT * FROM DIGITALTWINS LIMIT 10", None),
+        ("SELECT * FROM DIGITALTWINS OFFSET 10", None),
+        ("SELECT * FROM DIGITALTWINS JOIN C RELATED T.contains", None),
+        ("SELECT * FROM DIGITALTWINS ORDERS WHERE ORDERS.x = 1", "ORDERS"),
+    ],
+)
+def test_query_alias(query, alias):
+    assert query_alias(query) == alias
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("SELECT * FROM DIGITALTWINS", "SELECT * FROM DIGITALTWINS WHERE P"),
+        (
+            "SELECT * FROM DIGITALTWINS T WHERE T.x = 1",
+            "SELECT * FROM DIGITALTWINS T WHERE (P) AND (T.x = 1)",
+        ),
+        (
+            "SELECT * FROM DIGITALTWINS ORDER BY $dtId",
+            "SELECT * FROM DIGITALTWINS WHERE P ORDER BY $dtId",
+        ),
+        (
+            "SELECT * FROM DIGITALTWINS T WHERE T.x = 1 ORDER BY T.$dtId DESC",
+            "SELECT * FROM DIGITALTWINS T WHERE (P) AND (T.x = 1) "
+            "ORDER BY T.$dtId DESC",
+        ),
+        (
+            "SELECT * FROM DIGITALTWINS LIMIT 10",
+            "SELECT * FROM DIGITALTWINS WHERE P LIMIT 10",
+        ),
+        (
+            "SELECT * FROM DIGITALTWINS WHERE name = 'order by x'",
+            "SELECT * FROM DIGITALTWINS WHERE (P) AND (name = 'order by x')",
+        ),
+    ],
+)
+def test_partition_query(query, expected):
+    assert partition_query(query, "P") == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT TOP(10) FROM DIGITALTWINS",
+        "SELECT COUNT() FROM DIGITALTWINS",
+        "SELECT * FROM RELATIONSHIPS",
+    ],
+)
+def test_partition_query_rejects(query):
+    with pytest.raises(ValueError):
+        partition_query(query, "P")
+
+
+def test_model_partitions_include_unlisted_models():
+    assert model_partitions(["a", "b", "a"], "T") == [
+        "T.$metadata.$model = 'a'",
+        "T.$metadata.$model = 'b'",
+        "T.$metadata.$model NOT IN ['a', 'b']",
+    ]
+    assert model_partitions(["a"], include_unlisted=False) == [
+        "$metadata.$model = 'a'"
+    ]
+    assert model_partitions([]) == ["IS_DEFINED($dtId)"]
+
+
+def test_id_range_partitions():
+    assert id_range_partitions(["n", "g"]) == [
+        "$dtId < 'g'",
+        "$dtId >= 'g' AND $dtId < 'n'",
+        "$dtId >= 'n'",
+    ]
+
+
+def test_id_lookup_queries_split_and_escape():
+    queries = id_lookup_queries(["a", "b", "a", "it's"], max_ids=2)
+    assert queries == [
+        "SELECT * FROM DIGITALTWINS T WHERE T.$dtId IN ['a', 'b']",
+        "SELECT * FROM DIGITALTWINS T WHERE T.$dtId IN ['it\\'s']",
+    ]
+
+
+EXPECTED_PARTITIONS = [
+    "SELECT * FROM DIGITALTWINS WHERE $metadata.$model = 'dtmi:a;1' ORDER BY $dtId",
+    "SELECT * FROM DIGITALTWINS WHERE $metadata.$model = 'dtmi:b;1' ORDER BY $dtId",
+    "SELECT * FROM DIGITALTWINS WHERE $metadata.$model NOT IN "
+    "['dtmi:a;1', 'dtmi:b;1'] ORDER BY $dtId",
+]
+
+
+def test_query_twins_parallel_without_alias_and_with_order_by():
+    graph = FakeGraph()
+    client = KonnektrGraphClient(
+        ENDPOINT, FakeCredential(), transport=FakeTransport(graph)
+    )
+
+    twins = list(
+        client.query_twins_parallel("SELECT * FROM DIGITALTWINS ORDER BY $dtId")
+    )
+
+    assert len(twins) == 3
+    assert sorted(graph.queries) == EXPECTED_PARTITIONS
+
+
+def test_async_query_twins_parallel_without_alias_and_with_order_by():
+    graph = FakeGraph()
+
+    async def scan():
+        async with AsyncKonnektrGraphClient(
+            ENDPOINT, FakeAsyncCredential(), transport=FakeAsyncTransport(graph)
+        ) as client:
+            iterator = client.query_twins_parallel(
+                "SELECT * FROM DIGITALTWINS ORDER BY $dtId"
+            )
+            return [twin async for twin in iterator]
+
+    twins = asyncio.run(scan())
+
+    assert len(twins) == 3
+    assert sorted(graph.queries) == EXPECTED_PARTITIONS
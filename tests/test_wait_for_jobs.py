@@ -0,0 +1,282 @@
+# tests/test_wait_for_jobs.py
+"""
+Tests of ``wait_for_jobs`` against a fake jobs endpoint. Poll scheduling is
+checked on a fake clock; completion order and cancellation use real time.
+"""
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import pytest
+
+from konnektr_graph import DeleteJob, ImportJob, KonnektrGraphClient
+from konnektr_graph import client as sync_client_module
+from konnektr_graph.aio import KonnektrGraphClient as AsyncKonnektrGraphClient
+from konnektr_graph.aio import client as async_client_module
+from konnektr_graph.transport import HttpRequest, HttpResponse
+from konnektr_graph.transport.protocol import HttpHeaders
+
+ENDPOINT = "https://graph.example.com"
+START = 1000.0
+
+
+class FakeCredential:
+    def get_token(self) -> str:
+        return "token"
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeAsyncCredential:
+    async def get_token(self) -> str:
+        return "token"
+
+    async def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": "Bearer token"}
+
+
+class FakeClock:
+    """Stands in for the ``time`` module; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = START
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeAsyncio:
+    """Stands in for the ``asyncio`` module with a sleep on the fake clock."""
+
+    def __init__(self, clock: FakeClock):
+        self._clock = clock
+
+    async def sleep(self, seconds: float) -> None:
+        self._clock.now += seconds
+        await asyncio.sleep(0)
+
+    def __getattr__(self, name: str):
+        return getattr(asyncio, name)
+
+
+class FakeJobs:
+    """
+    Jobs endpoint whose jobs are running until their ``polls_until_done``-th
+    poll, optionally answering each poll after a (real) ``latency``.
+    """
+
+    def __init__(self, clock: Optional[FakeClock] = None):
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.polls_until_done: Dict[str, Optional[int]] = {}
+        self.latency: Dict[str, float] = {}
+        self.poll_times: Dict[str, List[float]] = {}
+        self.cancelled: List[str] = []
+
+    def add(
+        self,
+        job_id: str,
+        polls_until_done: Optional[int] = 1,
+        latency: float = 0.0,
+    ) -> DeleteJob:
+        self.polls_until_done[job_id] = polls_until_done
+        self.latency[job_id] = latency
+        self.poll_times[job_id] = []
+        return DeleteJob.from_dict(self._body(job_id, "running"))
+
+    def _body(self, job_id: str, status: str) -> Dict[str, str]:
+        return {"id": job_id, "status": status, "createdDateTime": "2026-01-01"}
+
+    def _poll(self, request: HttpRequest) -> str:
+        job_id = urlsplit(request.url).path.rsplit("/", 1)[-1]
+        with self.lock:
+            polls = self.poll_times[job_id]
+            polls.append(self.clock.now if self.clock else time.monotonic())
+        return job_id
+
+    def _respond(self, request: HttpRequest, job_id: str) -> HttpResponse:
+        with self.lock:
+            done = self.polls_until_done[job_id]
+            polls = len(self.poll_times[job_id])
+        status = "completed" if done is not None and polls >= done else "running"
+        body = self._body(job_id, status)
+        if "/jobs/import/" in request.url:
+            body.update(inputBlobUri="in", outputBlobUri="out")
+        return HttpResponse(
+            request,
+            200,
+            HttpHeaders({"Content-Type": "application/json"}),
+            json.dumps(body).encode(),
+        )
+
+
+class FakeTransport:
+    def __init__(self, jobs: FakeJobs):
+        self.jobs = jobs
+
+    def send(self, request: HttpRequest) -> HttpResponse:
+        job_id = self.jobs._poll(request)
+        time.sleep(self.jobs.latency[job_id])
+        return self.jobs._respond(request, job_id)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncTransport:
+    def __init__(self, jobs: FakeJobs):
+        self.jobs = jobs
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        job_id = self.jobs._poll(request)
+        latency = self.jobs.latency[job_id]
+        try:
+            if latency == float("inf"):
+                await asyncio.Event().wait()
+            elif latency:
+                await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.jobs.cancelled.append(job_id)
+            raise
+        return self.jobs._respond(request, job_id)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sync_client_module, "time", clock)
+    monkeypatch.setattr(async_client_module, "time", clock)
+    monkeypatch.setattr(async_client_module, "asyncio", FakeAsyncio(clock))
+    return clock
+
+
+def make_client(jobs: FakeJobs) -> KonnektrGraphClient:
+    return KonnektrGraphClient(
+        ENDPOINT, FakeCredential(), transport=FakeTransport(jobs)
+    )
+
+
+def wait_async(jobs: FakeJobs, job_list, **options):
+    async def collect():
+        client = AsyncKonnektrGraphClient(
+            ENDPOINT, FakeAsyncCredential(), transport=FakeAsyncTransport(jobs)
+        )
+        return [job async for job in client.wait_for_jobs(job_list, **options)]
+
+    return asyncio.run(collect())
+
+
+@pytest.fixture(params=["sync", "async"])
+def wait(request):
+    """``wait(jobs, job_list, **options)`` on either client, as a list."""
+    if request.param == "sync":
+        return lambda jobs, job_list, **options: list(
+            make_client(jobs).wait_for_jobs(job_list, **options)
+        )
+    return wait_async
+
+
+def test_jobs_are_yielded_in_completion_order(wait):
+    jobs = FakeJobs()
+    finished = DeleteJob.from_dict(
+        {"id": "finished", "status": "failed", "createdDateTime": "2026-01-01"}
+    )
+    job_list = [jobs.add("slow", latency=0.3), jobs.add("fast"), finished]
+
+    done = wait(jobs, job_list, initial_interval=0.01)
+
+    assert [job.id for job in done] == ["finished", "fast", "slow"]
+    assert [job.status for job in done] == ["failed", "completed", "completed"]
+    assert "finished" not in jobs.poll_times
+
+
+def test_polls_back_off_up_to_max_interval(wait, clock):
+    jobs = FakeJobs(clock)
+    job_list = [jobs.add("a", polls_until_done=6), jobs.add("b", polls_until_done=2)]
+
+    done = wait(jobs, job_list, initial_interval=1, backoff=2, max_interval=4)
+
+    assert [job.id for job in done] == ["b", "a"]
+    assert [t - START for t in jobs.poll_times["a"]] == [1, 3, 7, 11, 15, 19]
+    assert [t - START for t in jobs.poll_times["b"]] == [1, 3]
+
+
+def test_import_jobs_are_polled_as_import_jobs(wait, clock):
+    jobs = FakeJobs(clock)
+    jobs.add("import-1")
+    job = ImportJob.from_dict(
+        {
+            "id": "import-1",
+            "status": "running",
+            "inputBlobUri": "in",
+            "outputBlobUri": "out",
+            "createdDateTime": "2026-01-01",
+        }
+    )
+
+    done = wait(jobs, [job], initial_interval=1)
+
+    assert isinstance(done[0], ImportJob) and done[0].status == "completed"
+
+
+def test_timeout_polls_once_more_at_the_deadline(wait, clock):
+    jobs = FakeJobs(clock)
+    job_list = [jobs.add("stuck", polls_until_done=None), jobs.add("quick")]
+
+    with pytest.raises(TimeoutError, match="within 10 seconds: stuck$"):
+        wait(jobs, job_list, timeout=10, initial_interval=1, max_interval=30)
+
+    assert [t - START for t in jobs.poll_times["stuck"]] == [1, 3, 7, 10]
+    assert [t - START for t in jobs.poll_times["quick"]] == [1]
+
+
+def test_job_finishing_at_the_deadline_poll_is_yielded(wait, clock):
+    jobs = FakeJobs(clock)
+    job_list = [jobs.add("late", polls_until_done=4)]
+
+    done = wait(jobs, job_list, timeout=10, initial_interval=1)
+
+    assert [job.id for job in done] == ["late"]
+    assert [t - START for t in jobs.poll_times["late"]] == [1, 3, 7, 10]
+
+
+def test_close_cancels_queued_polls():
+    jobs = FakeJobs()
+    job_list = [jobs.add("fast"), jobs.add("slow", latency=0.3), jobs.add("queued")]
+    waiter = make_client(jobs).wait_for_jobs(
+        job_list, initial_interval=0.01, max_workers=1
+    )
+
+    assert next(waiter).id == "fast"
+    waiter.close()
+
+    # The running poll cannot be interrupted, but the queued one never starts
+    assert len(jobs.poll_times["slow"]) == 1
+    assert jobs.poll_times["queued"] == []
+
+
+def test_aclose_cancels_polls_in_flight():
+    jobs = FakeJobs()
+    job_list = [jobs.add("fast"), jobs.add("blocked", latency=float("inf"))]
+
+    async def scenario():
+        client = AsyncKonnektrGraphClient(
+            ENDPOINT, FakeAsyncCredential(), transport=FakeAsyncTransport(jobs)
+        )
+        waiter = client.wait_for_jobs(job_list, initial_interval=0.01)
+        first = await waiter.__anext__()
+        await asyncio.wait_for(waiter.aclose(), 1)
+        return first
+
+    assert asyncio.run(scenario()).id == "fast"
+    assert jobs.cancelled == ["blocked"]